@@ -32,11 +32,131 @@ class Settings(BaseSettings):
         description="Request timeout in seconds"
     )
     
+    # Retry Configuration
+    retry_max_attempts: int = Field(
+        default=3,
+        description="Total attempts per request including the first one (1 disables retries)"
+    )
+    retry_backoff_factor: float = Field(
+        default=0.5,
+        description="Base retry delay in seconds, doubled on every retry"
+    )
+    retry_max_backoff: float = Field(
+        default=30.0,
+        description="Maximum delay between retries in seconds"
+    )
+    retry_budget_ratio: float = Field(
+        default=0.2,
+        description="Retries allowed per request across the client (retry budget)"
+    )
+    
+    json_backend: str = Field(
+        default="json",
+        description="JSON decoder for response bodies (json, orjson)"
+    )
+    
+    # Connection Pool Configuration
+    pool_connections: int = Field(
+        default=10,
+        description="Number of per-host connection pools to cache"
+    )
+    pool_maxsize: int = Field(
+        default=10,
+        description="Maximum number of connections kept per host pool"
+    )
+    pool_block: bool = Field(
+        default=False,
+        description="Block when the pool is exhausted instead of opening extra connections"
+    )
+    keep_alive: bool = Field(
+        default=True,
+        description="Reuse connections between requests (HTTP keep-alive)"
+    )
+    thread_safe: bool = Field(
+        default=False,
+        description="Give every thread its own session over the shared connection pool"
+    )
+    
+    # Response schema validation
+    validation_mode: str = Field(
+        default="full",
+        description="Response validation mode (full, sampled, first-n, async)"
+    )
+    validation_sample_rate: int = Field(
+        default=10,
+        description="Validate 1 in N responses in sampled mode"
+    )
+    validation_max_items: int = Field(
+        default=20,
+        description="Array items validated per response in first-n mode"
+    )
+    validation_fail_fast: bool = Field(
+        default=False,
+        description="Stop validating a body at its first schema violation and report only that one"
+    )
+    
+    # Request body validation
+    request_validation: bool = Field(
+        default=False,
+        description="Validate JSON request bodies against the Swagger spec before sending"
+    )
+    request_validation_sample_rate: int = Field(
+        default=1,
+        description="Validate 1 in N request bodies (1 validates every body)"
+    )
+    
+    # Test fixtures
+    fixture_pool_size: int = Field(
+        default=10,
+        description="Maximum entities of each type bulk-created at session start for created_* fixtures"
+    )
+    
+    cleanup_background: bool = Field(
+        default=True,
+        description="Delete test entities on a background pool while tests run (else at session end)"
+    )
+    
+    data_seed: Optional[int] = Field(
+        default=None,
+        description="Seed for model factories and ID allocation (random per run if unset)"
+    )
+    
+    factory_validation: bool = Field(
+        default=False,
+        description="Run full pydantic validation on factory-built models (debugging)"
+    )
+    
+    # Metrics
+    latency_metrics: bool = Field(
+        default=True,
+        description="Record per-operation latency histograms (dumped to reports/latency.json)"
+    )
+    
+    # Record/replay transport
+    cassette_mode: str = Field(
+        default="off",
+        description="Cassette transport mode (off, record, replay, record-missing)"
+    )
+    cassette_path: str = Field(
+        default="cassettes/petstore.jsonl",
+        description="JSONL cassette file, relative to the project root unless absolute"
+    )
+    
     # Logging Configuration
     log_level: str = Field(
         default="DEBUG",
         description="Logging level"
     )
+    log_async: bool = Field(
+        default=True,
+        description="Format and write logs on a background thread via QueueHandler"
+    )
+    
+    # Local stand-in server
+    local_server: bool = Field(
+        default=False,
+        description="Start the in-process Petstore server and test against it"
+    )
     
     # Environment name
     env_name: str = Field(
@@ -61,7 +181,7 @@ def get_settings(env_name: str = "dev") -> Settings:
     Get cached settings instance for the specified environment.
     
     Args:
-        env_name: Environment name (dev, staging, prod)
+        env_name: Environment name (dev, staging, prod, local)
         
     Returns:
         Settings instance with loaded configuration
@@ -1,10 +1,12 @@
 """Petstore API testing framework."""
-from .api_client import APIClient
-from .http import BaseHTTPClient, HTTPMethods
+from .api_client import APIClient, AsyncAPIClient
+from .http import AsyncBaseHTTPClient, BaseHTTPClient, HTTPMethods
 from .schema_validator import SwaggerSchemaValidator, get_schema_validator
 
 __all__ = [
     "APIClient",
+    "AsyncAPIClient",
+    "AsyncBaseHTTPClient",
     "BaseHTTPClient",
     "HTTPMethods",
     "SwaggerSchemaValidator",
@@ -1,7 +1,7 @@
 """Petstore API client that aggregates all service endpoints."""
 from requests import Response
 
-from src.http import BaseHTTPClient
+from src.http import AsyncBaseHTTPClient, BaseHTTPClient
 
 
 class APIClient(BaseHTTPClient):
@@ -132,3 +132,33 @@ class APIClient(BaseHTTPClient):
     def logout_user(self) -> Response:
         """Logout user."""
         return self.user.logout()
+
+
+class AsyncAPIClient(AsyncBaseHTTPClient):
+    """
+    Asyncio Petstore API client with the same services as APIClient.
+    
+    Service methods delegate to the async transport, so every call
+    returns an awaitable.
+    
+    Usage:
+        async with AsyncAPIClient() as api:
+            response = await api.pet.get_by_id(123)
+            responses = await asyncio.gather(
+                *(api.pet.create(pet) for pet in pets)
+            )
+    """
+    
+    def __init__(self, **kwargs):
+        """Initialize async API client with all services."""
+        super().__init__(**kwargs)
+        
+        # Import here to avoid circular imports
+        from src.services.pet_service import PetService
+        from src.services.store_service import StoreService
+        from src.services.user_service import UserService
+        
+        # Initialize services
+        self.pet = PetService(self)
+        self.store = StoreService(self)
+        self.user = UserService(self)
@@ -0,0 +1,216 @@
+"""Deferred, batched deletion of entities created by tests."""
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+from requests import Response
+
+if TYPE_CHECKING:
+    from src.api_client import APIClient
+
+
+logger = logging.getLogger(__name__)
+
+
+class CleanupManager:
+    """
+    Deletes registered entities off the test's critical path.
+    
+    In background mode deletes start as soon as an entity is scheduled and
+    run on a small thread pool while the next tests execute; otherwise they
+    are queued and run in parallel by drain() at session end. Failed
+    deletes are retried with exponential backoff; entities that still exist
+    afterwards are reported as leaked.
+    
+    Deletes run on worker threads while tests keep using the client, so
+    for_client() switches the client to per-thread sessions.
+    
+    Usage:
+        cleanup = CleanupManager.for_client(api)
+        cleanup.schedule("pet", pet_id)
+        report = cleanup.drain()
+    """
+    
+    def __init__(
+        self,
+        deleters: dict[str, Callable[[Any], Response]],
+        background: bool = True,
+        max_workers: int = 4,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5
+    ):
+        """
+        Initialize the cleanup manager.
+        
+        Args:
+            deleters: Entity kind -> function deleting one entity by key
+            background: Start deletes immediately instead of at drain()
+            max_workers: Concurrent deletes
+            max_attempts: Attempts per entity before it is reported as leaked
+            backoff_factor: Base delay between attempts in seconds, doubled each time
+        """
+        self.deleters = deleters
+        self.background = background
+        self.max_workers = max_workers
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_factor = backoff_factor
+        
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: dict[Future, tuple[str, Any]] = {}
+        self._pending: list[tuple[str, Any]] = []
+        self._scheduled = 0
+        self._stats = {"deleted": 0, "already_deleted": 0}
+        self._leaked: list[dict] = []
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def for_client(cls, api: "APIClient", **kwargs) -> "CleanupManager":
+        """Create a manager deleting pets, orders and users through an APIClient."""
+        # requests.Session is not thread-safe; deletes must not share the test thread's session
+        api.enable_thread_safety()
+        return cls(
+            {"pet": api.pet.delete, "order": api.store.delete_order, "user": api.user.delete},
+            **kwargs
+        )
+    
+    def _submit(self, kind: str, key: Any) -> None:
+        """Start a delete on the thread pool (caller holds the lock)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="cleanup")
+        self._futures[self._executor.submit(self._delete, kind, key)] = (kind, key)
+    
+    def schedule(self, kind: str, key: Any) -> None:
+        """
+        Register an entity for deletion.
+        
+        Args:
+            kind: Entity kind (a key of deleters, e.g. "pet")
+            key: Entity ID or username; None is ignored
+        """
+        if key is None:
+            return
+        if kind not in self.deleters:
+            raise ValueError(f"No deleter registered for {kind!r}")
+        
+        with self._lock:
+            self._scheduled += 1
+            if self.background:
+                self._submit(kind, key)
+            else:
+                self._pending.append((kind, key))
+    
+    def _delete(self, kind: str, key: Any) -> None:
+        """Delete one entity with retries and record the outcome."""
+        reason = ""
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                response = self.deleters[kind](key)
+            except Exception as e:
+                reason = f"{type(e).__name__}: {e}"
+            else:
+                if response.status_code == 404:
+                    self._count("already_deleted")
+                    return
+                if 200 <= response.status_code < 300:
+                    self._count("deleted")
+                    return
+                reason = f"status {response.status_code}"
+            
+            if attempt < self.max_attempts:
+                time.sleep(self.backoff_factor * (2 ** (attempt - 1)))
+        
+        logger.warning(f"Could not delete {kind} {key} after {self.max_attempts} attempts: {reason}")
+        with self._lock:
+            self._leaked.append({"kind": kind, "key": key, "reason": reason})
+    
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+    
+    def drain(self, timeout: Optional[float] = None) -> dict:
+        """
+        Run all queued deletes and wait for outstanding ones.
+        
+        Args:
+            timeout: Maximum seconds to wait; deletes not started by then are
+                cancelled and count as leaked, deletes in flight are finished
+                
+        Returns:
+            Report from report()
+        """
+        with self._lock:
+            for kind, key in self._pending:
+                self._submit(kind, key)
+            self._pending.clear()
+            futures, self._futures = self._futures, {}
+            executor, self._executor = self._executor, None
+        
+        not_done: set[Future] = set()
+        if futures:
+            _, not_done = wait(futures, timeout=timeout)
+        if executor is not None:
+            # Queued deletes are cancelled; the few in flight finish before the
+            # client is closed (each is bounded by the request timeout)
+            executor.shutdown(wait=True, cancel_futures=True)
+        
+        cancelled = [futures[f] for f in not_done if f.cancelled()]
+        if cancelled:
+            logger.warning(f"Cancelled {len(cancelled)} deletes still queued after {timeout}s")
+            with self._lock:
+                self._leaked.extend(
+                    {"kind": kind, "key": key, "reason": f"not deleted within {timeout}s"}
+                    for kind, key in cancelled
+                )
+        
+        return self.report()
+    
+    def report(self) -> dict:
+        """
+        Get cleanup outcome counters and the leaked entities.
+        
+        Returns:
+            Dictionary with scheduled, deleted, already_deleted and leaked
+        """
+        with self._lock:
+            return {
+                "scheduled": self._scheduled,
+                **self._stats,
+                "leaked": list(self._leaked),
+            }
+
+
+class CleanupScope:
+    """
+    Collects entities created during one test and hands them to the
+    CleanupManager when the test finishes, so nothing is deleted while
+    the test may still use it.
+    """
+    
+    def __init__(self, manager: CleanupManager):
+        self._manager = manager
+        self._entities: list[tuple[str, Any]] = []
+    
+    def add(self, kind: str, key: Any) -> None:
+        """Register an entity for deletion after the test."""
+        if key is not None:
+            self._entities.append((kind, key))
+    
+    def pet(self, pet_id: Optional[int]) -> None:
+        """Register a pet for deletion after the test."""
+        self.add("pet", pet_id)
+    
+    def order(self, order_id: Optional[int]) -> None:
+        """Register an order for deletion after the test."""
+        self.add("order", order_id)
+    
+    def user(self, username: Optional[str]) -> None:
+        """Register a user for deletion after the test."""
+        self.add("user", username)
+    
+    def flush(self) -> None:
+        """Schedule all registered entities with the manager."""
+        for kind, key in self._entities:
+            self._manager.schedule(kind, key)
+        self._entities.clear()
@@ -0,0 +1,200 @@
+"""Pools of pre-created API entities for test fixtures."""
+import logging
+import threading
+from collections import deque
+from itertools import cycle
+from typing import Any, Callable, Optional
+
+from src.cleanup import CleanupManager
+from src.services import BatchResult
+
+
+logger = logging.getLogger(__name__)
+
+
+class EntityPool:
+    """
+    Entities bulk-created up front and handed out to tests.
+    
+    Provisioning creates all entities concurrently through a service batch
+    method, so a session pays one round of parallel requests instead of a
+    create/delete pair per test. Tests either lease an entity exclusively
+    (it may be modified or deleted and is never handed out again) or share
+    one of a few read-only entities. Everything that was created is
+    bulk-deleted by teardown(), or handed to a CleanupManager.
+    
+    Usage:
+        pool = EntityPool(
+            "pet", lambda: Pet.create().to_payload(),
+            create_many=api.pet.create_many, delete_many=api.pet.delete_many,
+            key="id", size=20
+        )
+        pool.provision()
+        pet = pool.lease()
+        pool.teardown()
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[], dict],
+        create_many: Callable[[list[dict]], list[BatchResult]],
+        delete_many: Callable[[list[Any]], list[BatchResult]],
+        key: str,
+        size: int = 10,
+        shared: int = 1,
+        use_response_body: bool = True,
+        max_workers: Optional[int] = None,
+        cleanup: Optional[CleanupManager] = None
+    ):
+        """
+        Initialize the pool (no requests are made until provision()).
+        
+        Args:
+            name: Entity name used in log messages
+            factory: Returns a new entity payload
+            create_many: Service batch create method
+            delete_many: Service batch delete method taking keys
+            key: Payload field identifying the entity (e.g. "id", "username")
+            size: Number of entities to provision for leasing
+            shared: Number of extra read-only entities shared by all tests
+            use_response_body: Take the entity from the create response
+                (False for endpoints that do not echo it, e.g. /user)
+            max_workers: Concurrency of bulk create/delete
+            cleanup: Manager that deletes the entities in the background
+                (its deleter for `name` is used instead of delete_many)
+        """
+        self.name = name
+        self.factory = factory
+        self.create_many = create_many
+        self.delete_many = delete_many
+        self.key = key
+        self.size = size
+        self.shared_size = shared
+        self.use_response_body = use_response_body
+        self.max_workers = max_workers
+        self.cleanup = cleanup
+        
+        self._available: deque[dict] = deque()
+        self._shared: list[dict] = []
+        self._shared_cycle = None
+        self._created_keys: set[Any] = set()
+        self._lock = threading.Lock()
+    
+    def _new_payloads(self, count: int) -> list[dict]:
+        """Generate payloads with keys not used by this pool yet."""
+        payloads: dict[Any, dict] = {}
+        # The factory may repeat keys (e.g. order IDs 1-10); give up after a few rounds
+        for _ in range(count * 5):
+            if len(payloads) == count:
+                break
+            payload = self.factory()
+            if payload[self.key] not in payloads and payload[self.key] not in self._created_keys:
+                payloads[payload[self.key]] = payload
+        return list(payloads.values())
+    
+    def _create(self, count: int) -> list[dict]:
+        """Bulk-create entities and return the ones that succeeded."""
+        payloads = self._new_payloads(count)
+        if not payloads:
+            return []
+        
+        results = self.create_many(payloads, max_workers=self.max_workers)
+        
+        created = []
+        for result in results:
+            if not result.ok:
+                reason = result.error or f"status {result.response.status_code}"
+                logger.warning(f"Could not provision {self.name} {result.item[self.key]}: {reason}")
+                continue
+            created.append(result.response.json() if self.use_response_body else result.item)
+        
+        with self._lock:
+            self._created_keys.update(entity[self.key] for entity in created)
+        return created
+    
+    def provision(self) -> int:
+        """
+        Create the shared and leasable entities concurrently.
+        
+        Returns:
+            Number of entities created
+        """
+        created = self._create(self.size + self.shared_size)
+        
+        with self._lock:
+            self._shared = created[:self.shared_size]
+            self._shared_cycle = cycle(self._shared) if self._shared else None
+            self._available.extend(created[self.shared_size:])
+        
+        logger.info(f"Provisioned {len(created)} {self.name} entities")
+        return len(created)
+    
+    def lease(self) -> dict:
+        """
+        Take an entity for exclusive use by one test.
+        
+        Falls back to creating one when the pool is exhausted.
+        
+        Returns:
+            Copy of the entity data
+            
+        Raises:
+            RuntimeError: If no entity could be created
+        """
+        with self._lock:
+            entity = self._available.popleft() if self._available else None
+        
+        if entity is None:
+            created = self._create(1)
+            if not created:
+                raise RuntimeError(f"Could not create a {self.name} for the test")
+            entity = created[0]
+        
+        return dict(entity)
+    
+    def shared(self) -> dict:
+        """
+        Get a read-only entity shared by many tests (round-robin).
+        
+        Returns:
+            Copy of the entity data (changes are not written back)
+        """
+        with self._lock:
+            if self._shared_cycle is not None:
+                return dict(next(self._shared_cycle))
+        
+        entity = self.lease()
+        with self._lock:
+            self._shared.append(entity)
+            self._shared_cycle = cycle(self._shared)
+        return dict(entity)
+    
+    def teardown(self) -> list[BatchResult]:
+        """
+        Bulk-delete every entity created by the pool, concurrently.
+        
+        With a CleanupManager the deletes are only scheduled.
+        
+        Returns:
+            BatchResult per entity (already deleted entities report 404);
+            empty when deletion was handed to the CleanupManager
+        """
+        with self._lock:
+            keys = sorted(self._created_keys)
+            self._created_keys.clear()
+            self._available.clear()
+            self._shared, self._shared_cycle = [], None
+        
+        if not keys:
+            return []
+        
+        if self.cleanup is not None:
+            for key in keys:
+                self.cleanup.schedule(self.name, key)
+            return []
+        
+        results = self.delete_many(keys, max_workers=self.max_workers)
+        deleted = sum(result.ok for result in results)
+        logger.info(f"Deleted {deleted}/{len(keys)} pooled {self.name} entities")
+        return results
@@ -1,9 +1,35 @@
 """HTTP client module."""
+from .async_client import AsyncBaseHTTPClient
+from .cassette import Cassette, CassetteAdapter, CassetteMiss
 from .client import BaseHTTPClient
 from .methods import HTTPMethods
+from .metrics import LatencyHistogram, LatencyMetrics, get_latency_metrics
+from .request_validation import RequestBodyValidator, RequestValidationError
+from .response_validation import ResponseValidator, ValidationReport, get_validation_report
+from .response import AsyncJSONResponse, JSONResponse, set_json_backend
+from .retry import RetryBudget, RetryPolicy
+from .streaming import iter_json_array
 
 __all__ = [
+    "AsyncBaseHTTPClient",
     "BaseHTTPClient",
+    "Cassette",
+    "CassetteAdapter",
+    "CassetteMiss",
     "HTTPMethods",
+    "RequestBodyValidator",
+    "RequestValidationError",
+    "ResponseValidator",
+    "ValidationReport",
+    "get_validation_report",
+    "LatencyHistogram",
+    "LatencyMetrics",
+    "get_latency_metrics",
+    "JSONResponse",
+    "AsyncJSONResponse",
+    "set_json_backend",
+    "iter_json_array",
+    "RetryBudget",
+    "RetryPolicy",
 ]
 
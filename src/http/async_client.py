@@ -0,0 +1,268 @@
+"""Asyncio HTTP client with connection pooling and schema validation."""
+import logging
+import time
+from typing import Optional
+from pathlib import Path
+
+import httpx
+
+from config.settings import get_current_settings
+from src.schema_validator import get_schema_validator, SwaggerSchemaValidator
+from .methods import log_request, log_response
+from .metrics import LatencyMetrics, get_latency_metrics
+from .request_validation import RequestBodyValidator
+from .response_validation import ResponseValidator
+from .response import AsyncJSONResponse, set_json_backend
+
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBaseHTTPClient:
+    """
+    Asyncio counterpart of BaseHTTPClient.
+    
+    Exposes the same request/get/post/put/delete/patch surface and
+    path_template schema validation, but every call is a coroutine running
+    over a pooled httpx.AsyncClient transport.
+    
+    Usage:
+        async with AsyncBaseHTTPClient() as client:
+            response = await client.get("/pet/1", path_template="/pet/{petId}")
+            responses = await asyncio.gather(*(client.get(f"/pet/{i}") for i in ids))
+    """
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        timeout: Optional[int] = None,
+        validate_schemas: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        latency_metrics: Optional[LatencyMetrics] = None,
+        validate_requests: Optional[bool] = None,
+        request_sample_rate: Optional[int] = None,
+        validation_mode: Optional[str] = None
+    ):
+        """
+        Initialize the async HTTP client.
+        
+        Args:
+            base_url: API base URL (uses settings if not provided)
+            api_key: API key for authentication (uses settings if not provided)
+            timeout: Request timeout in seconds (uses settings if not provided)
+            validate_schemas: Whether to validate responses against Swagger schemas
+            max_connections: Maximum number of concurrent connections in the pool
+            max_keepalive_connections: Maximum number of idle keep-alive connections
+            latency_metrics: Histogram store (the process-wide one if not provided;
+                disabled when settings.latency_metrics is off)
+            validate_requests: Validate JSON bodies before sending (uses settings if not provided)
+            request_sample_rate: Validate 1 in N bodies (uses settings if not provided)
+            validation_mode: Response validation mode: full, sampled, first-n or async
+                (uses settings if not provided)
+        """
+        settings = get_current_settings()
+        
+        self.base_url = base_url or settings.base_url
+        self.api_key = api_key or settings.api_key
+        self.timeout = timeout or settings.timeout
+        self.validate_schemas = validate_schemas
+        self.validate_requests = (
+            validate_requests if validate_requests is not None else settings.request_validation
+        )
+        
+        set_json_backend(settings.json_backend)
+        
+        # LatencyMetrics defines __len__, so a fresh (empty) instance is falsy
+        if latency_metrics is not None:
+            self.latency_metrics = latency_metrics
+        else:
+            self.latency_metrics = get_latency_metrics() if settings.latency_metrics else None
+        
+        self._session = httpx.AsyncClient(
+            headers={
+                "Content-Type": "application/json",
+                "Accept": "application/json",
+                "api_key": self.api_key
+            },
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            )
+        )
+        
+        # Initialize schema validator (shared by response and request body validation)
+        self._schema_validator: Optional[SwaggerSchemaValidator] = None
+        if validate_schemas or self.validate_requests:
+            try:
+                swagger_path = Path(__file__).parent.parent.parent / "schemas" / "swagger.json"
+                self._schema_validator = get_schema_validator(swagger_path)
+            except Exception as e:
+                logger.warning(f"Could not initialize schema validator: {e}")
+        
+        self._request_validator: Optional[RequestBodyValidator] = None
+        if self.validate_requests and self._schema_validator:
+            self._request_validator = RequestBodyValidator(
+                self._schema_validator,
+                sample_rate=request_sample_rate or settings.request_validation_sample_rate,
+                fail_fast=settings.validation_fail_fast
+            )
+        
+        self._response_validator: Optional[ResponseValidator] = None
+        if validate_schemas and self._schema_validator:
+            self._response_validator = ResponseValidator(
+                self._schema_validator,
+                mode=validation_mode or settings.validation_mode,
+                sample_rate=settings.validation_sample_rate,
+                max_items=settings.validation_max_items,
+                fail_fast=settings.validation_fail_fast
+            )
+        
+        logger.info(f"Async HTTP Client initialized with base URL: {self.base_url}")
+    
+    def _log_request(self, method: str, url: str, **kwargs) -> None:
+        """Log outgoing request details."""
+        log_request(method, url, **kwargs)
+    
+    def _log_response(self, response: httpx.Response) -> None:
+        """Log incoming response details."""
+        log_response(response, response.reason_phrase)
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Make an HTTP request (internal method without validation).
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, PATCH)
+            endpoint: API endpoint (e.g., "/pet/1")
+            **kwargs: Additional arguments passed to httpx
+            
+        Returns:
+            Response object
+        """
+        path_template = kwargs.pop("path_template", None)
+        
+        url = f"{self.base_url}{endpoint}"
+        kwargs.setdefault("timeout", self.timeout)
+        
+        self._log_request(method, url, **kwargs)
+        
+        if self.latency_metrics is None:
+            response = await self._session.request(method, url, **kwargs)
+        else:
+            response = await self._timed_request(method, url, path_template or endpoint, **kwargs)
+        # Memoize json() so the body is decoded once per request
+        response.__class__ = AsyncJSONResponse
+        
+        self._log_response(response)
+        
+        return response
+    
+    async def _timed_request(self, method: str, url: str, path_template: str, **kwargs) -> httpx.Response:
+        """
+        Send a request and record its phase timings.
+        
+        httpcore trace events provide "connect" (DNS + TCP) and "tls" when a
+        new connection is opened, plus "ttfb" (until response headers).
+        """
+        start = time.perf_counter()
+        marks: dict[str, float] = {}
+        
+        async def trace(event_name: str, info: dict) -> None:
+            # e.g. "connection.connect_tcp.started" -> "connect_tcp.started"
+            marks[event_name.split(".", 1)[1]] = time.perf_counter()
+        
+        extensions = dict(kwargs.pop("extensions", None) or {})
+        extensions["trace"] = trace
+        
+        try:
+            response = await self._session.request(method, url, extensions=extensions, **kwargs)
+        except httpx.HTTPError:
+            self.latency_metrics.record(method, path_template, "error", {"total": time.perf_counter() - start})
+            raise
+        
+        phases = {"total": time.perf_counter() - start}
+        for phase, event in (("connect", "connect_tcp"), ("tls", "start_tls")):
+            if f"{event}.started" in marks and f"{event}.complete" in marks:
+                phases[phase] = marks[f"{event}.complete"] - marks[f"{event}.started"]
+        if "receive_response_headers.complete" in marks:
+            phases["ttfb"] = marks["receive_response_headers.complete"] - start
+        
+        self.latency_metrics.record(method, path_template, response.status_code, phases)
+        return response
+    
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        path_template: Optional[str] = None,
+        validate_schema: bool = True,
+        validate_request: bool = True,
+        **kwargs
+    ) -> httpx.Response:
+        """
+        Make an HTTP request with optional schema validation.
+        
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint (e.g., "/pet/1")
+            path_template: Swagger path template for schema validation
+            validate_schema: Whether to validate response schema
+            validate_request: Whether to validate the json= body before sending
+                (only when request validation is enabled on the client)
+            **kwargs: Additional arguments passed to httpx
+            
+        Returns:
+            Response object
+            
+        Raises:
+            RequestValidationError: If the json= body violates the request schema
+        """
+        if validate_request and self._request_validator and path_template and "json" in kwargs:
+            self._request_validator.check(kwargs["json"], path_template, method)
+        
+        response = await self._make_request(method, endpoint, path_template=path_template, **kwargs)
+        
+        # Validate response schema if enabled (according to the validation mode)
+        if validate_schema and path_template and self.validate_schemas and self._response_validator:
+            self._response_validator.validate(response, path_template, method)
+        
+        return response
+    
+    async def get(self, endpoint: str, path_template: Optional[str] = None, **kwargs) -> httpx.Response:
+        """Make a GET request with schema validation."""
+        return await self.request("GET", endpoint, path_template, **kwargs)
+    
+    async def post(self, endpoint: str, path_template: Optional[str] = None, **kwargs) -> httpx.Response:
+        """Make a POST request with schema validation."""
+        return await self.request("POST", endpoint, path_template, **kwargs)
+    
+    async def put(self, endpoint: str, path_template: Optional[str] = None, **kwargs) -> httpx.Response:
+        """Make a PUT request with schema validation."""
+        return await self.request("PUT", endpoint, path_template, **kwargs)
+    
+    async def delete(self, endpoint: str, path_template: Optional[str] = None, **kwargs) -> httpx.Response:
+        """Make a DELETE request with schema validation."""
+        return await self.request("DELETE", endpoint, path_template, **kwargs)
+    
+    async def patch(self, endpoint: str, path_template: Optional[str] = None, **kwargs) -> httpx.Response:
+        """Make a PATCH request with schema validation."""
+        return await self.request("PATCH", endpoint, path_template, **kwargs)
+    
+    async def close(self) -> None:
+        """Close the connection pool."""
+        await self._session.aclose()
+        logger.info("Async HTTP Client session closed")
+    
+    async def __aenter__(self) -> "AsyncBaseHTTPClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
@@ -0,0 +1,333 @@
+"""Record-and-replay transport storing HTTP exchanges in a JSONL cassette."""
+import base64
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import threading
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Optional, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("off", "record", "replay", "record-missing")
+
+# Every cassette line starts with this prefix followed by a 64-char hex key,
+# so the index can be built without decoding the JSON payloads
+_KEY_PREFIX = b'{"key": "'
+_KEY_LENGTH = 64
+
+# Headers describing the wire encoding no longer apply to the stored body
+_DROPPED_HEADERS = {"content-encoding", "transfer-encoding", "content-length"}
+
+# Files already started fresh by a record-mode client in this process;
+# clients created later append instead of wiping earlier recordings
+_truncated_paths: set[Path] = set()
+_truncated_lock = threading.Lock()
+
+
+class CassetteMiss(requests.exceptions.RequestException):
+    """Raised in replay mode when a request has no recorded response."""
+
+
+def worker_cassette_path(path: Union[str, Path], worker_id: str) -> Path:
+    """
+    Get the file an xdist worker records to (e.g. petstore.gw0.jsonl).
+    
+    Workers never write the shared cassette; the controller merges their
+    recordings with merge_worker_cassettes() at session end.
+    """
+    path = Path(path)
+    return path.with_name(f"{path.stem}.{worker_id}{path.suffix}")
+
+
+def _worker_cassettes(path: Path) -> list[Path]:
+    """Worker recordings of a cassette, ordered by worker index."""
+    pattern = re.compile(rf"{re.escape(path.stem)}\.gw(\d+){re.escape(path.suffix)}$")
+    parts = [(int(m.group(1)), p) for p in path.parent.glob(f"{path.stem}.gw*{path.suffix}")
+             if (m := pattern.match(p.name))]
+    return [p for _, p in sorted(parts)]
+
+
+def merge_worker_cassettes(path: Union[str, Path], mode: str) -> int:
+    """
+    Merge per-worker recordings into the shared cassette and remove them.
+    
+    Args:
+        path: Shared cassette file
+        mode: "record" replaces the cassette, "record-missing" appends to it
+        
+    Returns:
+        Number of worker recordings merged
+    """
+    path = Path(path)
+    parts = _worker_cassettes(path)
+    if not parts:
+        return 0
+    
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as out:
+        if mode == "record-missing" and path.exists():
+            out.write(path.read_bytes())
+        for part in parts:
+            out.write(part.read_bytes())
+    os.replace(tmp_path, path)
+    
+    for part in parts:
+        part.unlink()
+    logger.info(f"Merged {len(parts)} worker cassettes into {path}")
+    return len(parts)
+
+
+def remove_worker_cassettes(path: Union[str, Path]) -> None:
+    """Delete worker recordings left over from an interrupted run."""
+    for part in _worker_cassettes(Path(path)):
+        part.unlink()
+
+
+class Cassette:
+    """
+    JSONL file of recorded request/response pairs with an O(1) lookup index.
+    
+    The file is memory-mapped and indexed on first use; only the lines that
+    are actually replayed get decoded. Identical requests recorded several
+    times are replayed in order, repeating the last one.
+    
+    New exchanges go to record_path when given (one file per xdist worker,
+    so concurrent workers never truncate or interleave each other's
+    recordings); lookups still read the shared cassette.
+    """
+    
+    def __init__(self, path: Union[str, Path], record_path: Optional[Union[str, Path]] = None):
+        """
+        Initialize the cassette (nothing is read until the first lookup).
+        
+        Args:
+            path: Path to the JSONL cassette file
+            record_path: File new exchanges are written to (path if not provided)
+        """
+        self.path = Path(path)
+        self.record_path = Path(record_path) if record_path else self.path
+        self._index: Optional[dict[str, list[Any]]] = None
+        self._cursors: dict[str, int] = {}
+        self._mmap: Optional[mmap.mmap] = None
+        self._truncated = False
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(method: str, url: str, body: Optional[Union[str, bytes]]) -> str:
+        """
+        Build the lookup key for a request.
+        
+        Scheme, host and port are left out, so a recording made against one
+        server (e.g. the local server on a random port) replays against any.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL including the query string
+            body: Request body
+            
+        Returns:
+            Hex SHA-256 of method, path, query and body hash
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        body_hash = hashlib.sha256(body or b"").hexdigest()
+        parts = urlsplit(url)
+        target = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        return hashlib.sha256(f"{method.upper()} {target} {body_hash}".encode("utf-8")).hexdigest()
+    
+    def _load_index(self) -> dict[str, list[Any]]:
+        """Memory-map the cassette and index line offsets by key."""
+        index: dict[str, list[Any]] = {}
+        
+        if self.path.exists() and self.path.stat().st_size > 0:
+            with open(self.path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            
+            offset = 0
+            size = len(self._mmap)
+            key_start = len(_KEY_PREFIX)
+            while offset < size:
+                end = self._mmap.find(b"\n", offset)
+                end = size if end == -1 else end
+                if self._mmap[offset:offset + key_start] == _KEY_PREFIX:
+                    key = self._mmap[offset + key_start:offset + key_start + _KEY_LENGTH].decode("ascii")
+                    index.setdefault(key, []).append(offset)
+                offset = end + 1
+        
+        logger.debug(f"Indexed cassette {self.path}: {len(index)} distinct requests")
+        return index
+    
+    def _decode(self, entry: Any) -> dict:
+        """Decode an index entry (mmap offset or in-memory dict)."""
+        if isinstance(entry, dict):
+            return entry
+        end = self._mmap.find(b"\n", entry)
+        line = self._mmap[entry:end if end != -1 else len(self._mmap)]
+        return json.loads(line)["entry"]
+    
+    def lookup(self, key: str) -> Optional[dict]:
+        """
+        Get the next recorded exchange for a key.
+        
+        Args:
+            key: Request key from make_key()
+            
+        Returns:
+            Recorded exchange or None if the request was never recorded
+        """
+        with self._lock:
+            if self._index is None:
+                self._index = self._load_index()
+            
+            entries = self._index.get(key)
+            if not entries:
+                return None
+            
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = min(cursor + 1, len(entries) - 1)
+            entry = entries[cursor]
+        
+        return self._decode(entry)
+    
+    def record(self, key: str, exchange: dict, truncate: bool = False) -> None:
+        """
+        Append an exchange to the cassette.
+        
+        Args:
+            key: Request key from make_key()
+            exchange: Serialized request/response pair
+            truncate: Start a fresh cassette on the first write in this process
+        """
+        line = '{"key": "%s", "entry": %s}\n' % (key, json.dumps(exchange))
+        
+        with self._lock:
+            mode = "a"
+            if truncate and not self._truncated:
+                self._truncated = True
+                with _truncated_lock:
+                    if self.record_path.resolve() not in _truncated_paths:
+                        _truncated_paths.add(self.record_path.resolve())
+                        mode = "w"
+                self._index, self._cursors = {}, {}
+                if self._mmap is not None:
+                    self._mmap.close()
+                    self._mmap = None
+            elif self._index is None:
+                self._index = self._load_index()
+            
+            self.record_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.record_path, mode, encoding="utf-8") as f:
+                f.write(line)
+            
+            self._index.setdefault(key, []).append(exchange)
+    
+    def close(self) -> None:
+        """Release the memory map."""
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._index = None
+            self._cursors = {}
+
+
+class CassetteAdapter(HTTPAdapter):
+    """
+    Transport adapter that records and/or replays exchanges via a Cassette.
+    
+    Modes:
+        record: always send and record (the cassette, or the worker's
+            recording, is rewritten)
+        replay: only replay; unknown requests raise CassetteMiss
+        record-missing: replay when recorded, otherwise send and record
+    """
+    
+    def __init__(self, cassette: Cassette, mode: str = "replay", **kwargs):
+        """
+        Initialize the adapter.
+        
+        Args:
+            cassette: Cassette to read from / write to
+            mode: One of "record", "replay", "record-missing"
+            **kwargs: Connection pool arguments passed to HTTPAdapter
+        """
+        if mode not in CASSETTE_MODES or mode == "off":
+            raise ValueError(f"Invalid cassette mode: {mode}")
+        
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self.mode = mode
+    
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        key = Cassette.make_key(request.method, request.url, request.body)
+        
+        if self.mode in ("replay", "record-missing"):
+            exchange = self.cassette.lookup(key)
+            if exchange is not None:
+                return self._build_replayed_response(request, exchange)
+            if self.mode == "replay":
+                raise CassetteMiss(f"No recorded response for {request.method} {request.url}", request=request)
+        
+        response = super().send(request, **kwargs)
+        self.cassette.record(key, self._serialize(request, response), truncate=self.mode == "record")
+        return response
+    
+    @staticmethod
+    def _serialize(request: PreparedRequest, response: Response) -> dict:
+        """Convert a live exchange to a JSON-serializable dict."""
+        content = response.content
+        try:
+            body = {"text": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"base64": base64.b64encode(content).decode("ascii")}
+        
+        return {
+            "request": {"method": request.method, "url": request.url},
+            "response": {
+                "status": response.status_code,
+                "reason": response.reason,
+                "headers": {
+                    k: v for k, v in response.headers.items()
+                    if k.lower() not in _DROPPED_HEADERS
+                },
+                "body": body,
+                "elapsed": response.elapsed.total_seconds(),
+            },
+        }
+    
+    def _build_replayed_response(self, request: PreparedRequest, exchange: dict) -> Response:
+        """Create a Response from a recorded exchange."""
+        recorded = exchange["response"]
+        body = recorded["body"]
+        
+        response = Response()
+        response.status_code = recorded["status"]
+        response.reason = recorded["reason"]
+        response.headers = CaseInsensitiveDict(recorded["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        response.elapsed = timedelta(seconds=recorded.get("elapsed", 0.0))
+        response._content = (
+            body["text"].encode("utf-8") if "text" in body else base64.b64decode(body["base64"])
+        )
+        response._content_consumed = True
+        return response
+    
+    def close(self) -> None:
+        super().close()
+        self.cassette.close()
@@ -1,15 +1,23 @@
 """Base HTTP client with session management and schema validation."""
-import json
 import logging
+import threading
 from typing import Optional
 from pathlib import Path
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from config.settings import get_current_settings
 from src.schema_validator import get_schema_validator, SwaggerSchemaValidator
+from src.parallel import get_worker_id, is_xdist_worker
+from .cassette import Cassette, CassetteAdapter, worker_cassette_path
 from .methods import HTTPMethods
+from .metrics import LatencyMetrics, get_latency_metrics
+from .request_validation import RequestBodyValidator
+from .response_validation import ResponseValidator
+from .response import set_json_backend
+from .retry import RetryBudget, RetryPolicy
 
 
 logger = logging.getLogger(__name__)
@@ -22,6 +30,14 @@ class BaseHTTPClient(HTTPMethods):
     Inherits HTTP methods (GET, POST, PUT, DELETE, PATCH) from HTTPMethods.
     Adds session management and optional schema validation.
     
+    With thread_safe=True one client can be shared by many threads: every
+    thread gets its own requests.Session (headers, cookies) mounted on one
+    shared adapter, whose urllib3 pool is thread-safe. Size pool_maxsize to
+    the thread count, or set pool_block to cap connections. Retry budget,
+    stats, latency metrics and the schema validator are safe to share.
+    Batch operations switch a client to this mode before fanning out
+    (see enable_thread_safety()).
+    
     Usage:
         client = BaseHTTPClient()
         response = client.get("/endpoint")
@@ -33,7 +49,19 @@ class BaseHTTPClient(HTTPMethods):
         base_url: Optional[str] = None,
         api_key: Optional[str] = None,
         timeout: Optional[int] = None,
-        validate_schemas: bool = True
+        validate_schemas: bool = True,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        keep_alive: Optional[bool] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cassette_mode: Optional[str] = None,
+        cassette_path: Optional[str] = None,
+        latency_metrics: Optional[LatencyMetrics] = None,
+        thread_safe: Optional[bool] = None,
+        validate_requests: Optional[bool] = None,
+        request_sample_rate: Optional[int] = None,
+        validation_mode: Optional[str] = None
     ):
         """
         Initialize the HTTP client.
@@ -43,6 +71,21 @@ class BaseHTTPClient(HTTPMethods):
             api_key: API key for authentication (uses settings if not provided)
             timeout: Request timeout in seconds (uses settings if not provided)
             validate_schemas: Whether to validate responses against Swagger schemas
+            pool_connections: Number of per-host pools to cache (uses settings if not provided)
+            pool_maxsize: Maximum connections per host pool (uses settings if not provided)
+            pool_block: Block when the pool is exhausted (uses settings if not provided)
+            keep_alive: Reuse connections between requests (uses settings if not provided)
+            retry_policy: Default retry policy (built from settings if not provided)
+            cassette_mode: off, record, replay or record-missing (uses settings if not provided)
+            cassette_path: JSONL cassette file (uses settings if not provided)
+            latency_metrics: Histogram store (the process-wide one if not provided;
+                disabled when settings.latency_metrics is off)
+            thread_safe: Use a session per thread over a shared connection pool
+                (uses settings if not provided)
+            validate_requests: Validate JSON bodies before sending (uses settings if not provided)
+            request_sample_rate: Validate 1 in N bodies (uses settings if not provided)
+            validation_mode: Response validation mode: full, sampled, first-n or async
+                (uses settings if not provided)
         """
         settings = get_current_settings()
         
@@ -50,53 +93,133 @@ class BaseHTTPClient(HTTPMethods):
         self.api_key = api_key or settings.api_key
         self.timeout = timeout or settings.timeout
         self.validate_schemas = validate_schemas
+        self.validate_requests = (
+            validate_requests if validate_requests is not None else settings.request_validation
+        )
+        self.pool_connections = pool_connections or settings.pool_connections
+        self.pool_maxsize = pool_maxsize or settings.pool_maxsize
+        self.pool_block = pool_block if pool_block is not None else settings.pool_block
+        self.keep_alive = keep_alive if keep_alive is not None else settings.keep_alive
+        self.cassette_mode = cassette_mode or settings.cassette_mode
+        self.thread_safe = thread_safe if thread_safe is not None else settings.thread_safe
+        
+        set_json_backend(settings.json_backend)
         
-        self._session = requests.Session()
-        self._session.headers.update({
+        # LatencyMetrics defines __len__, so a fresh (empty) instance is falsy
+        if latency_metrics is not None:
+            self.latency_metrics = latency_metrics
+        else:
+            self.latency_metrics = get_latency_metrics() if settings.latency_metrics else None
+        
+        # Retries: default policy, per path_template overrides and a shared budget
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=settings.retry_max_attempts,
+            backoff_factor=settings.retry_backoff_factor,
+            max_backoff=settings.retry_max_backoff
+        )
+        self.retry_overrides: dict[str, RetryPolicy] = {}
+        self._retry_budget = RetryBudget(ratio=settings.retry_budget_ratio)
+        self.retry_stats = {"requests": 0, "attempts": 0, "retried_requests": 0, "budget_exhausted": 0}
+        self._retry_stats_lock = threading.Lock()
+        
+        self._headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
             "api_key": self.api_key
-        })
+        }
+        if not self.keep_alive:
+            self._headers["Connection"] = "close"
+        
+        pool_kwargs = {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "pool_block": self.pool_block,
+        }
+        self.cassette: Optional[Cassette] = None
+        if self.cassette_mode != "off":
+            path = Path(cassette_path or settings.cassette_path)
+            if not path.is_absolute():
+                path = Path(__file__).parent.parent.parent / path
+            # xdist workers record to their own file; the controller merges them
+            record_path = worker_cassette_path(path, get_worker_id()) if is_xdist_worker() else None
+            self.cassette = Cassette(path, record_path)
+            self._adapter = CassetteAdapter(self.cassette, self.cassette_mode, **pool_kwargs)
+            logger.info(f"Cassette {self.cassette_mode} mode: {path}")
+        else:
+            self._adapter = HTTPAdapter(**pool_kwargs)
         
-        # Initialize schema validator
+        # Sessions share the adapter; in thread-safe mode each thread creates its own
+        self._sessions: list[requests.Session] = []
+        self._sessions_lock = threading.Lock()
+        self._local = threading.local()
+        self._shared_session = None if self.thread_safe else self._new_session()
+        
+        # Initialize schema validator (shared by response and request body validation)
         self._schema_validator: Optional[SwaggerSchemaValidator] = None
-        if validate_schemas:
+        if validate_schemas or self.validate_requests:
             try:
                 swagger_path = Path(__file__).parent.parent.parent / "schemas" / "swagger.json"
                 self._schema_validator = get_schema_validator(swagger_path)
             except Exception as e:
                 logger.warning(f"Could not initialize schema validator: {e}")
         
+        self._request_validator: Optional[RequestBodyValidator] = None
+        if self.validate_requests and self._schema_validator:
+            self._request_validator = RequestBodyValidator(
+                self._schema_validator,
+                sample_rate=request_sample_rate or settings.request_validation_sample_rate,
+                fail_fast=settings.validation_fail_fast
+            )
+        
+        self._response_validator: Optional[ResponseValidator] = None
+        if validate_schemas and self._schema_validator:
+            self._response_validator = ResponseValidator(
+                self._schema_validator,
+                mode=validation_mode or settings.validation_mode,
+                sample_rate=settings.validation_sample_rate,
+                max_items=settings.validation_max_items,
+                fail_fast=settings.validation_fail_fast
+            )
+        
         logger.info(f"HTTP Client initialized with base URL: {self.base_url}")
     
-    def _validate_response_schema(
-        self,
-        response: Response,
-        path: str,
-        method: str
-    ) -> tuple[bool, Optional[str]]:
-        """
-        Validate response against Swagger schema.
+    def _new_session(self) -> requests.Session:
+        """Create a session with the client headers, mounted on the shared adapter."""
+        session = requests.Session()
+        session.headers.update(self._headers)
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
         
-        Args:
-            response: Response object
-            path: API path (e.g., "/pet/{petId}")
-            method: HTTP method
-            
-        Returns:
-            Tuple of (is_valid, error_message)
-        """
-        if not self._schema_validator or not self.validate_schemas:
-            return True, None
+        with self._sessions_lock:
+            self._sessions.append(session)
+        return session
+    
+    @property
+    def _session(self) -> requests.Session:
+        """Session of the calling thread (a single shared one unless thread_safe)."""
+        if self._shared_session is not None:
+            return self._shared_session
         
-        try:
-            response_data = response.json()
-        except (json.JSONDecodeError, ValueError):
-            return True, None
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+    
+    def enable_thread_safety(self) -> None:
+        """
+        Switch to a session per thread, as with thread_safe=True.
         
-        return self._schema_validator.validate_response(
-            response_data, path, method, response.status_code
-        )
+        Called before the client is shared with worker threads (batch
+        operations, background cleanup). The calling thread keeps the
+        session it has been using; other threads get their own.
+        """
+        with self._sessions_lock:
+            if self._shared_session is None:
+                return
+            self._local.session = self._shared_session
+            self.thread_safe = True
+            self._shared_session = None
+        logger.debug("HTTP Client switched to per-thread sessions")
     
     def request(
         self,
@@ -104,6 +227,7 @@ class BaseHTTPClient(HTTPMethods):
         endpoint: str,
         path_template: Optional[str] = None,
         validate_schema: bool = True,
+        validate_request: bool = True,
         **kwargs
     ) -> Response:
         """
@@ -114,20 +238,28 @@ class BaseHTTPClient(HTTPMethods):
             endpoint: API endpoint (e.g., "/pet/1")
             path_template: Swagger path template for schema validation
             validate_schema: Whether to validate response schema
+            validate_request: Whether to validate the json= body before sending
+                (only when request validation is enabled on the client)
             **kwargs: Additional arguments passed to requests
             
         Returns:
             Response object
+            
+        Raises:
+            RequestValidationError: If the json= body violates the request schema
         """
-        response = self._make_request(method, endpoint, **kwargs)
+        if validate_request and self._request_validator and path_template and "json" in kwargs:
+            self._request_validator.check(kwargs["json"], path_template, method)
         
-        # Validate response schema if enabled
-        if validate_schema and path_template:
-            is_valid, error = self._validate_response_schema(
-                response, path_template, method
-            )
-            if not is_valid:
-                logger.warning(f"Schema validation failed: {error}")
+        response = self._make_request(method, endpoint, path_template=path_template, **kwargs)
+        
+        # Validate response schema according to the validation mode
+        # (streamed bodies are validated by the consumer)
+        if (
+            validate_schema and path_template and self.validate_schemas
+            and self._response_validator and not kwargs.get("stream", False)
+        ):
+            self._response_validator.validate(response, path_template, method)
         
         return response
     
@@ -151,9 +283,46 @@ class BaseHTTPClient(HTTPMethods):
         """Make a PATCH request with schema validation."""
         return self.request("PATCH", endpoint, path_template, **kwargs)
     
+    def pool_stats(self) -> dict:
+        """
+        Get connection pool usage counters.
+        
+        Counts come from the urllib3 pools currently held by the adapter,
+        so pools evicted beyond pool_connections are not included.
+        
+        Returns:
+            Dictionary with total requests, new connections, reused
+            connections and a per-host breakdown
+        """
+        hosts = {}
+        pools = self._adapter.poolmanager.pools
+        
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{pool.scheme}://{pool.host}:{pool.port}"
+            hosts[host] = {
+                "requests": pool.num_requests,
+                "new_connections": pool.num_connections,
+                "reused_connections": max(pool.num_requests - pool.num_connections, 0),
+                "idle_connections": pool.pool.qsize() if pool.pool else 0,
+            }
+        
+        return {
+            "requests": sum(h["requests"] for h in hosts.values()),
+            "new_connections": sum(h["new_connections"] for h in hosts.values()),
+            "reused_connections": sum(h["reused_connections"] for h in hosts.values()),
+            "hosts": hosts,
+        }
+    
     def close(self) -> None:
-        """Close the session."""
-        self._session.close()
+        """Close all sessions and their shared connection pool."""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._adapter.close()
         logger.info("HTTP Client session closed")
     
     def __enter__(self) -> "BaseHTTPClient":
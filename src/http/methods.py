@@ -1,50 +1,127 @@
 """HTTP methods mixin class."""
 import json
 import logging
-from typing import Optional
+import time
+from typing import Any, Optional
 
+import requests
 from requests import Response, Session
 
+from .metrics import LatencyMetrics
+from .response import JSONResponse
+from .retry import RetryBudget, RetryPolicy
+
 
 logger = logging.getLogger(__name__)
 
 
+class LazyResponseBody:
+    """
+    Response body log argument that is only decoded and pretty-printed
+    when the log record is actually formatted.
+    
+    Works with any response object exposing json() and text
+    (requests and httpx).
+    """
+    
+    __slots__ = ("_response",)
+    
+    def __init__(self, response: Any):
+        self._response = response
+    
+    def __str__(self) -> str:
+        try:
+            return f"Response body: {json.dumps(self._response.json(), indent=2)}"
+        except (json.JSONDecodeError, ValueError):
+            return f"Response text: {self._response.text[:500]}"
+
+
+def log_request(method: str, url: str, **kwargs) -> None:
+    """
+    Log outgoing request details.
+    
+    Debug details are skipped entirely when DEBUG is disabled.
+    """
+    logger.info(">>> %s %s", method.upper(), url)
+    
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    
+    if kwargs.get("params"):
+        logger.debug("    Query params: %s", kwargs["params"])
+    
+    if kwargs.get("json"):
+        # Formatted now: the caller may mutate the body after the request
+        logger.debug("    Request body: %s", json.dumps(kwargs["json"], indent=2))
+    
+    if kwargs.get("data"):
+        logger.debug("    Form data: %s", kwargs["data"])
+
+
+def log_response(response: Any, reason: str, log_body: bool = True) -> None:
+    """
+    Log incoming response details.
+    
+    The body is decoded lazily, so with DEBUG disabled (or handed to a
+    background queue handler) the request path never parses it.
+    Pass log_body=False for streamed responses whose body must not be read.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "<<< %s %s (%.3fs)",
+            response.status_code, reason, response.elapsed.total_seconds()
+        )
+    
+    if log_body and logger.isEnabledFor(logging.DEBUG) and response.content:
+        logger.debug("    %s", LazyResponseBody(response))
+
+
 class HTTPMethods:
     """
     Mixin class providing HTTP methods (GET, POST, PUT, DELETE, PATCH).
     
     This class should be used as a mixin or base class for HTTP clients.
     Requires self._session (requests.Session) and self.base_url to be set.
+    Retries are enabled by setting self.retry_policy (plus optional
+    self.retry_overrides, self._retry_budget and self.retry_stats).
+    Latencies are recorded when self.latency_metrics is set.
     """
     
     _session: Session
     base_url: str
     timeout: int
+    retry_policy: Optional[RetryPolicy] = None
+    retry_overrides: dict[str, RetryPolicy]
+    latency_metrics: Optional[LatencyMetrics] = None
     
     def _log_request(self, method: str, url: str, **kwargs) -> None:
         """Log outgoing request details."""
-        logger.info(f">>> {method.upper()} {url}")
-        
-        if "params" in kwargs and kwargs["params"]:
-            logger.debug(f"    Query params: {kwargs['params']}")
-        
-        if "json" in kwargs and kwargs["json"]:
-            logger.debug(f"    Request body: {json.dumps(kwargs['json'], indent=2)}")
-        
-        if "data" in kwargs and kwargs["data"]:
-            logger.debug(f"    Form data: {kwargs['data']}")
+        log_request(method, url, **kwargs)
     
-    def _log_response(self, response: Response) -> None:
+    def _log_response(self, response: Response, log_body: bool = True) -> None:
         """Log incoming response details."""
-        logger.info(f"<<< {response.status_code} {response.reason} ({response.elapsed.total_seconds():.3f}s)")
+        log_response(response, response.reason, log_body)
+    
+    def set_retry_policy(self, policy: RetryPolicy, path_template: Optional[str] = None) -> None:
+        """
+        Set the default retry policy or an override for one operation.
         
-        try:
-            if response.content:
-                response_body = response.json()
-                logger.debug(f"    Response body: {json.dumps(response_body, indent=2)}")
-        except (json.JSONDecodeError, ValueError):
-            if response.text:
-                logger.debug(f"    Response text: {response.text[:500]}")
+        Args:
+            policy: Retry policy to use
+            path_template: Swagger path template to override (e.g., "/store/order");
+                the default policy is replaced when omitted
+        """
+        if path_template is None:
+            self.retry_policy = policy
+        else:
+            self.retry_overrides[path_template] = policy
+    
+    def _get_retry_policy(self, path_template: Optional[str]) -> Optional[RetryPolicy]:
+        """Get the retry policy for an operation (override or default)."""
+        overrides = getattr(self, "retry_overrides", None) or {}
+        if path_template in overrides:
+            return overrides[path_template]
+        return getattr(self, "retry_policy", None)
     
     def _make_request(
         self,
@@ -55,6 +132,9 @@ class HTTPMethods:
         """
         Make an HTTP request (internal method without validation).
         
+        Transient failures are retried according to the retry policy of the
+        operation. The number of attempts is stored on response.attempts.
+        
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, PATCH)
             endpoint: API endpoint (e.g., "/pet/1")
@@ -64,19 +144,103 @@ class HTTPMethods:
             Response object
         """
         # Remove path_template from kwargs - it's not a requests parameter
-        kwargs.pop("path_template", None)
+        path_template = kwargs.pop("path_template", None)
         
         url = f"{self.base_url}{endpoint}"
         kwargs.setdefault("timeout", self.timeout)
         
-        self._log_request(method, url, **kwargs)
+        policy = self._get_retry_policy(path_template)
+        budget: Optional[RetryBudget] = getattr(self, "_retry_budget", None)
+        if budget is not None:
+            budget.record_request()
         
-        response = self._session.request(method, url, **kwargs)
+        attempt = 0
+        while True:
+            attempt += 1
+            self._log_request(method, url, **kwargs)
+            
+            response, error = None, None
+            start = time.perf_counter()
+            try:
+                response = self._session.request(method, url, **kwargs)
+            except requests.exceptions.RequestException as e:
+                error = e
+            self._record_latency(method, path_template or endpoint, response, time.perf_counter() - start)
+            
+            if policy is None or not policy.should_retry(method, attempt, response, error):
+                break
+            
+            if budget is not None and not budget.try_acquire():
+                logger.warning(f"Retry budget exhausted, giving up on {method.upper()} {url}")
+                self._record_attempts(attempt, budget_exhausted=True)
+                break
+            
+            delay = policy.get_delay(attempt, response)
+            reason = f"status {response.status_code}" if response is not None else type(error).__name__
+            logger.warning(
+                f"Retrying {method.upper()} {url} after {reason} "
+                f"(attempt {attempt + 1}/{policy.max_attempts}, waiting {delay:.2f}s)"
+            )
+            
+            if response is not None:
+                response.close()
+            time.sleep(delay)
         
-        self._log_response(response)
+        self._record_attempts(attempt)
+        
+        if error is not None:
+            raise error
+        
+        # Memoize json() so the body is decoded once per request
+        response.__class__ = JSONResponse
+        response.attempts = attempt
+        
+        # Streamed bodies are left unread for the caller
+        self._log_response(response, log_body=not kwargs.get("stream", False))
         
         return response
     
+    def _record_latency(
+        self,
+        method: str,
+        path_template: str,
+        response: Optional[Response],
+        total: float
+    ) -> None:
+        """
+        Record the timings of one attempt in self.latency_metrics.
+        
+        requests only exposes the time until the response headers were
+        parsed (response.elapsed), recorded as "ttfb"; "total" also covers
+        reading the body unless the request was streamed.
+        """
+        if self.latency_metrics is None:
+            return
+        
+        if response is None:
+            self.latency_metrics.record(method, path_template, "error", {"total": total})
+            return
+        
+        self.latency_metrics.record(
+            method, path_template, response.status_code,
+            {"ttfb": response.elapsed.total_seconds(), "total": total}
+        )
+    
+    def _record_attempts(self, attempts: int, budget_exhausted: bool = False) -> None:
+        """Update retry counters (no-op for clients without retry_stats)."""
+        stats = getattr(self, "retry_stats", None)
+        if stats is None:
+            return
+        
+        with self._retry_stats_lock:
+            if budget_exhausted:
+                stats["budget_exhausted"] += 1
+                return
+            stats["requests"] += 1
+            stats["attempts"] += attempts
+            if attempts > 1:
+                stats["retried_requests"] += 1
+    
     def get(
         self,
         endpoint: str,
@@ -0,0 +1,254 @@
+"""Per-operation latency histograms for HTTP clients."""
+import json
+import threading
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+
+# 2^8 sub-buckets per power of two keeps the relative error below 1%
+# (about two significant digits, as in HdrHistogram)
+_SUB_BUCKET_BITS = 8
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+
+PERCENTILES = (50, 90, 95, 99, 99.9)
+
+
+def _bucket_index(value: int) -> int:
+    """Map a non-negative integer to its log-linear bucket."""
+    if value < _SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS
+    return (shift << _SUB_BUCKET_BITS) + (value >> shift)
+
+
+def _bucket_value(index: int) -> int:
+    """Highest value that maps to a bucket (inverse of _bucket_index)."""
+    if index < _SUB_BUCKET_COUNT:
+        return index
+    shift, top = index >> _SUB_BUCKET_BITS, index & (_SUB_BUCKET_COUNT - 1)
+    return ((top + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """
+    HDR-style log-linear histogram of latencies in microseconds.
+    
+    Recording is O(1) and memory grows with the spread of values, not
+    their count. Histograms with the same layout merge by adding bucket
+    counts, so per-worker histograms combine into exact totals.
+    """
+    
+    __slots__ = ("counts", "count", "total", "min", "max")
+    
+    def __init__(self):
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+    
+    def record(self, seconds: float) -> None:
+        """Record a latency given in seconds."""
+        value = max(int(seconds * 1_000_000), 0)
+        index = _bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+    
+    def percentile(self, pct: float) -> float:
+        """
+        Get a latency percentile.
+        
+        Args:
+            pct: Percentile between 0 and 100
+            
+        Returns:
+            Latency in milliseconds (0.0 for an empty histogram)
+        """
+        if not self.count:
+            return 0.0
+        
+        rank = max(pct / 100 * self.count, 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                value = min(max(_bucket_value(index), self.min), self.max)
+                return value / 1000
+        return self.max / 1000
+    
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the counts of another histogram to this one."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+    
+    def summary(self) -> dict:
+        """Get count, mean, percentiles and max in milliseconds."""
+        result = {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count / 1000, 3) if self.count else 0.0,
+        }
+        for pct in PERCENTILES:
+            result[f"p{pct:g}_ms"] = round(self.percentile(pct), 3)
+        result["max_ms"] = round((self.max or 0) / 1000, 3)
+        return result
+    
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        return {
+            "count": self.count,
+            "total_us": self.total,
+            "min_us": self.min,
+            "max_us": self.max,
+            "counts": {str(index): count for index, count in sorted(self.counts.items())},
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        """Deserialize from to_dict() output."""
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total_us"]
+        histogram.min = data["min_us"]
+        histogram.max = data["max_us"]
+        return histogram
+
+
+class LatencyMetrics:
+    """
+    Thread-safe latency histograms keyed by (method, path_template, status).
+    
+    Each key holds one histogram per timing phase, e.g. "total" (request
+    start to body received), "ttfb" (time to response headers) and, when
+    the transport reports them, "connect" and "tls".
+    
+    Usage:
+        metrics = client.latency_metrics
+        metrics.histogram("GET", "/pet/{petId}", 200).percentile(99)
+        metrics.summary()
+        metrics.dump("reports/latency.json")
+    """
+    
+    def __init__(self):
+        self._operations: dict[tuple[str, str, str], dict[str, LatencyHistogram]] = {}
+        self._lock = threading.Lock()
+    
+    def record(
+        self,
+        method: str,
+        path_template: str,
+        status: Union[int, str],
+        phases: dict[str, float]
+    ) -> None:
+        """
+        Record the timings of one request.
+        
+        Args:
+            method: HTTP method
+            path_template: Swagger path template (or raw endpoint)
+            status: Response status code, or "error" for transport failures
+            phases: Phase name -> duration in seconds
+        """
+        key = (method.upper(), path_template, str(status))
+        with self._lock:
+            histograms = self._operations.setdefault(key, {})
+            for phase, seconds in phases.items():
+                if phase not in histograms:
+                    histograms[phase] = LatencyHistogram()
+                histograms[phase].record(seconds)
+    
+    def histogram(
+        self,
+        method: str,
+        path_template: str,
+        status: Union[int, str],
+        phase: str = "total"
+    ) -> Optional[LatencyHistogram]:
+        """Get the histogram of one operation and phase, if recorded."""
+        with self._lock:
+            return self._operations.get((method.upper(), path_template, str(status)), {}).get(phase)
+    
+    def merge(self, other: "LatencyMetrics") -> None:
+        """Add all histograms of another instance to this one."""
+        with other._lock:
+            operations = {key: dict(phases) for key, phases in other._operations.items()}
+        with self._lock:
+            for key, phases in operations.items():
+                histograms = self._operations.setdefault(key, {})
+                for phase, histogram in phases.items():
+                    histograms.setdefault(phase, LatencyHistogram()).merge(histogram)
+    
+    def reset(self) -> None:
+        """Drop all recorded data."""
+        with self._lock:
+            self._operations.clear()
+    
+    def __len__(self) -> int:
+        return len(self._operations)
+    
+    def _export(self, histogram_dump) -> list[dict]:
+        with self._lock:
+            return [
+                {
+                    "method": method,
+                    "path_template": path_template,
+                    "status": status,
+                    "phases": {phase: histogram_dump(h) for phase, h in sorted(phases.items())},
+                }
+                for (method, path_template, status), phases in sorted(self._operations.items())
+            ]
+    
+    def summary(self) -> list[dict]:
+        """Get per-operation, per-phase percentiles in milliseconds."""
+        return self._export(LatencyHistogram.summary)
+    
+    def to_dict(self) -> dict:
+        """Serialize histograms and their summary to a JSON-compatible dict."""
+        return {"operations": self._export(LatencyHistogram.to_dict), "summary": self.summary()}
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyMetrics":
+        """Deserialize from to_dict() output."""
+        metrics = cls()
+        for operation in data.get("operations", []):
+            key = (operation["method"], operation["path_template"], operation["status"])
+            metrics._operations[key] = {
+                phase: LatencyHistogram.from_dict(h) for phase, h in operation["phases"].items()
+            }
+        return metrics
+    
+    def dump(self, path: Union[str, Path]) -> None:
+        """Write to_dict() output as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+    
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "LatencyMetrics":
+        """Read a file written by dump()."""
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+    
+    @classmethod
+    def merge_files(cls, paths: Iterable[Union[str, Path]]) -> "LatencyMetrics":
+        """Load and merge several dumps (e.g. one per xdist worker)."""
+        merged = cls()
+        for path in paths:
+            merged.merge(cls.load(path))
+        return merged
+
+
+# Process-wide metrics shared by all clients (dumped by conftest at session end)
+_latency_metrics = LatencyMetrics()
+
+
+def get_latency_metrics() -> LatencyMetrics:
+    """Get the process-wide LatencyMetrics instance."""
+    return _latency_metrics
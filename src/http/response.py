@@ -0,0 +1,96 @@
+"""Response types that decode the JSON body only once."""
+import json
+import logging
+from typing import Any, Callable, Optional
+
+import httpx
+import requests
+
+
+logger = logging.getLogger(__name__)
+
+_UNSET = object()
+
+# Active JSON decoder; None means the transport's own json() implementation
+_json_loads: Optional[Callable[[bytes], Any]] = None
+
+
+def set_json_backend(name: str) -> str:
+    """
+    Select the JSON decoder used for response bodies.
+    
+    Args:
+        name: "json" (standard library) or "orjson" (if installed)
+        
+    Returns:
+        Name of the backend actually in use
+    """
+    global _json_loads
+    
+    name = name.lower()
+    
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError:
+            logger.warning("orjson is not installed, falling back to the json module")
+        else:
+            _json_loads = orjson.loads
+            return "orjson"
+    elif name != "json":
+        raise ValueError(f"Unknown JSON backend: {name}")
+    
+    _json_loads = None
+    return "json"
+
+
+def loads_json(content: bytes) -> Any:
+    """
+    Decode a JSON body with the active backend.
+    
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    if _json_loads is not None:
+        return _json_loads(content)
+    return json.loads(content)
+
+
+class MemoizedJSONMixin:
+    """
+    Mixin memoizing json() so logging, schema validation and the caller
+    share one decoded body.
+    
+    The same object is returned on every call, so callers that mutate it
+    should copy it first. Calls with decoder kwargs bypass the cache.
+    """
+    
+    def json(self, **kwargs) -> Any:
+        if kwargs:
+            return super().json(**kwargs)
+        
+        parsed = self.__dict__.get("_parsed_json", _UNSET)
+        
+        if parsed is _UNSET:
+            try:
+                if _json_loads is not None:
+                    parsed = _json_loads(self.content)
+                else:
+                    parsed = super().json()
+            except ValueError as e:
+                # Remember decode failures too (JSONDecodeError is a ValueError)
+                parsed = e
+            self.__dict__["_parsed_json"] = parsed
+        
+        if isinstance(parsed, ValueError):
+            raise parsed
+        
+        return parsed
+
+
+class JSONResponse(MemoizedJSONMixin, requests.Response):
+    """requests.Response with a memoized json()."""
+
+
+class AsyncJSONResponse(MemoizedJSONMixin, httpx.Response):
+    """httpx.Response with a memoized json()."""
@@ -0,0 +1,223 @@
+"""Response schema validation modes: full, sampled, first-N-items and async."""
+import itertools
+import json
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Optional, Union
+
+from src.schema_validator import SwaggerSchemaValidator
+
+from .response import loads_json
+
+
+logger = logging.getLogger(__name__)
+
+VALIDATION_MODES = ("full", "sampled", "first-n", "async")
+
+
+class ValidationReport:
+    """
+    Thread-safe counters and schema violations of validated responses.
+    
+    Also owns the worker pool used by async validation, so drain() can
+    wait for validations still in flight before the report is read.
+    Validations that raise are logged and counted as errors.
+    
+    Usage:
+        report = get_validation_report()
+        summary = report.drain()
+    """
+    
+    def __init__(self, max_workers: int = 2):
+        """
+        Initialize the report.
+        
+        Args:
+            max_workers: Threads validating responses in async mode
+        """
+        self.max_workers = max_workers
+        self._counts = {"validated": 0, "skipped": 0, "errors": 0}
+        self._violations: list[dict] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: list[Future] = []
+        self._lock = threading.Lock()
+    
+    def submit(self, fn, *args) -> None:
+        """Run a validation on the worker pool."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="validate")
+            # Finished futures are dropped so long runs don't accumulate them
+            self._futures = [f for f in self._futures if not f.done()]
+            self._futures.append(self._executor.submit(self._run, fn, *args))
+    
+    def _run(self, fn, *args) -> None:
+        """Run one validation; one that raises is logged and counted as an error."""
+        # Caught here rather than read from the future afterwards, so the
+        # count is final by the time drain() sees the future done
+        try:
+            fn(*args)
+        except Exception as e:
+            logger.error(f"Response validation raised: {e!r}")
+            self.count("errors")
+    
+    def count(self, outcome: str) -> None:
+        """Count a validated, skipped or failed (errors) response."""
+        with self._lock:
+            self._counts[outcome] += 1
+    
+    def add_violation(self, method: str, path: str, status_code: Union[int, str], error: str) -> None:
+        """Record a response that did not match its schema."""
+        with self._lock:
+            self._violations.append({
+                "method": method.upper(),
+                "path": path,
+                "status": status_code,
+                "error": error,
+            })
+    
+    def drain(self, timeout: Optional[float] = None) -> dict:
+        """
+        Wait for pending async validations.
+        
+        Args:
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            Summary from to_dict()
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        if futures:
+            _, not_done = wait(futures, timeout=timeout)
+            if not_done:
+                logger.warning(f"{len(not_done)} response validation(s) still running after {timeout}s")
+                with self._lock:
+                    self._futures.extend(not_done)
+        return self.to_dict()
+    
+    def reset(self) -> None:
+        """Clear counters and recorded violations."""
+        with self._lock:
+            self._counts = {"validated": 0, "skipped": 0, "errors": 0}
+            self._violations = []
+    
+    def to_dict(self) -> dict:
+        """
+        Get counters and violations.
+        
+        Returns:
+            Dictionary with validated, skipped, errors and violations
+        """
+        with self._lock:
+            return {**self._counts, "violations": list(self._violations)}
+
+
+# Process-wide report shared by all clients
+_validation_report = ValidationReport()
+
+
+def get_validation_report() -> ValidationReport:
+    """Get the process-wide ValidationReport instance."""
+    return _validation_report
+
+
+class ResponseValidator:
+    """
+    Validates responses against Swagger schemas according to a mode.
+    
+    Modes:
+        full: validate every response in the request thread
+        sampled: validate 1 in sample_rate responses
+        first-n: validate at most the first max_items items of array bodies
+        async: parse and validate on a worker pool off the request thread;
+            violations are collected and reported at session end. The body
+            is decoded privately from response.content, never through the
+            memoized response.json() object the caller holds.
+            
+    In every mode violations are logged and recorded in the ValidationReport.
+    
+    Usage:
+        validator = ResponseValidator(get_schema_validator(), mode="sampled", sample_rate=10)
+        validator.validate(response, "/pet/{petId}", "GET")
+    """
+    
+    def __init__(
+        self,
+        schema_validator: SwaggerSchemaValidator,
+        mode: str = "full",
+        sample_rate: int = 10,
+        max_items: int = 20,
+        report: Optional[ValidationReport] = None,
+        fail_fast: bool = False
+    ):
+        """
+        Initialize the response validator.
+        
+        Args:
+            schema_validator: Validator holding the compiled schemas
+            mode: full, sampled, first-n or async
+            sample_rate: Validate 1 in sample_rate responses (sampled mode)
+            max_items: Array items validated per response (first-n mode)
+            report: Where results go (the process-wide report if not provided)
+            fail_fast: Stop at and record only the first violation of a response
+        """
+        if mode not in VALIDATION_MODES:
+            raise ValueError(f"Unknown validation mode {mode!r}, expected one of {VALIDATION_MODES}")
+        
+        self.schema_validator = schema_validator
+        self.mode = mode
+        self.sample_rate = max(1, sample_rate)
+        self.max_items = max(1, max_items)
+        self.report = report or get_validation_report()
+        self.fail_fast = fail_fast
+        self._counter = itertools.count()
+    
+    def validate(self, response: Any, path: str, method: str) -> None:
+        """
+        Validate a response body (requests or httpx response).
+        
+        Args:
+            response: Response with a fully read body
+            path: Swagger path template (e.g., "/pet/{petId}")
+            method: HTTP method
+        """
+        if self.mode == "sampled" and next(self._counter) % self.sample_rate:
+            self.report.count("skipped")
+            return
+        
+        if self.mode == "async":
+            self.report.submit(self._validate_content, response.content, response.status_code, path, method)
+            return
+        
+        try:
+            data = response.json()
+        except (json.JSONDecodeError, ValueError):
+            self.report.count("skipped")
+            return
+        self._validate_data(data, response.status_code, path, method)
+    
+    def _validate_content(self, content: bytes, status_code: int, path: str, method: str) -> None:
+        """Decode a raw body into a private object and validate it (worker pool)."""
+        try:
+            data = loads_json(content)
+        except ValueError:
+            self.report.count("skipped")
+            return
+        self._validate_data(data, status_code, path, method)
+    
+    def _validate_data(self, data: Any, status_code: int, path: str, method: str) -> None:
+        """Validate one decoded body, recording the outcome."""
+        if self.mode == "first-n" and isinstance(data, list):
+            data = data[:self.max_items]
+        
+        # Valid responses (the common case) cost one validator pass, no formatting
+        errors = self.schema_validator.check_response(
+            data, path, method, status_code, fail_fast=self.fail_fast
+        )
+        self.report.count("validated")
+        if errors is not None:
+            error = str(errors)
+            logger.warning(f"Schema validation failed: {error}")
+            self.report.add_violation(method, path, status_code, error)
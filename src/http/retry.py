@@ -0,0 +1,202 @@
+"""Retry policy, backoff and retry budget for HTTP requests."""
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import requests
+from requests import Response
+from urllib3.exceptions import NewConnectionError
+
+
+# Methods that can be repeated without changing the result (RFC 9110)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Transient statuses worth retrying; 500 is excluded because Petstore uses it for bad input
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class RetryPolicy:
+    """
+    Decides whether and when a failed request is retried.
+    
+    Uses exponential backoff with full jitter and honours Retry-After.
+    Non-idempotent methods are only retried when the request provably
+    never reached the server (connect timeouts and refused or unresolvable
+    connections), unless retry_non_idempotent is set for operations known
+    to be safe.
+    
+    Usage:
+        policy = RetryPolicy(max_attempts=5, backoff_factor=0.2)
+        client = APIClient(retry_policy=policy)
+        client.set_retry_policy(RetryPolicy(max_attempts=1), path_template="/store/order")
+    """
+    
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: frozenset = RETRY_STATUSES,
+        idempotent_methods: frozenset = IDEMPOTENT_METHODS,
+        retry_non_idempotent: bool = False,
+        respect_retry_after: bool = True
+    ):
+        """
+        Initialize the retry policy.
+        
+        Args:
+            max_attempts: Total attempts including the first one (1 disables retries)
+            backoff_factor: Base delay in seconds, doubled on every retry
+            max_backoff: Upper bound for a single delay in seconds
+            jitter: Randomize delays between 0 and the computed backoff
+            retry_statuses: Response statuses that trigger a retry
+            idempotent_methods: Methods that are safe to retry after a response or read error
+            retry_non_idempotent: Treat every method as idempotent
+            respect_retry_after: Use the Retry-After header when present
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+        self.retry_non_idempotent = retry_non_idempotent
+        self.respect_retry_after = respect_retry_after
+    
+    def is_idempotent(self, method: str) -> bool:
+        """Check whether a method may be repeated safely."""
+        return self.retry_non_idempotent or method.upper() in self.idempotent_methods
+    
+    def should_retry(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[Response] = None,
+        error: Optional[Exception] = None
+    ) -> bool:
+        """
+        Decide whether to retry after an attempt.
+        
+        Args:
+            method: HTTP method
+            attempt: Number of the attempt that just finished (1-based)
+            response: Response of the attempt, if any
+            error: Exception raised by the attempt, if any
+            
+        Returns:
+            True if another attempt should be made
+        """
+        if attempt >= self.max_attempts:
+            return False
+        
+        if error is not None:
+            if _never_sent(error):
+                return True
+            if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+                return self.is_idempotent(method)
+            return False
+        
+        return (
+            response is not None
+            and response.status_code in self.retry_statuses
+            and self.is_idempotent(method)
+        )
+    
+    def get_delay(self, attempt: int, response: Optional[Response] = None) -> float:
+        """
+        Compute the delay before the next attempt.
+        
+        Args:
+            attempt: Number of the attempt that just finished (1-based)
+            response: Response of the attempt, if any
+            
+        Returns:
+            Delay in seconds
+        """
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_backoff)
+        
+        backoff = min(self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of overall traffic.
+    
+    Every request deposits `ratio` tokens and every retry withdraws one, so
+    during an outage retries cannot multiply the load on the server.
+    `min_tokens` allows a few retries before any traffic was recorded.
+    """
+    
+    def __init__(self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0):
+        """
+        Initialize the retry budget.
+        
+        Args:
+            ratio: Retries allowed per request
+            min_tokens: Initial token balance
+            max_tokens: Maximum token balance
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = min_tokens
+        self._lock = threading.Lock()
+    
+    def record_request(self) -> None:
+        """Deposit tokens for a new request."""
+        with self._lock:
+            self._tokens = min(self._tokens + self.ratio, self.max_tokens)
+    
+    def try_acquire(self) -> bool:
+        """Withdraw a token for a retry; False if the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+def _never_sent(error: Exception) -> bool:
+    """Check whether a request failed before the connection was established."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    if isinstance(error, requests.exceptions.ConnectionError) and error.args:
+        # requests wraps urllib3's MaxRetryError; its reason tells a refused
+        # connection apart from one that broke after the request was sent
+        return isinstance(getattr(error.args[0], "reason", None), NewConnectionError)
+    return False
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta seconds or HTTP date).
+    
+    Args:
+        value: Header value
+        
+    Returns:
+        Delay in seconds or None if absent/invalid
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
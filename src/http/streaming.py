@@ -0,0 +1,81 @@
+"""Incremental parsing of streamed JSON array responses."""
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+
+_decoder = json.JSONDecoder()
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield the elements of a top-level JSON array one by one.
+    
+    Only the element currently being decoded is buffered, so memory stays
+    flat regardless of the array size.
+    
+    Args:
+        chunks: Raw body chunks (e.g. response.iter_content())
+        
+    Yields:
+        Decoded array elements
+        
+    Raises:
+        ValueError: If the body is not a well-formed JSON array
+    """
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+    buffer = ""
+    pos = 0
+    exhausted = False
+    started = False
+    
+    def read_more() -> bool:
+        nonlocal buffer, pos, exhausted
+        for chunk in chunks:
+            if chunk:
+                # Drop already consumed text before appending
+                buffer = buffer[pos:] + utf8.decode(chunk)
+                pos = 0
+                return True
+        buffer = buffer[pos:] + utf8.decode(b"", final=True)
+        pos = 0
+        exhausted = True
+        return False
+    
+    while True:
+        # Skip whitespace and separators between elements
+        while pos < len(buffer) and (buffer[pos] in _WHITESPACE or (started and buffer[pos] == ",")):
+            pos += 1
+        
+        if pos >= len(buffer):
+            if exhausted or not read_more():
+                raise ValueError("Unexpected end of JSON array")
+            continue
+        
+        if not started:
+            if buffer[pos] != "[":
+                raise ValueError(f"Expected JSON array, got {buffer[pos]!r}")
+            started = True
+            pos += 1
+            continue
+        
+        if buffer[pos] == "]":
+            return
+        
+        try:
+            item, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if exhausted or not read_more():
+                raise
+            continue
+        
+        # A value ending exactly at the buffer edge may be truncated (e.g. a number)
+        if end == len(buffer) and not exhausted:
+            read_more()
+            continue
+        
+        pos = end
+        yield item
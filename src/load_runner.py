@@ -0,0 +1,375 @@
+"""Load generation driver built on APIClient and the service layer."""
+import argparse
+import json
+import logging
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from requests import Response
+
+from src.api_client import APIClient
+from src.models import Order, Pet, get_random, seed_factories
+
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass
+class Scenario:
+    """A weighted user flow executed repeatedly against the API."""
+    name: str
+    run: Callable[[APIClient], None]
+    weight: float = 1.0
+
+
+def pet_lifecycle(api: APIClient) -> None:
+    """Create pet -> find by status -> place order -> delete order -> delete pet."""
+    pet = Pet.create().to_payload()
+    api.pet.create(pet)
+    api.pet.find_by_status("available")
+    order = api.store.place_order(Order.create(pet_id=pet["id"]).to_payload())
+    if order.ok:
+        api.store.delete_order(order.json()["id"])
+    api.pet.delete(pet["id"])
+
+
+def browse_pets(api: APIClient) -> None:
+    """Find pets by status."""
+    api.pet.find_by_status(get_random().choice(["available", "pending", "sold"]))
+
+
+def check_inventory(api: APIClient) -> None:
+    """Get store inventory."""
+    api.store.get_inventory()
+
+
+SCENARIOS = {
+    "pet_lifecycle": pet_lifecycle,
+    "browse_pets": browse_pets,
+    "check_inventory": check_inventory,
+}
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(pct / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class LoadStats:
+    """Thread-safe latency and outcome recorder keyed by operation name."""
+    
+    def __init__(self):
+        self._latencies: dict[str, list[float]] = {}
+        self._errors: dict[str, int] = {}
+        self._statuses: dict[str, dict[int, int]] = {}
+        self._lock = threading.Lock()
+    
+    def record(self, name: str, latency: float, status: Optional[int] = None, error: bool = False) -> None:
+        """
+        Record one completed operation.
+        
+        Args:
+            name: Operation name (e.g. "GET /pet/{petId}" or a scenario name)
+            latency: Latency in seconds
+            status: HTTP status code, if any
+            error: Whether the operation failed
+        """
+        with self._lock:
+            self._latencies.setdefault(name, []).append(latency)
+            if error:
+                self._errors[name] = self._errors.get(name, 0) + 1
+            if status is not None:
+                statuses = self._statuses.setdefault(name, {})
+                statuses[status] = statuses.get(status, 0) + 1
+    
+    def summary(self, elapsed: float) -> dict:
+        """
+        Summarize recorded operations.
+        
+        Args:
+            elapsed: Wall-clock duration of the run in seconds
+            
+        Returns:
+            Dictionary of name -> count, errors, throughput and latency percentiles (ms)
+        """
+        with self._lock:
+            latencies = {name: sorted(values) for name, values in self._latencies.items()}
+            errors = dict(self._errors)
+            statuses = {name: dict(s) for name, s in self._statuses.items()}
+        
+        result = {}
+        for name, values in sorted(latencies.items()):
+            entry = {
+                "count": len(values),
+                "errors": errors.get(name, 0),
+                "throughput_rps": round(len(values) / elapsed, 2) if elapsed > 0 else 0.0,
+            }
+            for pct in PERCENTILES:
+                entry[f"p{pct}_ms"] = round(percentile(values, pct) * 1000, 2)
+            entry["max_ms"] = round(values[-1] * 1000, 2)
+            if name in statuses:
+                entry["statuses"] = {str(k): v for k, v in sorted(statuses[name].items())}
+            result[name] = entry
+        return result
+
+
+class _TimedAPIClient(APIClient):
+    """APIClient that records the latency of every request by path_template."""
+    
+    def __init__(self, stats: LoadStats, **kwargs):
+        super().__init__(**kwargs)
+        self._stats = stats
+    
+    def request(self, method: str, endpoint: str, path_template: Optional[str] = None, **kwargs) -> Response:
+        name = f"{method.upper()} {path_template or endpoint}"
+        start = time.perf_counter()
+        try:
+            response = super().request(method, endpoint, path_template, **kwargs)
+        except Exception:
+            self._stats.record(name, time.perf_counter() - start, error=True)
+            raise
+        self._stats.record(
+            name, time.perf_counter() - start, response.status_code, error=response.status_code >= 500
+        )
+        return response
+
+
+class LoadRunner:
+    """
+    Drives weighted scenarios against the API and reports latency percentiles.
+    
+    Open-loop mode schedules scenario starts as a Poisson process at the
+    target rate independently of response times, and measures scenario
+    latency from the scheduled start, so a slow server cannot hide queueing
+    delay (coordinated omission). Closed-loop mode runs `concurrency`
+    users back to back.
+    
+    Usage:
+        runner = LoadRunner(
+            [Scenario("pet_lifecycle", pet_lifecycle, 1), Scenario("browse_pets", browse_pets, 4)],
+            rps=50, duration=60, ramp_up=10
+        )
+        report = runner.run()
+    """
+    
+    def __init__(
+        self,
+        scenarios: list[Scenario],
+        duration: float = 60.0,
+        rps: Optional[float] = None,
+        concurrency: int = 10,
+        ramp_up: float = 0.0,
+        open_loop: bool = True,
+        seed: Optional[int] = None,
+        **client_kwargs
+    ):
+        """
+        Initialize the load runner.
+        
+        Args:
+            scenarios: Weighted scenarios to pick from
+            duration: Run length in seconds (including ramp-up)
+            rps: Target scenario starts per second (required for open loop)
+            concurrency: Worker threads (maximum in-flight scenarios)
+            ramp_up: Seconds to ramp linearly to the target rate/concurrency
+            open_loop: Use open-loop arrivals instead of closed-loop users
+            seed: Seed for scenario selection, arrival times and test data
+            **client_kwargs: Arguments passed to APIClient
+        """
+        if not scenarios:
+            raise ValueError("At least one scenario is required")
+        if open_loop and not rps:
+            raise ValueError("Open-loop mode requires a target rps")
+        
+        self.scenarios = scenarios
+        self.duration = duration
+        self.rps = rps
+        self.concurrency = concurrency
+        self.ramp_up = min(ramp_up, duration)
+        self.open_loop = open_loop
+        self._random = random.Random(seed)
+        if seed is not None:
+            seed_factories(seed)
+        self._weights = [s.weight for s in scenarios]
+        
+        self.stats = LoadStats()
+        self.scenario_stats = LoadStats()
+        client_kwargs.setdefault("validate_schemas", False)
+        client_kwargs.setdefault("pool_maxsize", concurrency)
+        client_kwargs.setdefault("thread_safe", True)
+        self.client = _TimedAPIClient(self.stats, **client_kwargs)
+    
+    def _pick(self) -> Scenario:
+        return self._random.choices(self.scenarios, weights=self._weights)[0]
+    
+    def _execute(self, scenario: Scenario, scheduled: float) -> None:
+        """Run a scenario and record its latency from the scheduled start."""
+        try:
+            scenario.run(self.client)
+            failed = False
+        except Exception as e:
+            logger.debug(f"Scenario {scenario.name} failed: {e}")
+            failed = True
+        self.scenario_stats.record(scenario.name, time.perf_counter() - scheduled, error=failed)
+    
+    def _rate_at(self, elapsed: float) -> float:
+        if self.ramp_up and elapsed < self.ramp_up:
+            return max(self.rps * elapsed / self.ramp_up, self.rps * 0.01)
+        return self.rps
+    
+    def _run_open_loop(self, start: float) -> None:
+        deadline = start + self.duration
+        scheduled = start
+        
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="load") as executor:
+            while True:
+                scheduled += self._random.expovariate(self._rate_at(scheduled - start))
+                if scheduled >= deadline:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self._execute, self._pick(), scheduled)
+    
+    def _run_closed_loop(self, start: float) -> None:
+        deadline = start + self.duration
+        
+        def user(index: int) -> None:
+            time.sleep(self.ramp_up * index / self.concurrency)
+            while time.perf_counter() < deadline:
+                self._execute(self._pick(), time.perf_counter())
+        
+        threads = [
+            threading.Thread(target=user, args=(i,), name=f"load-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    
+    def run(self) -> dict:
+        """
+        Run the load test.
+        
+        Returns:
+            Report with run settings, per-scenario and per-operation statistics
+        """
+        mode = "open" if self.open_loop else "closed"
+        logger.info(
+            f"Load run ({mode} loop): {self.duration}s, rps={self.rps}, "
+            f"concurrency={self.concurrency}, ramp_up={self.ramp_up}s"
+        )
+        
+        start = time.perf_counter()
+        try:
+            if self.open_loop:
+                self._run_open_loop(start)
+            else:
+                self._run_closed_loop(start)
+        finally:
+            self.client.close()
+        elapsed = time.perf_counter() - start
+        
+        return {
+            "mode": mode,
+            "duration_s": round(elapsed, 2),
+            "target_rps": self.rps,
+            "concurrency": self.concurrency,
+            "scenarios": self.scenario_stats.summary(elapsed),
+            "operations": self.stats.summary(elapsed),
+        }
+
+
+def format_report(report: dict) -> str:
+    """Render a load report as a plain-text table."""
+    columns = ["count", "errors", "throughput_rps"] + [f"p{p}_ms" for p in PERCENTILES] + ["max_ms"]
+    lines = [
+        f"Mode: {report['mode']} loop, duration {report['duration_s']}s, "
+        f"target rps {report['target_rps']}, concurrency {report['concurrency']}"
+    ]
+    
+    for section in ("scenarios", "operations"):
+        rows = report[section]
+        width = max([len(name) for name in rows] + [len(section)])
+        lines.append("")
+        lines.append(f"{section.upper():<{width}}  " + "  ".join(f"{c:>14}" for c in columns))
+        for name, entry in rows.items():
+            lines.append(f"{name:<{width}}  " + "  ".join(f"{entry[c]:>14}" for c in columns))
+    
+    return "\n".join(lines)
+
+
+def _parse_scenario(value: str) -> Scenario:
+    name, _, weight = value.partition("=")
+    if name not in SCENARIOS:
+        raise argparse.ArgumentTypeError(f"Unknown scenario {name!r} (choose from {', '.join(SCENARIOS)})")
+    return Scenario(name, SCENARIOS[name], float(weight or 1))
+
+
+def main() -> None:
+    """Run a load test from the command line."""
+    parser = argparse.ArgumentParser(description="Petstore load generator")
+    parser.add_argument("--base-url", default=None, help="API base URL (uses settings if omitted)")
+    parser.add_argument(
+        "--scenario", action="append", type=_parse_scenario, dest="scenarios",
+        help="Scenario as name[=weight], repeatable (default: all with weight 1)"
+    )
+    parser.add_argument("--rps", type=float, default=10.0, help="Target scenario starts per second (open loop)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Worker threads / closed-loop users")
+    parser.add_argument("--duration", type=float, default=60.0, help="Run length in seconds")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Ramp-up time in seconds")
+    parser.add_argument("--closed-loop", action="store_true", help="Run closed-loop users instead of open-loop arrivals")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--validate", action="store_true", help="Validate responses against swagger.json")
+    parser.add_argument("--local", action="store_true", help="Run against the in-process local server")
+    parser.add_argument("--json", type=Path, default=None, help="Also write the report to this JSON file")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s [%(levelname)s] %(message)s")
+    
+    scenarios = args.scenarios or [Scenario(name, func) for name, func in SCENARIOS.items()]
+    
+    server = None
+    base_url = args.base_url
+    if args.local:
+        from src.local_server import LocalPetstoreServer
+        server = LocalPetstoreServer().start()
+        base_url = server.base_url
+    
+    try:
+        runner = LoadRunner(
+            scenarios,
+            duration=args.duration,
+            rps=args.rps,
+            concurrency=args.concurrency,
+            ramp_up=args.ramp_up,
+            open_loop=not args.closed_loop,
+            seed=args.seed,
+            base_url=base_url,
+            validate_schemas=args.validate
+        )
+        report = runner.run()
+    finally:
+        if server is not None:
+            server.stop()
+    
+    print(format_report(report))
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
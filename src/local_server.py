@@ -0,0 +1,477 @@
+"""In-process stand-in for the Petstore API generated from swagger.json."""
+import argparse
+import json
+import logging
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+from urllib.parse import parse_qs, urlsplit
+
+from src.schema_validator import SwaggerSchemaValidator, get_schema_validator
+
+
+logger = logging.getLogger(__name__)
+
+# (status code, JSON body, extra headers)
+HandlerResult = tuple[int, Any, dict]
+
+
+class RequestError(Exception):
+    """Raised by parameter parsing/handlers to produce an error response."""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def api_response(code: int, message: str, type_: str = "unknown") -> dict:
+    """Build an ApiResponse body as returned by the real Petstore."""
+    return {"code": code, "type": type_, "message": message}
+
+
+class Route:
+    """A spec operation bound to a compiled path pattern."""
+    
+    def __init__(self, path: str, method: str, operation: dict, base_path: str):
+        self.path = path
+        self.method = method.upper()
+        self.operation = operation
+        self.operation_id = operation.get("operationId", "")
+        self.parameters = operation.get("parameters", [])
+        self.param_count = path.count("{")
+        
+        pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+)", re.escape(base_path + path))
+        self.pattern = re.compile(f"^{pattern}$")
+    
+    def error_status(self, default: int = 400) -> int:
+        """First 4xx status declared for the operation (used for invalid input)."""
+        statuses = sorted(
+            int(code) for code in self.operation.get("responses", {})
+            if code.isdigit() and 400 <= int(code) < 500 and int(code) != 404
+        )
+        return statuses[0] if statuses else default
+
+
+class PetstoreState:
+    """
+    In-memory pet/order/user stores and the operation handlers.
+    
+    Handlers are looked up by the spec operationId, so every route in
+    swagger.json that has a handler here is served.
+    """
+    
+    def __init__(self):
+        self.pets: dict[int, dict] = {}
+        self.orders: dict[int, dict] = {}
+        self.users: dict[str, dict] = {}
+        self._next_id = 1
+        self._lock = threading.RLock()
+    
+    def reset(self) -> None:
+        """Drop all stored entities."""
+        with self._lock:
+            self.pets.clear()
+            self.orders.clear()
+            self.users.clear()
+    
+    def _new_id(self) -> int:
+        with self._lock:
+            self._next_id += 1
+            return 9_000_000_000 + self._next_id
+    
+    # Pet
+    
+    def addPet(self, params: dict, body: Any) -> HandlerResult:
+        pet = dict(body)
+        pet.setdefault("id", self._new_id())
+        with self._lock:
+            self.pets[pet["id"]] = pet
+        return 200, pet, {}
+    
+    def updatePet(self, params: dict, body: Any) -> HandlerResult:
+        # The public Petstore upserts on PUT /pet
+        return self.addPet(params, body)
+    
+    def findPetsByStatus(self, params: dict, body: Any) -> HandlerResult:
+        statuses = set(params["status"])
+        with self._lock:
+            return 200, [p for p in self.pets.values() if p.get("status") in statuses], {}
+    
+    def findPetsByTags(self, params: dict, body: Any) -> HandlerResult:
+        tags = set(params["tags"])
+        with self._lock:
+            pets = [
+                p for p in self.pets.values()
+                if tags & {t.get("name") for t in p.get("tags", [])}
+            ]
+        return 200, pets, {}
+    
+    def getPetById(self, params: dict, body: Any) -> HandlerResult:
+        pet = self.pets.get(params["petId"])
+        if pet is None:
+            return 404, api_response(1, "Pet not found", "error"), {}
+        return 200, pet, {}
+    
+    def updatePetWithForm(self, params: dict, body: Any) -> HandlerResult:
+        pet_id = params["petId"]
+        with self._lock:
+            pet = self.pets.get(pet_id)
+            if pet is None:
+                return 404, api_response(404, "not found"), {}
+            for field in ("name", "status"):
+                if params.get(field):
+                    pet[field] = params[field]
+        return 200, api_response(200, str(pet_id)), {}
+    
+    def deletePet(self, params: dict, body: Any) -> HandlerResult:
+        pet_id = params["petId"]
+        with self._lock:
+            if self.pets.pop(pet_id, None) is None:
+                return 404, None, {}
+        return 200, api_response(200, str(pet_id)), {}
+    
+    def uploadFile(self, params: dict, body: Any) -> HandlerResult:
+        if params["petId"] not in self.pets:
+            return 404, api_response(404, "Pet not found", "error"), {}
+        return 200, api_response(200, "File uploaded"), {}
+    
+    # Store
+    
+    def getInventory(self, params: dict, body: Any) -> HandlerResult:
+        inventory: dict[str, int] = {}
+        with self._lock:
+            for pet in self.pets.values():
+                status = pet.get("status")
+                if status:
+                    inventory[status] = inventory.get(status, 0) + 1
+        return 200, inventory, {}
+    
+    def placeOrder(self, params: dict, body: Any) -> HandlerResult:
+        order = dict(body)
+        order.setdefault("id", self._new_id())
+        order.setdefault("complete", False)
+        with self._lock:
+            self.orders[order["id"]] = order
+        return 200, order, {}
+    
+    def getOrderById(self, params: dict, body: Any) -> HandlerResult:
+        order = self.orders.get(params["orderId"])
+        if order is None:
+            return 404, api_response(1, "Order not found", "error"), {}
+        return 200, order, {}
+    
+    def deleteOrder(self, params: dict, body: Any) -> HandlerResult:
+        order_id = params["orderId"]
+        with self._lock:
+            if self.orders.pop(order_id, None) is None:
+                return 404, api_response(404, "Order Not Found"), {}
+        return 200, api_response(200, str(order_id)), {}
+    
+    # User
+    
+    def createUser(self, params: dict, body: Any) -> HandlerResult:
+        user = dict(body)
+        user.setdefault("id", self._new_id())
+        with self._lock:
+            self.users[user.get("username")] = user
+        return 200, api_response(200, str(user["id"])), {}
+    
+    def createUsersWithArrayInput(self, params: dict, body: Any) -> HandlerResult:
+        for user in body:
+            self.createUser(params, user)
+        return 200, api_response(200, "ok"), {}
+    
+    def createUsersWithListInput(self, params: dict, body: Any) -> HandlerResult:
+        return self.createUsersWithArrayInput(params, body)
+    
+    def getUserByName(self, params: dict, body: Any) -> HandlerResult:
+        user = self.users.get(params["username"])
+        if user is None:
+            return 404, api_response(1, "User not found", "error"), {}
+        return 200, user, {}
+    
+    def updateUser(self, params: dict, body: Any) -> HandlerResult:
+        username = params["username"]
+        with self._lock:
+            if username not in self.users:
+                return 404, api_response(404, "User not found", "error"), {}
+            user = dict(body)
+            user.setdefault("id", self.users[username].get("id"))
+            self.users.pop(username)
+            self.users[user.get("username", username)] = user
+        return 200, api_response(200, str(user["id"])), {}
+    
+    def deleteUser(self, params: dict, body: Any) -> HandlerResult:
+        username = params["username"]
+        with self._lock:
+            if self.users.pop(username, None) is None:
+                return 404, None, {}
+        return 200, api_response(200, username), {}
+    
+    def loginUser(self, params: dict, body: Any) -> HandlerResult:
+        headers = {
+            "X-Rate-Limit": "5000",
+            "X-Expires-After": (datetime.now(timezone.utc) + timedelta(hours=1)).isoformat(),
+        }
+        return 200, f"logged in user session:{self._new_id()}", headers
+    
+    def logoutUser(self, params: dict, body: Any) -> HandlerResult:
+        return 200, api_response(200, "ok"), {}
+
+
+class LocalPetstoreServer:
+    """
+    Local HTTP server serving the Petstore API from swagger.json.
+    
+    Routes, path/query/form parameters and request bodies are taken from
+    the spec's paths and definitions; entities live in memory.
+    
+    Usage:
+        with LocalPetstoreServer() as server:
+            client = APIClient(base_url=server.base_url)
+            
+    Or standalone:
+        python -m src.local_server --port 8080
+    """
+    
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        validator: Optional[SwaggerSchemaValidator] = None
+    ):
+        """
+        Initialize the server (call start() to begin serving).
+        
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            validator: Schema validator providing the spec (default singleton)
+        """
+        self.validator = validator or get_schema_validator()
+        self.state = PetstoreState()
+        self.base_path = self.validator.spec.get("basePath", "")
+        self.routes = self._build_routes()
+        
+        self._httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def base_url(self) -> str:
+        """Base URL including the spec basePath (e.g. http://127.0.0.1:8080/v2)."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{self.base_path}"
+    
+    def _build_routes(self) -> list[Route]:
+        """Create routes for every spec operation that has a handler."""
+        routes = []
+        for path, path_item in self.validator.paths.items():
+            for method, operation in path_item.items():
+                route = Route(path, method, operation, self.base_path)
+                if hasattr(self.state, route.operation_id):
+                    routes.append(route)
+                else:
+                    logger.warning(f"No local handler for {route.method} {path}")
+        
+        # Static segments win over templates (/pet/findByStatus vs /pet/{petId})
+        routes.sort(key=lambda r: r.param_count)
+        return routes
+    
+    def match(self, method: str, path: str) -> tuple[Optional[Route], dict]:
+        """Find the route for a request path."""
+        for route in self.routes:
+            if route.method != method:
+                continue
+            found = route.pattern.match(path)
+            if found:
+                return route, found.groupdict()
+        return None, {}
+    
+    def _parse_params(self, route: Route, path_args: dict, query: dict, form: dict, headers) -> dict:
+        """Collect and coerce the operation's declared parameters."""
+        params = {}
+        
+        for param in route.parameters:
+            location, name = param.get("in"), param.get("name")
+            
+            if location == "path":
+                raw = path_args.get(name)
+            elif location == "query":
+                raw = query.get(name)
+            elif location == "formData":
+                raw = form.get(name)
+            elif location == "header":
+                raw = headers.get(name)
+            else:
+                continue
+            
+            if isinstance(raw, list) and param.get("type") != "array":
+                raw = raw[0] if raw else None
+            
+            if raw is None:
+                if param.get("required"):
+                    raise RequestError(400, f"Missing required parameter: {name}")
+                continue
+            
+            params[name] = self._coerce(param, raw)
+        
+        return params
+    
+    def _coerce(self, param: dict, raw: Union[str, list]) -> Any:
+        """Convert a raw parameter to its spec type and check bounds."""
+        name = param.get("name")
+        
+        if param.get("type") == "array":
+            return raw if isinstance(raw, list) else [raw]
+        
+        if param.get("type") != "integer":
+            return raw
+        
+        try:
+            value = int(raw)
+        except ValueError:
+            raise RequestError(400, f"Invalid ID supplied: {name}={raw}")
+        
+        if "minimum" in param and value < param["minimum"]:
+            raise RequestError(400, f"Invalid ID supplied: {name} < {param['minimum']}")
+        if "maximum" in param and value > param["maximum"]:
+            raise RequestError(400, f"Invalid ID supplied: {name} > {param['maximum']}")
+        
+        return value
+    
+    def handle(self, method: str, target: str, headers, raw_body: bytes) -> HandlerResult:
+        """
+        Dispatch one request to its operation handler.
+        
+        Args:
+            method: HTTP method
+            target: Request target (path and query string)
+            headers: Request headers
+            raw_body: Request body bytes
+            
+        Returns:
+            Tuple of (status code, JSON body, extra headers)
+        """
+        url = urlsplit(target)
+        route, path_args = self.match(method, url.path)
+        
+        if route is None:
+            return 404, api_response(404, "not found"), {}
+        
+        content_type = headers.get("Content-Type", "")
+        form = parse_qs(raw_body.decode("utf-8")) if "x-www-form-urlencoded" in content_type else {}
+        
+        try:
+            params = self._parse_params(route, path_args, parse_qs(url.query), form, headers)
+            body = self._parse_body(route, raw_body)
+        except RequestError as e:
+            return e.status, api_response(e.status, e.message), {}
+        
+        handler: Callable[[dict, Any], HandlerResult] = getattr(self.state, route.operation_id)
+        return handler(params, body)
+    
+    def _parse_body(self, route: Route, raw_body: bytes) -> Any:
+        """Decode and validate a JSON body against the body parameter schema."""
+        if not any(p.get("in") == "body" for p in route.parameters):
+            return None
+        
+        try:
+            body = json.loads(raw_body or b"null")
+        except ValueError:
+            raise RequestError(400, "Invalid JSON body")
+        
+        is_valid, error = self.validator.validate_request(body, route.path, route.method)
+        if body is None or not is_valid:
+            raise RequestError(route.error_status(), f"bad input: {error}")
+        
+        return body
+    
+    def _make_handler(self) -> type:
+        """Create the request handler class bound to this server."""
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body go out in separate writes; with Nagle on, the body
+            # waits for the client's delayed ACK (~40 ms) on keep-alive connections
+            disable_nagle_algorithm = True
+            
+            def _dispatch(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw_body = self.rfile.read(length) if length else b""
+                
+                status, body, extra_headers = server.handle(
+                    self.command, self.path, self.headers, raw_body
+                )
+                payload = json.dumps(body).encode("utf-8") if body is not None else b""
+                
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in extra_headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = _dispatch
+            
+            def log_message(self, format: str, *args) -> None:
+                logger.debug("local server: " + format, *args)
+        
+        return Handler
+    
+    def start(self) -> "LocalPetstoreServer":
+        """Start serving on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="local-petstore", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Local Petstore server started at {self.base_url}")
+        return self
+    
+    def stop(self) -> None:
+        """Stop serving and release the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        logger.info("Local Petstore server stopped")
+    
+    def __enter__(self) -> "LocalPetstoreServer":
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """Run the local Petstore server until interrupted."""
+    parser = argparse.ArgumentParser(description="Local Petstore stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument(
+        "--swagger",
+        default=str(Path(__file__).parent.parent / "schemas" / "swagger.json"),
+        help="Path to swagger.json"
+    )
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    
+    server = LocalPetstoreServer(args.host, args.port, SwaggerSchemaValidator(args.swagger))
+    print(f"Serving Petstore at {server.base_url} (Ctrl+C to stop)")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 """Pydantic models for API entities."""
+from .base import FactoryModel, set_factory_validation
+from .ids import IdAllocator, get_id_allocator, get_random, seed_factories
 from .pet import Pet, Category, Tag, PetStatus
 from .store import Order, OrderStatus
 from .user import User, ApiResponse
@@ -12,5 +14,11 @@ __all__ = [
     "OrderStatus",
     "User",
     "ApiResponse",
+    "FactoryModel",
+    "set_factory_validation",
+    "IdAllocator",
+    "get_id_allocator",
+    "get_random",
+    "seed_factories",
 ]
 
@@ -0,0 +1,66 @@
+"""Base model for entities built by test-data factories."""
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+
+# Re-enables full pydantic validation in factories (debugging aid)
+_factory_validation = False
+
+
+def set_factory_validation(enabled: bool) -> None:
+    """
+    Enable or disable pydantic validation of factory-built models.
+    
+    Args:
+        enabled: Validate every model built by a factory (slow, for debugging)
+    """
+    global _factory_validation
+    _factory_validation = enabled
+
+
+def factory_validation_enabled() -> bool:
+    """Check whether factory-built models are validated."""
+    return _factory_validation
+
+
+class FactoryModel(BaseModel):
+    """
+    Model whose factories trust the data they generate.
+    
+    Factories build instances with model_construct(), skipping validation
+    of values they just produced themselves. Caller-supplied arguments are
+    not trusted: if any is given, the instance is fully validated so that
+    strings become enums and dicts become nested models.
+    set_factory_validation(True) validates every instance. to_payload()
+    returns the JSON-ready request body.
+    
+    Usage:
+        pet_data = Pet.create().to_payload()
+    """
+    
+    @classmethod
+    def _trusted(cls, given: Iterable[Any] = (), /, **fields):
+        """
+        Build an instance from factory field values.
+        
+        Args:
+            given: The factory's caller-supplied arguments; any that is not
+                None makes the instance go through full validation
+            **fields: Field values by alias
+            
+        Returns:
+            Model instance
+        """
+        if _factory_validation or any(value is not None for value in given):
+            return cls(**fields)
+        return cls.model_construct(**fields)
+    
+    def to_payload(self) -> dict:
+        """
+        Serialize to a request payload.
+        
+        Returns:
+            JSON-ready dict by alias, without None fields
+        """
+        return self.model_dump(mode="json", by_alias=True, exclude_none=True)
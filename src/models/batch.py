@@ -0,0 +1,26 @@
+"""Column generators for bulk test-data factories."""
+import random
+from typing import Sequence
+
+
+def random_strings(rng: random.Random, n: int, length: int, alphabet: Sequence[str]) -> list[str]:
+    """
+    Generate n random strings with a single draw of n * length characters.
+    
+    Args:
+        rng: Random generator (seeded for reproducible batches)
+        n: Number of strings
+        length: Length of each string
+        alphabet: Characters to draw from
+        
+    Returns:
+        List of n strings
+    """
+    chars = "".join(rng.choices(alphabet, k=n * length))
+    return [chars[i:i + length] for i in range(0, n * length, length)]
+
+
+def random_ints(rng: random.Random, n: int, low: int, high: int) -> list[int]:
+    """Generate n random integers in the inclusive range [low, high]."""
+    return rng.choices(range(low, high + 1), k=n)
+
@@ -0,0 +1,129 @@
+"""Seedable, collision-free ID allocation for test-data factories."""
+import random
+import threading
+from typing import Optional
+
+from src.parallel import get_worker_index, worker_id_range
+
+
+class IdAllocator:
+    """
+    Hands out entity IDs that never collide within a run.
+    
+    Every ID range (e.g. pet IDs 1000-9999) is split into disjoint parts,
+    one per xdist worker. Within a worker a counter walks its part
+    monotonically, under a lock so concurrent threads never receive the
+    same ID, starting at an offset derived from the seed. Once the part is
+    exhausted it wraps around (reusing IDs of entities that are expected to
+    be deleted by then), or raises with wrap=False. Non-ID fields are drawn from `random`,
+    which is seeded from the same seed and the worker index, so a failing
+    run can be replayed with its seed.
+    
+    Usage:
+        allocator = IdAllocator(seed=42)
+        pet_id = allocator.next_id(1000, 9999)
+        name = "".join(allocator.random.choices("abc", k=6))
+    """
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Initialize the allocator.
+        
+        Args:
+            seed: Seed for ID offsets and random fields (random if not provided)
+        """
+        self._lock = threading.Lock()
+        self.reseed(seed)
+    
+    def reseed(self, seed: Optional[int] = None) -> int:
+        """
+        Restart all ID counters and the random generator from a seed.
+        
+        Args:
+            seed: New seed (random if not provided)
+            
+        Returns:
+            The seed in use
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        
+        with self._lock:
+            self.seed = seed
+            self.random = random.Random(f"{seed}:{get_worker_index()}")
+            self._counters: dict[tuple[int, int], list[int]] = {}
+        return seed
+    
+    def _counter(self, low: int, high: int) -> list[int]:
+        """Get [start, size, offset, used] of this worker's part of a range (caller holds the lock)."""
+        counter = self._counters.get((low, high))
+        if counter is None:
+            start, end = worker_id_range(low, high)
+            size = end - start + 1
+            # Offset depends only on the seed and the range, not on call order
+            offset = random.Random(f"{self.seed}:{start}:{end}").randrange(size)
+            counter = self._counters[(low, high)] = [start, size, offset, 0]
+        return counter
+    
+    def next_ids(self, low: int, high: int, n: int, wrap: bool = True) -> list[int]:
+        """
+        Allocate n consecutive IDs from the current worker's part of [low, high].
+        
+        Args:
+            low: Lowest ID of the full range
+            high: Highest ID of the full range
+            n: Number of IDs
+            wrap: Whether to start over once the worker's part is exhausted
+            
+        Returns:
+            List of IDs (they repeat only when the worker's part is exhausted)
+            
+        Raises:
+            RuntimeError: If wrap is False and the worker's part has fewer than n IDs left
+            ValueError: If the range cannot be split between the xdist workers
+        """
+        with self._lock:
+            counter = self._counter(low, high)
+            start, size, offset, used = counter
+            if not wrap and used + n > size:
+                raise RuntimeError(
+                    f"ID range {start}-{start + size - 1} is exhausted ({used} of {size} IDs used)"
+                )
+            counter[3] = used + n
+        return [start + (offset + used + i) % size for i in range(n)]
+    
+    def next_id(self, low: int, high: int, wrap: bool = True) -> int:
+        """Allocate the next ID from the current worker's part of [low, high]."""
+        return self.next_ids(low, high, 1, wrap)[0]
+
+
+# Shared by all factories in src.models
+_allocator = IdAllocator()
+
+
+def get_id_allocator() -> IdAllocator:
+    """Get the process-wide allocator used by the model factories."""
+    return _allocator
+
+
+def seed_factories(seed: Optional[int] = None) -> int:
+    """
+    Reseed the model factories, e.g. to reproduce a failing run.
+    
+    Args:
+        seed: Run seed (random if not provided)
+        
+    Returns:
+        The seed in use
+    """
+    return _allocator.reseed(seed)
+
+
+def next_id(low: int, high: int, wrap: bool = True) -> int:
+    """Allocate the next ID from the current worker's part of [low, high]."""
+    return _allocator.next_id(low, high, wrap)
+
+
+def get_random() -> random.Random:
+    """Get the seeded random generator for non-ID factory fields."""
+    return _allocator.random
@@ -4,7 +4,11 @@ import string
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from .base import FactoryModel
+from .batch import random_ints, random_strings
+from .ids import get_id_allocator, get_random, next_id
 
 
 class PetStatus(str, Enum):
@@ -14,7 +18,7 @@ class PetStatus(str, Enum):
     SOLD = "sold"
 
 
-class Category(BaseModel):
+class Category(FactoryModel):
     """Pet category model."""
     id: Optional[int] = None
     name: Optional[str] = None
@@ -22,13 +26,14 @@ class Category(BaseModel):
     @classmethod
     def create(cls, id: Optional[int] = None, name: Optional[str] = None) -> "Category":
         """Factory method to create a Category instance."""
-        return cls(
-            id=id or random.randint(1, 100),
-            name=name or f"category_{''.join(random.choices(string.ascii_lowercase, k=6))}"
+        return cls._trusted(
+            (id, name),
+            id=id or next_id(1, 100),
+            name=name or f"category_{''.join(get_random().choices(string.ascii_lowercase, k=6))}"
         )
 
 
-class Tag(BaseModel):
+class Tag(FactoryModel):
     """Pet tag model."""
     id: Optional[int] = None
     name: Optional[str] = None
@@ -36,13 +41,14 @@ class Tag(BaseModel):
     @classmethod
     def create(cls, id: Optional[int] = None, name: Optional[str] = None) -> "Tag":
         """Factory method to create a Tag instance."""
-        return cls(
-            id=id or random.randint(1, 100),
-            name=name or f"tag_{''.join(random.choices(string.ascii_lowercase, k=6))}"
+        return cls._trusted(
+            (id, name),
+            id=id or next_id(1, 100),
+            name=name or f"tag_{''.join(get_random().choices(string.ascii_lowercase, k=6))}"
         )
 
 
-class Pet(BaseModel):
+class Pet(FactoryModel):
     """Pet model with required fields validation."""
     id: Optional[int] = None
     category: Optional[Category] = None
@@ -75,21 +81,72 @@ class Pet(BaseModel):
         Returns:
             Pet instance with test data
         """
-        return cls(
-            id=id or random.randint(1000, 9999),
-            name=name or f"pet_{''.join(random.choices(string.ascii_lowercase, k=6))}",
-            photoUrls=photo_urls or [f"https://example.com/photo_{random.randint(1, 100)}.jpg"],
+        rng = get_random()
+        return cls._trusted(
+            (id, name, photo_urls, category, tags, status),
+            id=id or next_id(1000, 9999),
+            name=name or f"pet_{''.join(rng.choices(string.ascii_lowercase, k=6))}",
+            photoUrls=photo_urls or [f"https://example.com/photo_{rng.randint(1, 100)}.jpg"],
             category=category or Category.create(),
             tags=tags or [Tag.create()],
             status=status or PetStatus.AVAILABLE
         )
     
+    @classmethod
+    def create_batch(
+        cls,
+        n: int,
+        seed: Optional[int] = None,
+        status: Optional[PetStatus] = None
+    ) -> list[dict]:
+        """
+        Generate many JSON-ready pet payloads without building models.
+        
+        Every field is generated as a column in one draw, so this is much
+        faster than calling create() n times. IDs come from the shared
+        allocator; the same seed always yields the same other fields.
+        
+        Args:
+            n: Number of pets
+            seed: Random seed (run seed if not provided)
+            status: Pet status for all pets (available if not provided)
+            
+        Returns:
+            List of dicts shaped like create().to_payload()
+        """
+        rng = random.Random(seed) if seed is not None else get_random()
+        status = (status or PetStatus.AVAILABLE).value
+        
+        ids = get_id_allocator().next_ids(1000, 9999, n)
+        names = random_strings(rng, n, 6, string.ascii_lowercase)
+        photos = random_ints(rng, n, 1, 100)
+        category_ids = random_ints(rng, n, 1, 100)
+        category_names = random_strings(rng, n, 6, string.ascii_lowercase)
+        tag_ids = random_ints(rng, n, 1, 100)
+        tag_names = random_strings(rng, n, 6, string.ascii_lowercase)
+        
+        return [
+            {
+                "id": pet_id,
+                "category": {"id": category_id, "name": f"category_{category_name}"},
+                "name": f"pet_{name}",
+                "photoUrls": [f"https://example.com/photo_{photo}.jpg"],
+                "tags": [{"id": tag_id, "name": f"tag_{tag_name}"}],
+                "status": status,
+            }
+            for pet_id, name, photo, category_id, category_name, tag_id, tag_name in zip(
+                ids, names, photos, category_ids, category_names, tag_ids, tag_names
+            )
+        ]
+    
     @classmethod
     def create_minimal(cls, name: Optional[str] = None) -> "Pet":
         """Create a Pet with only required fields."""
-        return cls(
-            name=name or f"pet_{''.join(random.choices(string.ascii_lowercase, k=6))}",
-            photoUrls=[f"https://example.com/photo_{random.randint(1, 100)}.jpg"]
+        rng = get_random()
+        return cls._trusted(
+            (name,),
+            name=name or f"pet_{''.join(rng.choices(string.ascii_lowercase, k=6))}",
+            photoUrls=[f"https://example.com/photo_{rng.randint(1, 100)}.jpg"]
         )
     
     @classmethod
@@ -4,7 +4,18 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel
+from .base import FactoryModel
+from .batch import random_ints
+from .ids import get_id_allocator, get_random, next_id
+
+
+# The API only accepts order IDs 1-10. IDs 1 and 10 are left to the boundary
+# tests; the rest is split so orders reserved by the session pool and orders
+# placed by tests never share an ID. Each part is further split between xdist
+# workers, so order tests support at most 4 workers (more raise ValueError).
+ORDER_ID_RANGE = (1, 10)
+POOL_ORDER_IDS = (2, 5)
+TEST_ORDER_IDS = (6, 9)
 
 
 class OrderStatus(str, Enum):
@@ -14,7 +25,7 @@ class OrderStatus(str, Enum):
     DELIVERED = "delivered"
 
 
-class Order(BaseModel):
+class Order(FactoryModel):
     """Order model for pet store orders."""
     id: Optional[int] = None
     petId: Optional[int] = None
@@ -47,30 +58,77 @@ class Order(BaseModel):
         Returns:
             Order instance with test data
         """
-        return cls(
-            id=id or random.randint(1, 10),  # Valid range per API spec is 1-10
-            petId=pet_id or random.randint(1000, 9999),
-            quantity=quantity or random.randint(1, 5),
+        rng = get_random()
+        return cls._trusted(
+            (id, pet_id, quantity, ship_date, status, complete),
+            id=id or next_id(*TEST_ORDER_IDS),
+            petId=pet_id or rng.randint(1000, 9999),
+            quantity=quantity or rng.randint(1, 5),
             shipDate=ship_date or datetime.now(timezone.utc).isoformat(),
             status=status or OrderStatus.PLACED,
             complete=complete if complete is not None else False
         )
     
+    @classmethod
+    def create_batch(
+        cls,
+        n: int,
+        seed: Optional[int] = None,
+        status: Optional[OrderStatus] = None,
+        ship_date: Optional[str] = None
+    ) -> list[dict]:
+        """
+        Generate many JSON-ready order payloads without building models.
+        
+        Every field is generated as a column in one draw. Order IDs come
+        from the shared allocator's TEST_ORDER_IDS part and repeat when n
+        exceeds it. The same seed always yields the same other fields.
+        
+        Args:
+            n: Number of orders
+            seed: Random seed (run seed if not provided)
+            status: Order status for all orders (placed if not provided)
+            ship_date: Ship date for all orders (now if not provided)
+            
+        Returns:
+            List of dicts shaped like create().to_payload()
+        """
+        rng = random.Random(seed) if seed is not None else get_random()
+        status = (status or OrderStatus.PLACED).value
+        ship_date = ship_date or datetime.now(timezone.utc).isoformat()
+        
+        ids = get_id_allocator().next_ids(*TEST_ORDER_IDS, n)
+        pet_ids = random_ints(rng, n, 1000, 9999)
+        quantities = random_ints(rng, n, 1, 5)
+        
+        return [
+            {
+                "id": order_id,
+                "petId": pet_id,
+                "quantity": quantity,
+                "shipDate": ship_date,
+                "status": status,
+                "complete": False,
+            }
+            for order_id, pet_id, quantity in zip(ids, pet_ids, quantities)
+        ]
+    
     @classmethod
     def create_minimal(cls) -> "Order":
         """Create an Order with minimal data."""
-        return cls(
-            id=random.randint(1, 10),
-            petId=random.randint(1000, 9999),
+        return cls._trusted(
+            id=next_id(*TEST_ORDER_IDS),
+            petId=get_random().randint(1000, 9999),
             quantity=1
         )
     
     @classmethod
     def create_with_invalid_id(cls, invalid_id: int = 0) -> "Order":
         """Create an Order with invalid ID (outside 1-10 range)."""
-        return cls(
+        return cls._trusted(
+            (invalid_id,),
             id=invalid_id,
-            petId=random.randint(1000, 9999),
+            petId=get_random().randint(1000, 9999),
             quantity=1,
             status=OrderStatus.PLACED
         )
@@ -5,8 +5,12 @@ from typing import Optional
 
 from pydantic import BaseModel
 
+from .base import FactoryModel
+from .batch import random_ints, random_strings
+from .ids import get_id_allocator, get_random, next_id
 
-class User(BaseModel):
+
+class User(FactoryModel):
     """User model for pet store users."""
     id: Optional[int] = None
     username: Optional[str] = None
@@ -45,24 +49,73 @@ class User(BaseModel):
         Returns:
             User instance with test data
         """
-        random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
+        rng = get_random()
+        random_suffix = ''.join(rng.choices(string.ascii_lowercase + string.digits, k=6))
         
-        return cls(
-            id=id or random.randint(10000, 99999),
+        return cls._trusted(
+            (id, username, first_name, last_name, email, password, phone, user_status),
+            id=id or next_id(10000, 99999),
             username=username or f"user_{random_suffix}",
             firstName=first_name or f"First_{random_suffix}",
             lastName=last_name or f"Last_{random_suffix}",
             email=email or f"user_{random_suffix}@example.com",
             password=password or f"pass_{random_suffix}",
-            phone=phone or f"+1-555-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
+            phone=phone or f"+1-555-{rng.randint(100, 999)}-{rng.randint(1000, 9999)}",
             userStatus=user_status or 1
         )
     
+    @classmethod
+    def create_batch(cls, n: int, seed: Optional[int] = None) -> list[dict]:
+        """
+        Generate many JSON-ready user payloads without building models.
+        
+        Every field is generated as a column in one draw; IDs come from the
+        shared allocator and usernames are unique within the batch. The same
+        seed always yields the same other fields.
+        
+        Args:
+            n: Number of users
+            seed: Random seed (run seed if not provided)
+            
+        Returns:
+            List of dicts shaped like create().to_payload()
+        """
+        rng = random.Random(seed) if seed is not None else get_random()
+        alphabet = string.ascii_lowercase + string.digits
+        
+        ids = get_id_allocator().next_ids(10000, 99999, n)
+        suffixes = random_strings(rng, n, 6, alphabet)
+        phone_prefixes = random_ints(rng, n, 100, 999)
+        phone_lines = random_ints(rng, n, 1000, 9999)
+        
+        # Redraw the rare duplicate suffixes so usernames stay unique
+        seen: set[str] = set()
+        for i, suffix in enumerate(suffixes):
+            while suffix in seen:
+                suffix = random_strings(rng, 1, 6, alphabet)[0]
+            suffixes[i] = suffix
+            seen.add(suffix)
+        
+        return [
+            {
+                "id": user_id,
+                "username": f"user_{suffix}",
+                "firstName": f"First_{suffix}",
+                "lastName": f"Last_{suffix}",
+                "email": f"user_{suffix}@example.com",
+                "password": f"pass_{suffix}",
+                "phone": f"+1-555-{prefix}-{line}",
+                "userStatus": 1,
+            }
+            for user_id, suffix, prefix, line in zip(ids, suffixes, phone_prefixes, phone_lines)
+        ]
+    
     @classmethod
     def create_minimal(cls, username: Optional[str] = None) -> "User":
         """Create a User with minimal data."""
-        random_suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=6))
-        return cls(
+        random_suffix = ''.join(get_random().choices(string.ascii_lowercase + string.digits, k=6))
+        return cls._trusted(
+            (username,),
             username=username or f"user_{random_suffix}"
         )
     
@@ -0,0 +1,51 @@
+"""Helpers for running the suite in parallel with pytest-xdist."""
+import os
+
+
+def get_worker_id() -> str:
+    """Get the xdist worker id ("gw0", "gw1", ...) or "main" outside xdist."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def get_worker_count() -> int:
+    """Get the number of xdist workers (1 outside xdist)."""
+    return max(int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1")), 1)
+
+
+def get_worker_index() -> int:
+    """Get the 0-based index of the current xdist worker (0 outside xdist)."""
+    worker_id = get_worker_id()
+    return int(worker_id[2:]) if worker_id.startswith("gw") else 0
+
+
+def is_xdist_worker() -> bool:
+    """Check whether the current process is an xdist worker."""
+    return "PYTEST_XDIST_WORKER" in os.environ
+
+
+def worker_id_range(low: int, high: int) -> tuple[int, int]:
+    """
+    Get the slice of an inclusive ID range reserved for the current worker.
+    
+    The range is split into equal disjoint parts, one per worker, so
+    entities created by different workers never share an ID.
+    
+    Args:
+        low: Lowest ID of the full range
+        high: Highest ID of the full range
+        
+    Returns:
+        Inclusive (low, high) bounds for this worker
+        
+    Raises:
+        ValueError: If the range has fewer IDs than there are workers
+    """
+    count = get_worker_count()
+    size = (high - low + 1) // count
+    if size < 1:
+        raise ValueError(
+            f"ID range {low}-{high} cannot be split between {count} xdist workers without collisions"
+        )
+    
+    start = low + get_worker_index() * size
+    return start, start + size - 1
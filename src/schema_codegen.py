@@ -0,0 +1,310 @@
+"""Generate specialized Python validation functions from resolved Swagger schemas."""
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the generated code changes so cached modules are regenerated
+GENERATOR_VERSION = 1
+
+# Draft 4 type checks; bool is not an integer/number in JSON Schema
+_TYPE_CHECKS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+}
+
+# Annotations that do not affect validation (format is not checked by Draft4Validator either)
+_IGNORED_KEYWORDS = {"description", "example", "xml", "format", "title", "default", "readOnly", "externalDocs"}
+
+_PRELUDE = '''\
+def _equal(a, b):
+    """JSON equality: booleans never equal numbers."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    return a == b
+
+
+def _in_enum(value, options):
+    return any(_equal(value, option) for option in options)
+'''
+
+
+class CompiledError(NamedTuple):
+    """Schema violation reported by a generated validator (same fields as ValidationError)."""
+    path: Tuple[Any, ...]
+    message: str
+
+
+class CompiledValidator:
+    """
+    Drop-in replacement for Draft4Validator backed by a generated function.
+    
+    Only iter_errors() is needed by SwaggerSchemaValidator; errors carry
+    the same path and message as jsonschema's, so formatted results match.
+    """
+    
+    __slots__ = ("schema", "_validate")
+    
+    def __init__(self, schema: Any, validate: Callable[[Any], Iterator[Tuple[tuple, str]]]):
+        self.schema = schema
+        self._validate = validate
+    
+    def iter_errors(self, data: Any) -> Iterator[CompiledError]:
+        """Yield schema violations of data in jsonschema's order."""
+        for path, message in self._validate(data):
+            yield CompiledError(path, message)
+    
+    def is_valid(self, data: Any) -> bool:
+        """Check data without collecting errors (stops at the first one)."""
+        return next(self._validate(data), None) is None
+
+
+class UnsupportedSchema(Exception):
+    """Raised for schemas using keywords the generator does not handle."""
+
+
+def schema_key(schema: Any) -> str:
+    """Canonical JSON of a schema, used to look up its generated function."""
+    return json.dumps(schema, sort_keys=True, separators=(",", ":"))
+
+
+class _FunctionBuilder:
+    """Emits the body of one validation function."""
+    
+    def __init__(self, constants: list[str]):
+        self.lines: list[str] = []
+        self.constants = constants
+        self._names = 0
+    
+    def _name(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+    
+    def _constant(self, code: str) -> str:
+        name = f"_C{len(self.constants)}"
+        self.constants.append(f"{name} = {code}")
+        return name
+    
+    def emit(self, schema: Any, var: str, path: list[str], indent: int) -> None:
+        """Emit checks of var against schema, following jsonschema's keyword order."""
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema(f"Schema is not an object: {schema!r}")
+        
+        pad = "    " * indent
+        path_expr = f"({', '.join(path)},)" if path else "()"
+        
+        for keyword, value in schema.items():
+            if keyword in _IGNORED_KEYWORDS:
+                continue
+            
+            if keyword == "type":
+                types = value if isinstance(value, list) else [value]
+                if any(t not in _TYPE_CHECKS for t in types):
+                    raise UnsupportedSchema(f"Unsupported type: {value!r}")
+                check = " or ".join(_TYPE_CHECKS[t].format(v=var) for t in types)
+                message = f" is not of type {', '.join(repr(t) for t in types)}"
+                self.lines.append(f"{pad}if not ({check}):")
+                self.lines.append(f"{pad}    yield {path_expr}, repr({var}) + {message!r}")
+            
+            elif keyword == "required":
+                self.lines.append(f"{pad}if isinstance({var}, dict):")
+                for name in value:
+                    self.lines.append(f"{pad}    if {name!r} not in {var}:")
+                    self.lines.append(f"{pad}        yield {path_expr}, {f'{name!r} is a required property'!r}")
+                self.lines.append(f"{pad}    pass")
+            
+            elif keyword == "properties":
+                self.lines.append(f"{pad}if isinstance({var}, dict):")
+                for name, subschema in value.items():
+                    child = self._name("v")
+                    self.lines.append(f"{pad}    if {name!r} in {var}:")
+                    self.lines.append(f"{pad}        {child} = {var}[{name!r}]")
+                    self.emit(subschema, child, path + [repr(name)], indent + 2)
+                    self.lines.append(f"{pad}        pass")
+                self.lines.append(f"{pad}    pass")
+            
+            elif keyword == "items":
+                if not isinstance(value, dict):
+                    raise UnsupportedSchema("Tuple-typed items are not supported")
+                index, child = self._name("i"), self._name("v")
+                self.lines.append(f"{pad}if isinstance({var}, list):")
+                self.lines.append(f"{pad}    for {index}, {child} in enumerate({var}):")
+                self.emit(value, child, path + [index], indent + 2)
+                self.lines.append(f"{pad}        pass")
+            
+            elif keyword == "enum":
+                options = self._constant(repr(list(value)))
+                message = f" is not one of {list(value)!r}"
+                self.lines.append(f"{pad}if not _in_enum({var}, {options}):")
+                self.lines.append(f"{pad}    yield {path_expr}, repr({var}) + {message!r}")
+            
+            elif keyword == "additionalProperties":
+                if value is True or value == {}:
+                    continue
+                if not isinstance(value, dict):
+                    raise UnsupportedSchema("additionalProperties: false is not supported")
+                known = self._constant(f"frozenset({sorted(schema.get('properties', {}))!r})")
+                key, child = self._name("k"), self._name("v")
+                self.lines.append(f"{pad}if isinstance({var}, dict):")
+                self.lines.append(f"{pad}    for {key}, {child} in {var}.items():")
+                self.lines.append(f"{pad}        if {key} in {known}:")
+                self.lines.append(f"{pad}            continue")
+                self.emit(value, child, path + [key], indent + 2)
+                self.lines.append(f"{pad}        pass")
+            
+            else:
+                raise UnsupportedSchema(f"Unsupported keyword: {keyword}")
+
+
+def generate_source(schemas: Iterable[Any], spec_hash: str) -> str:
+    """
+    Generate a module with one validation function per distinct schema.
+    
+    Every function is a generator yielding (path, message) for each
+    violation, in the order jsonschema's Draft4Validator reports them.
+    Schemas the generator does not support are left out; callers fall
+    back to Draft4Validator for those.
+    
+    Args:
+        schemas: Fully resolved schemas (no $ref)
+        spec_hash: SHA-256 of the spec the schemas come from
+        
+    Returns:
+        Python source of the module
+    """
+    constants: list[str] = []
+    functions: list[str] = []
+    table: list[str] = []
+    seen: set[str] = set()
+    
+    for schema in schemas:
+        key = schema_key(schema)
+        if key in seen:
+            continue
+        seen.add(key)
+        
+        builder = _FunctionBuilder(constants)
+        mark = len(constants)
+        try:
+            builder.emit(schema, "data", [], 1)
+        except UnsupportedSchema as e:
+            del constants[mark:]
+            logger.debug(f"Not generating a validator: {e}")
+            continue
+        
+        name = f"_validate_{len(functions)}"
+        functions.append("\n".join([f"def {name}(data):", *builder.lines, "    return", "    yield"]))
+        table.append(f"    {key!r}: {name},")
+    
+    return "\n".join([
+        "# Generated by src/schema_codegen.py from the Swagger spec. Do not edit.",
+        f"SPEC_HASH = {spec_hash!r}",
+        f"GENERATOR_VERSION = {GENERATOR_VERSION}",
+        "",
+        "",
+        _PRELUDE,
+        "",
+        *constants,
+        "",
+        "",
+        "\n\n\n".join(functions),
+        "",
+        "",
+        "VALIDATORS = {",
+        *table,
+        "}",
+        "",
+    ])
+
+
+def load_validators(module_path: Path, spec_hash: str) -> Optional[Dict[str, Callable]]:
+    """
+    Import a generated module if it was built from this spec by this generator.
+    
+    The import goes through importlib, so the compiled bytecode is cached
+    in __pycache__ next to the module.
+    
+    Args:
+        module_path: Generated module file
+        spec_hash: SHA-256 of the current spec
+        
+    Returns:
+        Schema key -> validation function, or None if missing or stale
+    """
+    if not module_path.exists():
+        return None
+    
+    name = f"_swagger_validators_{hashlib.sha256(str(module_path).encode()).hexdigest()[:12]}"
+    try:
+        spec = importlib.util.spec_from_file_location(name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except Exception as e:
+        logger.warning(f"Could not import generated validators {module_path}: {e}")
+        return None
+    
+    if module.SPEC_HASH != spec_hash or module.GENERATOR_VERSION != GENERATOR_VERSION:
+        logger.debug(f"Generated validators are stale: {module_path}")
+        return None
+    return module.VALIDATORS
+
+
+def write_validators(module_path: Path, source: str) -> bool:
+    """
+    Write a generated module atomically (concurrent workers never see a partial file).
+    
+    Returns:
+        True if the module was written
+    """
+    tmp_path = module_path.with_name(f"{module_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(source, encoding="utf-8")
+        os.replace(tmp_path, module_path)
+        logger.debug(f"Saved generated validators: {module_path}")
+        return True
+    except OSError as e:
+        logger.warning(f"Could not write generated validators {module_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+        return False
+
+
+def build_validators(
+    schemas: Iterable[Any],
+    spec_hash: str,
+    module_path: Optional[Path] = None
+) -> Dict[str, Callable]:
+    """
+    Load the cached generated module, or generate (and cache) it.
+    
+    Args:
+        schemas: Fully resolved schemas to compile
+        spec_hash: SHA-256 of the spec the schemas come from
+        module_path: Where the generated module is cached (not cached if None)
+        
+    Returns:
+        Schema key -> validation function
+    """
+    if module_path is not None:
+        validators = load_validators(module_path, spec_hash)
+        if validators is not None:
+            return validators
+    
+    source = generate_source(schemas, spec_hash)
+    if module_path is not None and write_validators(module_path, source):
+        validators = load_validators(module_path, spec_hash)
+        if validators is not None:
+            return validators
+    
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, "<generated validators>", "exec"), namespace)
+    return namespace["VALIDATORS"]
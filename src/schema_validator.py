@@ -1,31 +1,203 @@
 """Schema validator for extracting and validating schemas from Swagger/OpenAPI specification."""
 import json
+import hashlib
 import logging
 import copy
+import os
+import pickle
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from jsonschema import Draft4Validator, ValidationError
 from jsonschema.exceptions import SchemaError
 
+from src.schema_codegen import CompiledValidator, build_validators, schema_key
+
 logger = logging.getLogger(__name__)
 
+# Cache key for compiled validators: (path template, method, status code)
+ValidatorCacheKey = Tuple[str, str, str]
+
+# Generated validator where available, jsonschema's interpreter otherwise
+SchemaValidator = Union[CompiledValidator, Draft4Validator]
+
+# Bump when the layout of the pickled spec cache changes
+SPEC_CACHE_VERSION = 1
+
+# Marks a validator cache miss (None is cached for operations without a schema)
+_MISSING = object()
+
+
+def _format_error(error: Any) -> str:
+    """Format a schema violation as "path: message" (just the message at the root)."""
+    return f"{'.'.join(str(p) for p in error.path)}: {error.message}" if error.path else error.message
+
+
+class ValidationErrors:
+    """
+    Schema violations found by one validation, formatted only when read.
+    
+    Holds the first error and the not yet consumed error iterator; the
+    remaining errors are collected and formatted on first access to
+    messages or str(). In fail-fast mode there is no iterator and only
+    the first error is reported. Read it from one thread at a time.
+    
+    Usage:
+        errors = schema_validator.check_response(data, "/pet/{petId}", "get")
+        if errors:
+            pytest.fail(f"Schema validation failed: {errors}")
+    """
+    
+    __slots__ = ("first", "_rest", "_messages")
+    
+    def __init__(self, first: Any, rest: Optional[Iterator[Any]] = None):
+        """
+        Initialize the error detail.
+        
+        Args:
+            first: First violation (jsonschema ValidationError or CompiledError)
+            rest: Iterator over the remaining violations (None in fail-fast mode)
+        """
+        self.first = first
+        self._rest = rest
+        self._messages: Optional[List[str]] = None
+    
+    @property
+    def messages(self) -> List[str]:
+        """Get the formatted message of every reported violation."""
+        if self._messages is None:
+            errors = [self.first, *(self._rest or ())]
+            self._rest = None
+            self._messages = [_format_error(e) for e in errors]
+        return self._messages
+    
+    def __str__(self) -> str:
+        return "; ".join(self.messages)
+    
+    def __repr__(self) -> str:
+        return f"ValidationErrors({_format_error(self.first)!r}, ...)"
+
+
+def _read_only(*args, **kwargs):
+    raise TypeError("Resolved schemas are read-only; use copy.deepcopy() to get a mutable copy")
+
+
+class ReadOnlyDict(dict):
+    """
+    Immutable dict used for shared resolved schemas.
+    
+    Subclasses dict so jsonschema treats it as a regular object schema.
+    """
+    
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = __ior__ = _read_only
+    
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+    
+    def __deepcopy__(self, memo: dict) -> Dict[str, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+    
+    def __reduce__(self):
+        return (ReadOnlyDict, (dict(self),))
+
+
+class ReadOnlyList(list):
+    """Immutable list used for shared resolved schemas."""
+    
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    
+    def __copy__(self) -> list:
+        return list(self)
+    
+    def __deepcopy__(self, memo: dict) -> list:
+        return [copy.deepcopy(item, memo) for item in self]
+    
+    def __reduce__(self):
+        return (ReadOnlyList, (list(self),))
+
+
+class SchemaIndex:
+    """
+    Fully resolved schemas of a Swagger spec, built once at load time.
+    
+    All schemas are ReadOnlyDict/ReadOnlyList structures shared between
+    callers, so lookups never copy.
+    """
+    
+    def __init__(
+        self,
+        definitions: Dict[str, Any],
+        requests: Dict[Tuple[str, str], Any],
+        responses: Dict[ValidatorCacheKey, Any]
+    ):
+        self.definitions = definitions
+        self.requests = requests
+        self.responses = responses
+
 
 class SwaggerSchemaValidator:
     """
     Validator for extracting schemas from Swagger 2.0 specification
     and validating API responses against them.
+    
+    Safe to share between threads without locks: the index is read-only,
+    cached validators are published with atomic dict operations (two
+    threads missing at once both compile, and one result wins), and
+    compiled validators hold fully resolved schemas, so validation never
+    touches the shared $ref resolver state. Hit/miss counters are
+    approximate under concurrency.
+    
+    With use_codegen, every indexed schema is compiled into a specialized
+    Python function (see src/schema_codegen.py) that is used instead of
+    jsonschema's interpreter; error messages are identical.
+    
+    With fail_fast, validation stops at the first violation and reports
+    only that one. The is_valid_* methods answer with a bare boolean and
+    the check_* methods return lazily formatted ValidationErrors; both
+    skip the logging and message building of the validate_* methods.
     """
     
-    def __init__(self, swagger_path: Union[str, Path]):
+    def __init__(
+        self,
+        swagger_path: Union[str, Path],
+        build_index: bool = True,
+        use_cache: bool = True,
+        cache_path: Optional[Union[str, Path]] = None,
+        use_codegen: bool = True,
+        fail_fast: bool = False
+    ):
         """
         Initialize the validator with a Swagger specification file.
         
         Args:
             swagger_path: Path to the swagger.json file
+            build_index: Whether to resolve all schemas once at load time
+            use_cache: Whether to load/store the parsed spec and index in an on-disk cache
+            cache_path: Cache file location (defaults to "<swagger_path>.cache")
+            use_codegen: Whether to validate with generated functions (requires build_index);
+                the generated module is cached next to the spec when use_cache is on
+            fail_fast: Whether validation reports only the first violation by default
         """
         self.swagger_path = Path(swagger_path)
+        self.build_index = build_index
+        self.use_cache = use_cache and build_index
+        self.cache_path = Path(cache_path) if cache_path else self.swagger_path.with_name(
+            f"{self.swagger_path.name}.cache"
+        )
+        self.use_codegen = use_codegen and build_index
+        self.codegen_path = self.cache_path.with_name(f"{self.swagger_path.name}.validators.py")
+        self.fail_fast = fail_fast
         self._spec: Optional[Dict[str, Any]] = None
+        self._index: Optional[SchemaIndex] = None
+        self._generated: Dict[str, Any] = {}
+        self._validator_cache: Dict[ValidatorCacheKey, Optional[SchemaValidator]] = {}
+        self._definition_validators: Dict[str, SchemaValidator] = {}
+        self._request_validators: Dict[Tuple[str, str], Optional[SchemaValidator]] = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
         self._load_spec()
     
     def _load_spec(self) -> None:
@@ -35,10 +207,116 @@ class SwaggerSchemaValidator:
         if not self.swagger_path.exists():
             raise FileNotFoundError(f"Swagger file not found: {self.swagger_path}")
         
-        with open(self.swagger_path, "r", encoding="utf-8") as f:
-            self._spec = json.load(f)
+        raw = self.swagger_path.read_bytes()
+        spec_hash = hashlib.sha256(raw).hexdigest()
+        
+        if self.use_cache and self._load_cache(spec_hash):
+            logger.info(f"Loaded Swagger spec from cache: {self.cache_path}")
+        else:
+            self._spec = json.loads(raw.decode("utf-8"))
+            
+            if self.build_index:
+                self._index = self._build_index()
+            
+            if self.use_cache:
+                self._save_cache(spec_hash)
+            
+            logger.info(f"Loaded Swagger spec: {self._spec.get('info', {}).get('title', 'Unknown')}")
         
-        logger.info(f"Loaded Swagger spec: {self._spec.get('info', {}).get('title', 'Unknown')}")
+        if self.use_codegen and self._index is not None:
+            self._load_generated_validators(spec_hash)
+    
+    def _load_generated_validators(self, spec_hash: str) -> None:
+        """
+        Load (or generate) specialized validation functions for all indexed schemas.
+        
+        Failures are logged and leave validation to Draft4Validator.
+        
+        Args:
+            spec_hash: SHA-256 of the current spec file contents
+        """
+        schemas = [
+            *self._index.definitions.values(),
+            *self._index.requests.values(),
+            *self._index.responses.values(),
+        ]
+        try:
+            self._generated = build_validators(
+                schemas, spec_hash, self.codegen_path if self.use_cache else None
+            )
+            logger.debug(f"Loaded {len(self._generated)} generated validators")
+        except Exception as e:
+            logger.warning(f"Could not generate validators, using jsonschema: {e}")
+            self._generated = {}
+    
+    def _compile(self, schema: Dict[str, Any]) -> SchemaValidator:
+        """Get the generated validator for a schema, or compile a Draft4Validator."""
+        if self._generated:
+            validate = self._generated.get(schema_key(schema))
+            if validate is not None:
+                return CompiledValidator(schema, validate)
+        return Draft4Validator(schema)
+    
+    def _load_cache(self, spec_hash: str) -> bool:
+        """
+        Load the parsed spec and schema index from the on-disk cache.
+        
+        Args:
+            spec_hash: SHA-256 of the current spec file contents
+            
+        Returns:
+            True if a cache entry for this spec was loaded
+        """
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached = pickle.load(f)
+            
+            # Older or foreign cache files are rebuilt rather than trusted
+            if (
+                not isinstance(cached, dict)
+                or cached.get("version") != SPEC_CACHE_VERSION
+                or cached.get("hash") != spec_hash
+            ):
+                logger.debug(f"Spec cache is stale: {self.cache_path}")
+                return False
+            
+            spec, index = cached["spec"], cached["index"]
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Could not read spec cache {self.cache_path}: {e}")
+            return False
+        
+        self._spec = spec
+        self._index = index
+        return True
+    
+    def _save_cache(self, spec_hash: str) -> None:
+        """
+        Store the parsed spec and schema index in the on-disk cache.
+        
+        Writes to a temporary file first so concurrent workers never read
+        a partially written cache.
+        
+        Args:
+            spec_hash: SHA-256 of the current spec file contents
+        """
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.{os.getpid()}.tmp")
+        payload = {
+            "version": SPEC_CACHE_VERSION,
+            "hash": spec_hash,
+            "spec": self._spec,
+            "index": self._index,
+        }
+        
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+            logger.debug(f"Saved spec cache: {self.cache_path}")
+        except OSError as e:
+            logger.warning(f"Could not write spec cache {self.cache_path}: {e}")
+            tmp_path.unlink(missing_ok=True)
     
     @property
     def spec(self) -> Dict[str, Any]:
@@ -84,9 +362,12 @@ class SwaggerSchemaValidator:
         """
         Recursively resolve all $ref references in a schema.
         
+        Builds new containers on the way down instead of deep-copying every
+        level, so the original spec is never modified.
+        
         Args:
             schema: Schema that may contain $ref references
-            visited: Set of already visited refs to prevent infinite recursion
+            visited: Set of refs on the current resolution path to prevent infinite recursion
             
         Returns:
             Schema with all references resolved
@@ -94,9 +375,6 @@ class SwaggerSchemaValidator:
         if visited is None:
             visited = set()
         
-        # Deep copy to avoid modifying the original
-        schema = copy.deepcopy(schema)
-        
         if isinstance(schema, dict):
             if "$ref" in schema:
                 ref = schema["$ref"]
@@ -104,25 +382,108 @@ class SwaggerSchemaValidator:
                 # Prevent infinite recursion
                 if ref in visited:
                     logger.warning(f"Circular reference detected: {ref}")
-                    return schema
+                    return copy.deepcopy(schema)
                 
                 visited.add(ref)
-                resolved = self._resolve_ref(ref)
-                return self._resolve_refs_recursively(resolved, visited)
+                try:
+                    return self._resolve_refs_recursively(self._resolve_ref(ref), visited)
+                finally:
+                    visited.discard(ref)
             
-            # Recursively resolve refs in nested structures
-            for key, value in schema.items():
-                if isinstance(value, dict):
-                    schema[key] = self._resolve_refs_recursively(value, visited.copy())
-                elif isinstance(value, list):
-                    schema[key] = [
-                        self._resolve_refs_recursively(item, visited.copy()) 
-                        if isinstance(item, dict) else item
-                        for item in value
-                    ]
+            return {
+                key: self._resolve_refs_recursively(value, visited)
+                for key, value in schema.items()
+            }
+        
+        if isinstance(schema, list):
+            return [self._resolve_refs_recursively(item, visited) for item in schema]
         
         return schema
     
+    def _resolve_shared(self, schema: Any, memo: Dict[str, Any], stack: set) -> Any:
+        """
+        Resolve $ref references into shared read-only structures.
+        
+        Each referenced schema is resolved once and the same object is reused
+        wherever it is referenced.
+        
+        Args:
+            schema: Schema that may contain $ref references
+            memo: Already resolved schemas keyed by ref
+            stack: Refs currently being resolved (cycle detection)
+            
+        Returns:
+            Resolved ReadOnlyDict/ReadOnlyList structure
+        """
+        if isinstance(schema, dict):
+            if "$ref" in schema:
+                ref = schema["$ref"]
+                
+                if ref in memo:
+                    return memo[ref]
+                
+                if ref in stack:
+                    logger.warning(f"Circular reference detected: {ref}")
+                    return ReadOnlyDict(schema)
+                
+                stack.add(ref)
+                try:
+                    resolved = self._resolve_shared(self._resolve_ref(ref), memo, stack)
+                finally:
+                    stack.discard(ref)
+                
+                memo[ref] = resolved
+                return resolved
+            
+            return ReadOnlyDict(
+                (key, self._resolve_shared(value, memo, stack))
+                for key, value in schema.items()
+            )
+        
+        if isinstance(schema, list):
+            return ReadOnlyList(self._resolve_shared(item, memo, stack) for item in schema)
+        
+        return schema
+    
+    def _build_index(self) -> SchemaIndex:
+        """
+        Resolve every definition, request body and response schema once.
+        
+        Returns:
+            SchemaIndex with shared read-only schemas
+        """
+        memo: Dict[str, Any] = {}
+        stack: set = set()
+        
+        definitions = {
+            name: self._resolve_shared({"$ref": f"#/definitions/{name}"}, memo, stack)
+            for name in self.definitions
+        }
+        requests: Dict[Tuple[str, str], Any] = {}
+        responses: Dict[ValidatorCacheKey, Any] = {}
+        
+        for path, path_item in self.paths.items():
+            for method, operation in path_item.items():
+                if not isinstance(operation, dict):
+                    continue
+                
+                for param in operation.get("parameters", []):
+                    if param.get("in") == "body" and param.get("schema"):
+                        requests[(path, method)] = self._resolve_shared(param["schema"], memo, stack)
+                        break
+                
+                for status, response in operation.get("responses", {}).items():
+                    if response and response.get("schema"):
+                        responses[(path, method, status)] = self._resolve_shared(
+                            response["schema"], memo, stack
+                        )
+        
+        logger.debug(
+            f"Built schema index: {len(definitions)} definitions, "
+            f"{len(requests)} request schemas, {len(responses)} response schemas"
+        )
+        return SchemaIndex(definitions, requests, responses)
+    
     def get_definition_schema(self, name: str, resolve_refs: bool = True) -> Dict[str, Any]:
         """
         Get a model definition schema by name.
@@ -139,7 +500,9 @@ class SwaggerSchemaValidator:
         
         schema = self.definitions[name]
         
-        if resolve_refs:
+        if resolve_refs and self._index is not None:
+            schema = self._index.definitions[name]
+        elif resolve_refs:
             schema = self._resolve_refs_recursively(schema)
         
         logger.debug(f"Retrieved definition schema for: {name}")
@@ -181,7 +544,8 @@ class SwaggerSchemaValidator:
         responses = operation.get("responses", {})
         
         # Try exact status code, then 'default'
-        response = responses.get(status_code) or responses.get("default")
+        status_key = status_code if responses.get(status_code) else "default"
+        response = responses.get(status_key)
         
         if not response:
             logger.warning(f"Response {status_code} not found for {method.upper()} {path}")
@@ -189,7 +553,9 @@ class SwaggerSchemaValidator:
         
         schema = response.get("schema")
         
-        if schema and resolve_refs:
+        if schema and resolve_refs and self._index is not None:
+            schema = self._index.responses[(path, method, status_key)]
+        elif schema and resolve_refs:
             schema = self._resolve_refs_recursively(schema)
         
         logger.debug(f"Retrieved response schema for: {method.upper()} {path} [{status_code}]")
@@ -231,7 +597,9 @@ class SwaggerSchemaValidator:
         for param in parameters:
             if param.get("in") == "body":
                 schema = param.get("schema")
-                if schema and resolve_refs:
+                if schema and resolve_refs and self._index is not None:
+                    schema = self._index.requests[(path, method)]
+                elif schema and resolve_refs:
                     schema = self._resolve_refs_recursively(schema)
                 return schema
         
@@ -269,34 +637,247 @@ class SwaggerSchemaValidator:
         
         return required_params
     
-    def validate(self, data: Any, schema: Dict[str, Any]) -> tuple[bool, Optional[str]]:
+    def get_response_validator(
+        self,
+        path: str,
+        method: str,
+        status_code: Union[int, str] = 200
+    ) -> Optional[SchemaValidator]:
         """
-        Validate data against a JSON schema.
+        Get a compiled validator for an endpoint response, using the cache.
+        
+        The schema is resolved and compiled once per (path, method, status)
+        and reused for every subsequent response of that operation.
+        
+        Args:
+            path: API path (e.g., "/pet/{petId}")
+            method: HTTP method (get, post, put, delete)
+            status_code: Response status code
+            
+        Returns:
+            Compiled validator or None if no schema is defined
+        """
+        key = (path, method.lower(), str(status_code))
+        
+        validator = self._validator_cache.get(key, _MISSING)
+        if validator is not _MISSING:
+            self._cache_hits += 1
+            return validator
+        
+        self._cache_misses += 1
+        schema = self.get_response_schema(path, method, status_code)
+        validator = self._compile(schema) if schema is not None else None
+        
+        return self._validator_cache.setdefault(key, validator)
+    
+    def get_request_validator(self, path: str, method: str) -> Optional[SchemaValidator]:
+        """
+        Get a compiled validator for an endpoint request body, using the cache.
+        
+        Args:
+            path: API path (e.g., "/pet")
+            method: HTTP method (post, put)
+            
+        Returns:
+            Compiled validator or None if the operation takes no body
+        """
+        key = (path, method.lower())
+        
+        validator = self._request_validators.get(key, _MISSING)
+        if validator is not _MISSING:
+            self._cache_hits += 1
+            return validator
+        
+        self._cache_misses += 1
+        schema = self.get_request_schema(path, method)
+        validator = self._compile(schema) if schema is not None else None
+        
+        return self._request_validators.setdefault(key, validator)
+    
+    def get_definition_validator(self, name: str) -> SchemaValidator:
+        """
+        Get a compiled validator for a model definition, using the cache.
+        
+        Args:
+            name: Name of the definition (e.g., "Pet", "Order", "User")
+            
+        Returns:
+            Compiled validator (generated function or Draft4Validator)
+        """
+        validator = self._definition_validators.get(name)
+        
+        if validator is not None:
+            self._cache_hits += 1
+            return validator
+        
+        self._cache_misses += 1
+        validator = self._compile(self.get_definition_schema(name))
+        
+        return self._definition_validators.setdefault(name, validator)
+    
+    def validate_definition(
+        self,
+        data: Any,
+        name: str,
+        fail_fast: Optional[bool] = None
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Validate data against a model definition.
         
         Args:
             data: Data to validate
-            schema: JSON schema to validate against
+            name: Name of the definition (e.g., "Pet")
+            fail_fast: Report only the first violation (uses self.fail_fast if not provided)
             
         Returns:
             Tuple of (is_valid, error_message)
         """
         try:
-            # Use Draft4 for Swagger 2.0 compatibility
-            validator = Draft4Validator(schema)
-            errors = list(validator.iter_errors(data))
+            return self._validate_with(self.get_definition_validator(name), data, fail_fast)
+        except SchemaError as e:
+            logger.error(f"Invalid schema: {e.message}")
+            return False, f"Invalid schema: {e.message}"
+    
+    def invalidate_cache(
+        self,
+        path: Optional[str] = None,
+        method: Optional[str] = None,
+        status_code: Optional[Union[int, str]] = None
+    ) -> int:
+        """
+        Drop compiled validators from the cache.
+        
+        Without arguments the whole cache is cleared; otherwise only entries
+        matching every given component are removed.
+        
+        Args:
+            path: API path to invalidate
+            method: HTTP method to invalidate
+            status_code: Response status code to invalidate
             
-            if errors:
-                error_messages = [
-                    f"{'.'.join(str(p) for p in e.path)}: {e.message}" if e.path else e.message
-                    for e in errors
-                ]
-                error_str = "; ".join(error_messages)
-                logger.error(f"Schema validation failed: {error_str}")
-                return False, error_str
+        Returns:
+            Number of removed entries
+        """
+        method = method.lower() if method is not None else None
+        status_code = str(status_code) if status_code is not None else None
+        
+        # Iterate over a snapshot; other threads may be adding entries
+        keys = [
+            key for key in list(self._validator_cache)
+            if (path is None or key[0] == path)
+            and (method is None or key[1] == method)
+            and (status_code is None or key[2] == status_code)
+        ]
+        for key in keys:
+            self._validator_cache.pop(key, None)
+        
+        # Request validators have no status code component
+        if status_code is None:
+            request_keys = [
+                key for key in list(self._request_validators)
+                if (path is None or key[0] == path) and (method is None or key[1] == method)
+            ]
+            for key in request_keys:
+                self._request_validators.pop(key, None)
+            keys.extend(request_keys)
+        
+        # Definition validators are not tied to an operation
+        if path is None and method is None and status_code is None:
+            definitions = list(self._definition_validators)
+            for name in definitions:
+                self._definition_validators.pop(name, None)
+            keys.extend(definitions)
+        
+        logger.debug(f"Invalidated {len(keys)} cached validator(s)")
+        return len(keys)
+    
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Get compiled-validator cache counters (hits, misses, size)."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "size": len(self._validator_cache) + len(self._definition_validators) + len(self._request_validators),
+        }
+    
+    def _check_with(
+        self,
+        validator: SchemaValidator,
+        data: Any,
+        fail_fast: Optional[bool] = None
+    ) -> Optional[ValidationErrors]:
+        """
+        Run an already compiled validator, stopping at the first violation.
+        
+        Only the first error is produced here; the rest of the (lazy) error
+        iterator is consumed when the returned details are read.
+        
+        Args:
+            validator: Compiled validator
+            data: Data to validate
+            fail_fast: Report only the first violation (uses self.fail_fast if not provided)
             
-            logger.debug("Schema validation passed")
-            return True, None
+        Returns:
+            ValidationErrors, or None if the data is valid
+        """
+        errors = iter(validator.iter_errors(data))
+        first = next(errors, None)
+        
+        if first is None:
+            return None
+        
+        if fail_fast is None:
+            fail_fast = self.fail_fast
+        return ValidationErrors(first, None if fail_fast else errors)
+    
+    def _validate_with(
+        self,
+        validator: SchemaValidator,
+        data: Any,
+        fail_fast: Optional[bool] = None
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Validate data with an already compiled validator.
+        
+        Args:
+            validator: Compiled validator
+            data: Data to validate
+            fail_fast: Report only the first violation (uses self.fail_fast if not provided)
+            
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        errors = self._check_with(validator, data, fail_fast)
+        
+        if errors is not None:
+            error_str = str(errors)
+            logger.error(f"Schema validation failed: {error_str}")
+            return False, error_str
+        
+        logger.debug("Schema validation passed")
+        return True, None
+    
+    def validate(
+        self,
+        data: Any,
+        schema: Dict[str, Any],
+        fail_fast: Optional[bool] = None
+    ) -> tuple[bool, Optional[str]]:
+        """
+        Validate data against a JSON schema.
+        
+        Args:
+            data: Data to validate
+            schema: JSON schema to validate against
+            fail_fast: Report only the first violation (uses self.fail_fast if not provided)
             
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        try:
+            # Use Draft4 for Swagger 2.0 compatibility
+            return self._validate_with(Draft4Validator(schema), data, fail_fast)
+        
         except SchemaError as e:
             logger.error(f"Invalid schema: {e.message}")
             return False, f"Invalid schema: {e.message}"
@@ -306,7 +887,8 @@ class SwaggerSchemaValidator:
         response_data: Any,
         path: str,
         method: str,
-        status_code: Union[int, str] = 200
+        status_code: Union[int, str] = 200,
+        fail_fast: Optional[bool] = None
     ) -> tuple[bool, Optional[str]]:
         """
         Validate API response data against the expected schema.
@@ -316,23 +898,29 @@ class SwaggerSchemaValidator:
             path: API path
             method: HTTP method
             status_code: Response status code
+            fail_fast: Report only the first violation (uses self.fail_fast if not provided)
             
         Returns:
             Tuple of (is_valid, error_message)
         """
-        schema = self.get_response_schema(path, method, status_code)
+        validator = self.get_response_validator(path, method, status_code)
         
-        if schema is None:
+        if validator is None:
             logger.warning(f"No schema defined for {method.upper()} {path} [{status_code}]")
             return True, None
         
-        return self.validate(response_data, schema)
+        try:
+            return self._validate_with(validator, response_data, fail_fast)
+        except SchemaError as e:
+            logger.error(f"Invalid schema: {e.message}")
+            return False, f"Invalid schema: {e.message}"
     
     def validate_request(
         self,
         request_data: Any,
         path: str,
-        method: str
+        method: str,
+        fail_fast: Optional[bool] = None
     ) -> tuple[bool, Optional[str]]:
         """
         Validate request body data against the expected schema.
@@ -341,21 +929,146 @@ class SwaggerSchemaValidator:
             request_data: Request body data to validate
             path: API path
             method: HTTP method
+            fail_fast: Report only the first violation (uses self.fail_fast if not provided)
             
         Returns:
             Tuple of (is_valid, error_message)
         """
-        schema = self.get_request_schema(path, method)
+        validator = self.get_request_validator(path, method)
         
-        if schema is None:
+        if validator is None:
             logger.warning(f"No request schema defined for {method.upper()} {path}")
             return True, None
         
-        return self.validate(request_data, schema)
+        try:
+            return self._validate_with(validator, request_data, fail_fast)
+        except SchemaError as e:
+            logger.error(f"Invalid schema: {e.message}")
+            return False, f"Invalid schema: {e.message}"
+    
+    def is_valid_definition(self, data: Any, name: str) -> bool:
+        """
+        Check data against a model definition without building error messages.
+        
+        Args:
+            data: Data to check
+            name: Name of the definition (e.g., "Pet")
+            
+        Returns:
+            True if the data matches the definition
+        """
+        return self.get_definition_validator(name).is_valid(data)
+    
+    def is_valid_response(
+        self,
+        response_data: Any,
+        path: str,
+        method: str,
+        status_code: Union[int, str] = 200
+    ) -> bool:
+        """
+        Check response data without building error messages.
+        
+        Args:
+            response_data: Response data to check
+            path: API path
+            method: HTTP method
+            status_code: Response status code
+            
+        Returns:
+            True if the data matches the schema (or no schema is defined)
+        """
+        validator = self.get_response_validator(path, method, status_code)
+        return validator is None or validator.is_valid(response_data)
+    
+    def is_valid_request(self, request_data: Any, path: str, method: str) -> bool:
+        """
+        Check a request body without building error messages.
+        
+        Args:
+            request_data: Request body to check
+            path: API path
+            method: HTTP method
+            
+        Returns:
+            True if the body matches the schema (or the operation takes no body)
+        """
+        validator = self.get_request_validator(path, method)
+        return validator is None or validator.is_valid(request_data)
+    
+    def check_definition(
+        self,
+        data: Any,
+        name: str,
+        fail_fast: Optional[bool] = None
+    ) -> Optional[ValidationErrors]:
+        """
+        Validate data against a model definition, formatting errors only when read.
+        
+        Args:
+            data: Data to validate
+            name: Name of the definition (e.g., "Pet")
+            fail_fast: Report only the first violation (uses self.fail_fast if not provided)
+            
+        Returns:
+            ValidationErrors, or None if the data is valid
+        """
+        return self._check_with(self.get_definition_validator(name), data, fail_fast)
+    
+    def check_response(
+        self,
+        response_data: Any,
+        path: str,
+        method: str,
+        status_code: Union[int, str] = 200,
+        fail_fast: Optional[bool] = None
+    ) -> Optional[ValidationErrors]:
+        """
+        Validate response data, formatting errors only when read.
+        
+        Args:
+            response_data: Response data to validate
+            path: API path
+            method: HTTP method
+            status_code: Response status code
+            fail_fast: Report only the first violation (uses self.fail_fast if not provided)
+            
+        Returns:
+            ValidationErrors, or None if the data is valid (or no schema is defined)
+        """
+        validator = self.get_response_validator(path, method, status_code)
+        if validator is None:
+            return None
+        return self._check_with(validator, response_data, fail_fast)
+    
+    def check_request(
+        self,
+        request_data: Any,
+        path: str,
+        method: str,
+        fail_fast: Optional[bool] = None
+    ) -> Optional[ValidationErrors]:
+        """
+        Validate a request body, formatting errors only when read.
+        
+        Args:
+            request_data: Request body to validate
+            path: API path
+            method: HTTP method
+            fail_fast: Report only the first violation (uses self.fail_fast if not provided)
+            
+        Returns:
+            ValidationErrors, or None if the body is valid (or the operation takes no body)
+        """
+        validator = self.get_request_validator(path, method)
+        if validator is None:
+            return None
+        return self._check_with(validator, request_data, fail_fast)
 
 
-# Singleton instance
+# Singleton instance (created once under the lock, then read without it)
 _validator_instance: Optional[SwaggerSchemaValidator] = None
+_validator_lock = threading.Lock()
 
 
 def get_schema_validator(swagger_path: Optional[Union[str, Path]] = None) -> SwaggerSchemaValidator:
@@ -370,11 +1083,15 @@ def get_schema_validator(swagger_path: Optional[Union[str, Path]] = None) -> Swa
     """
     global _validator_instance
     
-    if _validator_instance is None:
-        if swagger_path is None:
-            # Default path
-            swagger_path = Path(__file__).parent.parent / "schemas" / "swagger.json"
-        _validator_instance = SwaggerSchemaValidator(swagger_path)
+    if _validator_instance is not None:
+        return _validator_instance
+    
+    with _validator_lock:
+        if _validator_instance is None:
+            if swagger_path is None:
+                # Default path
+                swagger_path = Path(__file__).parent.parent / "schemas" / "swagger.json"
+            _validator_instance = SwaggerSchemaValidator(swagger_path)
     
     return _validator_instance
 
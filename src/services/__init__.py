@@ -1,9 +1,12 @@
 """API service classes for endpoint grouping."""
+from .base_service import BaseService, BatchResult
 from .pet_service import PetService
 from .store_service import StoreService
 from .user_service import UserService
 
 __all__ = [
+    "BaseService",
+    "BatchResult",
     "PetService",
     "StoreService",
     "UserService",
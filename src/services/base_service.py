@@ -1,8 +1,25 @@
 """Base service class for API endpoints."""
-from typing import TYPE_CHECKING
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Iterable, Optional, Union
 
 if TYPE_CHECKING:
-    from src.http import BaseHTTPClient
+    from src.http import AsyncBaseHTTPClient, BaseHTTPClient
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one item of a batch operation."""
+    item: Any
+    response: Any = None
+    error: Optional[BaseException] = None
+    
+    @property
+    def ok(self) -> bool:
+        """True if the request was sent and returned a 2xx status."""
+        return self.error is None and self.response is not None and 200 <= self.response.status_code < 300
 
 
 class BaseService:
@@ -11,9 +28,13 @@ class BaseService:
     
     All service classes should inherit from this class
     and use self._client for making HTTP requests.
+    
+    The client may be synchronous (BaseHTTPClient) or asynchronous
+    (AsyncBaseHTTPClient); with an async client every service method
+    returns an awaitable instead of a Response.
     """
     
-    def __init__(self, client: "BaseHTTPClient"):
+    def __init__(self, client: Union["BaseHTTPClient", "AsyncBaseHTTPClient"]):
         """
         Initialize the service.
         
@@ -21,4 +42,63 @@ class BaseService:
             client: HTTP client instance for making requests
         """
         self._client = client
-
+    
+    def _run_batch(
+        self,
+        func: Callable[[Any], Any],
+        items: Iterable[Any],
+        max_workers: Optional[int] = None
+    ) -> Union[list[BatchResult], Awaitable[list[BatchResult]]]:
+        """
+        Apply a single-entity call to many items with bounded concurrency.
+        
+        Sync clients fan out over a thread pool, after being switched to a
+        session per thread (requests.Session is not thread-safe); async
+        clients over asyncio tasks limited by a semaphore (the result is
+        then awaitable). Exceptions are captured per item instead of
+        aborting the batch.
+        
+        Args:
+            func: Service method taking one item
+            items: Items to process
+            max_workers: Concurrency limit (defaults to the client pool size)
+            
+        Returns:
+            BatchResult list in the same order as items
+        """
+        items = list(items)
+        max_workers = max_workers or getattr(self._client, "pool_maxsize", 10)
+        
+        if inspect.iscoroutinefunction(self._client.request):
+            return self._run_batch_async(func, items, max_workers)
+        
+        def call(item: Any) -> BatchResult:
+            try:
+                return BatchResult(item, response=func(item))
+            except Exception as e:
+                return BatchResult(item, error=e)
+        
+        if not items:
+            return []
+        
+        self._client.enable_thread_safety()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(call, items))
+    
+    async def _run_batch_async(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: list[Any],
+        max_workers: int
+    ) -> list[BatchResult]:
+        """Async variant of _run_batch using a semaphore as the concurrency limit."""
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def call(item: Any) -> BatchResult:
+            async with semaphore:
+                try:
+                    return BatchResult(item, response=await func(item))
+                except Exception as e:
+                    return BatchResult(item, error=e)
+        
+        return list(await asyncio.gather(*(call(item) for item in items)))
@@ -1,9 +1,15 @@
 """Pet API service endpoints."""
-from typing import Optional, Union
+import logging
+from typing import Any, Iterator, Optional, Union
 
 from requests import Response
 
-from .base_service import BaseService
+from src.http.streaming import iter_json_array
+from src.models import Pet
+from .base_service import BaseService, BatchResult
+
+
+logger = logging.getLogger(__name__)
 
 
 class PetService(BaseService):
@@ -67,6 +73,45 @@ class PetService(BaseService):
         """
         return self._client.delete(f"/pet/{pet_id}", path_template="/pet/{petId}")
     
+    def create_many(self, pets_data: list[dict], max_workers: Optional[int] = None) -> list[BatchResult]:
+        """
+        Create many pets concurrently.
+        
+        Args:
+            pets_data: List of pet data dictionaries
+            max_workers: Concurrency limit (defaults to the client pool size)
+            
+        Returns:
+            BatchResult list in input order (awaitable with an async client)
+        """
+        return self._run_batch(self.create, pets_data, max_workers)
+    
+    def get_many(self, pet_ids: list[int], max_workers: Optional[int] = None) -> list[BatchResult]:
+        """
+        Get many pets by ID concurrently.
+        
+        Args:
+            pet_ids: Pet IDs to retrieve
+            max_workers: Concurrency limit (defaults to the client pool size)
+            
+        Returns:
+            BatchResult list in input order (awaitable with an async client)
+        """
+        return self._run_batch(self.get_by_id, pet_ids, max_workers)
+    
+    def delete_many(self, pet_ids: list[int], max_workers: Optional[int] = None) -> list[BatchResult]:
+        """
+        Delete many pets concurrently.
+        
+        Args:
+            pet_ids: Pet IDs to delete
+            max_workers: Concurrency limit (defaults to the client pool size)
+            
+        Returns:
+            BatchResult list in input order (awaitable with an async client)
+        """
+        return self._run_batch(self.delete, pet_ids, max_workers)
+    
     def find_by_status(self, status: Union[str, list[str]]) -> Response:
         """
         Find pets by status.
@@ -103,6 +148,88 @@ class PetService(BaseService):
             params={"tags": tags}
         )
     
+    def iter_by_status(
+        self,
+        status: Union[str, list[str]],
+        validate: bool = False,
+        as_model: bool = False,
+        chunk_size: int = 64 * 1024
+    ) -> Iterator[Union[dict, Pet]]:
+        """
+        Stream pets by status, parsing the response array item by item.
+        
+        Memory use does not grow with the number of returned pets.
+        Requires a synchronous client.
+        
+        Args:
+            status: Pet status ("available", "pending", "sold") or list of statuses
+            validate: Validate each item against the Pet definition (failures are logged)
+            as_model: Yield Pet models instead of dicts
+            chunk_size: Number of bytes read from the socket at a time
+            
+        Yields:
+            Pet dicts (or Pet models if as_model is set)
+        """
+        params = {"status": status if isinstance(status, list) else [status]}
+        
+        yield from self._iter_pets(
+            "/pet/findByStatus", params, validate, as_model, chunk_size
+        )
+    
+    def iter_by_tags(
+        self,
+        tags: list[str],
+        validate: bool = False,
+        as_model: bool = False,
+        chunk_size: int = 64 * 1024
+    ) -> Iterator[Union[dict, Pet]]:
+        """
+        Stream pets by tags, parsing the response array item by item.
+        
+        Args:
+            tags: List of tag names to filter by
+            validate: Validate each item against the Pet definition (failures are logged)
+            as_model: Yield Pet models instead of dicts
+            chunk_size: Number of bytes read from the socket at a time
+            
+        Yields:
+            Pet dicts (or Pet models if as_model is set)
+        """
+        yield from self._iter_pets(
+            "/pet/findByTags", {"tags": tags}, validate, as_model, chunk_size
+        )
+    
+    def _iter_pets(
+        self,
+        endpoint: str,
+        params: dict,
+        validate: bool,
+        as_model: bool,
+        chunk_size: int
+    ) -> Iterator[Any]:
+        """Request a pet array with a streamed body and yield its items."""
+        validator = self._client._schema_validator if validate else None
+        if validate and validator is None:
+            logger.warning("Schema validator is not available, items will not be validated")
+        
+        response = self._client.get(
+            endpoint,
+            path_template=endpoint,
+            params=params,
+            stream=True
+        )
+        
+        with response:
+            response.raise_for_status()
+            
+            for index, item in enumerate(iter_json_array(response.iter_content(chunk_size))):
+                if validator is not None:
+                    errors = validator.check_definition(item, "Pet")
+                    if errors:
+                        logger.warning(f"Schema validation failed for item {index}: {errors}")
+                
+                yield Pet.model_validate(item) if as_model else item
+    
     def update_with_form(
         self,
         pet_id: int,
@@ -1,7 +1,9 @@
 """Store API service endpoints."""
+from typing import Optional
+
 from requests import Response
 
-from .base_service import BaseService
+from .base_service import BaseService, BatchResult
 
 
 class StoreService(BaseService):
@@ -69,4 +71,29 @@ class StoreService(BaseService):
             f"/store/order/{order_id}",
             path_template="/store/order/{orderId}"
         )
-
+    
+    def place_orders(self, orders_data: list[dict], max_workers: Optional[int] = None) -> list[BatchResult]:
+        """
+        Place many orders concurrently.
+        
+        Args:
+            orders_data: List of order data dictionaries
+            max_workers: Concurrency limit (defaults to the client pool size)
+            
+        Returns:
+            BatchResult list in input order (awaitable with an async client)
+        """
+        return self._run_batch(self.place_order, orders_data, max_workers)
+    
+    def delete_orders(self, order_ids: list[int], max_workers: Optional[int] = None) -> list[BatchResult]:
+        """
+        Delete many orders concurrently.
+        
+        Args:
+            order_ids: Order IDs to delete
+            max_workers: Concurrency limit (defaults to the client pool size)
+            
+        Returns:
+            BatchResult list in input order (awaitable with an async client)
+        """
+        return self._run_batch(self.delete_order, order_ids, max_workers)
@@ -1,7 +1,9 @@
 """User API service endpoints."""
+from typing import Optional
+
 from requests import Response
 
-from .base_service import BaseService
+from .base_service import BaseService, BatchResult
 
 
 class UserService(BaseService):
@@ -73,6 +75,47 @@ class UserService(BaseService):
         """
         return self._client.get(f"/user/{username}", path_template="/user/{username}")
     
+    def create_many(self, users_data: list[dict], max_workers: Optional[int] = None) -> list[BatchResult]:
+        """
+        Create many users concurrently, one request per user.
+        
+        Unlike create_with_array, each user gets its own response/error.
+        
+        Args:
+            users_data: List of user data dictionaries
+            max_workers: Concurrency limit (defaults to the client pool size)
+            
+        Returns:
+            BatchResult list in input order (awaitable with an async client)
+        """
+        return self._run_batch(self.create, users_data, max_workers)
+    
+    def get_many(self, usernames: list[str], max_workers: Optional[int] = None) -> list[BatchResult]:
+        """
+        Get many users by username concurrently.
+        
+        Args:
+            usernames: Usernames to retrieve
+            max_workers: Concurrency limit (defaults to the client pool size)
+            
+        Returns:
+            BatchResult list in input order (awaitable with an async client)
+        """
+        return self._run_batch(self.get_by_username, usernames, max_workers)
+    
+    def delete_many(self, usernames: list[str], max_workers: Optional[int] = None) -> list[BatchResult]:
+        """
+        Delete many users concurrently.
+        
+        Args:
+            usernames: Usernames to delete
+            max_workers: Concurrency limit (defaults to the client pool size)
+            
+        Returns:
+            BatchResult list in input order (awaitable with an async client)
+        """
+        return self._run_batch(self.delete, usernames, max_workers)
+    
     def update(self, username: str, user_data: dict) -> Response:
         """
         Update user data.
@@ -1,10 +1,16 @@
 """Pytest configuration and fixtures for Petstore API tests."""
+import heapq
+import json
 import logging
+import logging.handlers
+import math
 import os
+import queue
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import Generator
+from typing import Generator, Optional
 
 import pytest
 
@@ -12,10 +18,39 @@ import pytest
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from config.settings import Settings, get_settings, set_current_settings
+from config.settings import Settings, get_current_settings, get_settings, set_current_settings
 from src.api_client import APIClient
+from src.cleanup import CleanupManager, CleanupScope
+from src.fixture_pool import EntityPool
+from src.http import LatencyMetrics, get_latency_metrics, get_validation_report
+from src.http.cassette import merge_worker_cassettes, remove_worker_cassettes
+from src.http.response_validation import VALIDATION_MODES
+from src.local_server import LocalPetstoreServer
+from src.parallel import get_worker_count, get_worker_id, is_xdist_worker, worker_id_range
 from src.schema_validator import SwaggerSchemaValidator, get_schema_validator
-from src.models import Pet, Order, User, Category, Tag
+from src.models import (
+    Pet, Order, User, Category, Tag, get_id_allocator, seed_factories, set_factory_validation
+)
+from src.models.store import POOL_ORDER_IDS
+
+
+# Background log writer started by _setup_logging when log_async is enabled
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Log file of this process, closed before xdist logs are merged
+_log_file_handler: Optional[logging.FileHandler] = None
+
+# In-process Petstore started for --env local
+_local_server: Optional[LocalPetstoreServer] = None
+
+# Shared by the xdist controller and its workers to name log files of one run
+_run_id: Optional[str] = None
+
+# Seed of the model factories, shared with xdist workers so a run can be reproduced
+_data_seed: Optional[int] = None
+
+# Start of a formatted log record (continuation lines of multi-line messages don't match)
+_LOG_RECORD_START = re.compile(r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2} ")
 
 
 # ==================== Pytest Hooks for CLI Options ====================
@@ -26,7 +61,7 @@ def pytest_addoption(parser):
         "--env",
         action="store",
         default="dev",
-        help="Environment to run tests against (dev, staging, prod)"
+        help="Environment to run tests against (dev, staging, prod, local)"
     )
     parser.addoption(
         "--base-url",
@@ -40,41 +75,108 @@ def pytest_addoption(parser):
         default=None,
         help="Override API key"
     )
+    parser.addoption(
+        "--cassette-mode",
+        action="store",
+        default=None,
+        choices=["off", "record", "replay", "record-missing"],
+        help="Record or replay HTTP exchanges via a JSONL cassette"
+    )
+    parser.addoption(
+        "--cassette",
+        action="store",
+        default=None,
+        help="Override cassette file path"
+    )
+    parser.addoption(
+        "--validation-mode",
+        action="store",
+        default=None,
+        choices=VALIDATION_MODES,
+        help="Response schema validation mode"
+    )
+    parser.addoption(
+        "--validation-fail-fast",
+        action="store_true",
+        default=False,
+        help="Report only the first schema violation of each body"
+    )
+    parser.addoption(
+        "--seed",
+        action="store",
+        type=int,
+        default=None,
+        help="Seed for test data and ID allocation (reproduces a previous run)"
+    )
+
+
+def _xdist_enabled(config) -> bool:
+    """Check whether this (controller) process distributes tests to xdist workers."""
+    return bool(getattr(config.option, "numprocesses", None)) and getattr(config.option, "dist", "no") != "no"
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Pass the run id and data seed to each xdist worker (only called when xdist is installed)."""
+    node.workerinput["petstore_run_id"] = _run_id
+    node.workerinput["petstore_data_seed"] = _data_seed
 
 
 def pytest_configure(config):
     """Configure pytest with environment settings."""
+    global _local_server, _run_id, _data_seed
+    
     # Get environment from CLI
     env_name = config.getoption("--env")
     base_url = config.getoption("--base-url")
     api_key = config.getoption("--api-key")
+    cassette_mode = config.getoption("--cassette-mode")
+    cassette_path = config.getoption("--cassette")
+    validation_mode = config.getoption("--validation-mode")
+    validation_fail_fast = config.getoption("--validation-fail-fast")
+    data_seed = config.getoption("--seed")
     
     # Load settings for the environment
     settings = get_settings(env_name)
     
-    # Override with CLI options if provided
+    # Override with CLI options if provided (copy keeps all other settings)
     if base_url:
-        settings = Settings(
-            base_url=base_url,
-            api_key=settings.api_key,
-            timeout=settings.timeout,
-            log_level=settings.log_level,
-            env_name=env_name
-        )
+        settings = settings.model_copy(update={"base_url": base_url})
     if api_key:
-        settings = Settings(
-            base_url=settings.base_url,
-            api_key=api_key,
-            timeout=settings.timeout,
-            log_level=settings.log_level,
-            env_name=env_name
-        )
+        settings = settings.model_copy(update={"api_key": api_key})
+    if cassette_mode:
+        settings = settings.model_copy(update={"cassette_mode": cassette_mode})
+    if cassette_path:
+        settings = settings.model_copy(update={"cassette_path": cassette_path})
+    if validation_mode:
+        settings = settings.model_copy(update={"validation_mode": validation_mode})
+    if validation_fail_fast:
+        settings = settings.model_copy(update={"validation_fail_fast": True})
+    if data_seed is not None:
+        settings = settings.model_copy(update={"data_seed": data_seed})
+    
+    # Serve the API from swagger.json in-process (an explicit --base-url wins)
+    if settings.local_server and not base_url:
+        _local_server = LocalPetstoreServer().start()
+        settings = settings.model_copy(update={"base_url": _local_server.base_url})
     
     # Set as current settings
     set_current_settings(settings)
     
-    # Setup logging
-    _setup_logging(settings.log_level)
+    # Setup logging (xdist workers and their controller write parts of one run log)
+    worker_input = getattr(config, "workerinput", None)
+    _run_id = worker_input["petstore_run_id"] if worker_input else datetime.now().strftime("%Y%m%d_%H%M%S")
+    if worker_input:
+        log_name, worker_id = f"test_{_run_id}_{get_worker_id()}.log", get_worker_id()
+    elif _xdist_enabled(config):
+        log_name, worker_id = f"test_{_run_id}_controller.log", "controller"
+    else:
+        log_name, worker_id = f"test_{_run_id}.log", None
+    _setup_logging(settings.log_level, settings.log_async, log_name, worker_id)
+    
+    # Seed factories and ID allocation (workers use the controller's seed)
+    _data_seed = seed_factories(worker_input["petstore_data_seed"] if worker_input else settings.data_seed)
+    set_factory_validation(settings.factory_validation)
     
     # Log test session info
     logger = logging.getLogger(__name__)
@@ -82,12 +184,26 @@ def pytest_configure(config):
     logger.info(f"TEST SESSION STARTED: {datetime.now().isoformat()}")
     logger.info(f"Environment: {env_name}")
     logger.info(f"Base URL: {settings.base_url}")
+    logger.info(f"Data seed: {_data_seed} (rerun with --seed {_data_seed})")
     logger.info("=" * 60)
     
     # Create reports directory if not exists
     reports_dir = project_root / "reports"
     reports_dir.mkdir(exist_ok=True)
     
+    if not is_xdist_worker():
+        # Drop per-process latency dumps of a previous run (xdist workers write theirs later)
+        for stale in (reports_dir / "latency").glob("*.json"):
+            stale.unlink()
+        for stale in reports_dir.glob("schema_violations*.json"):
+            stale.unlink()
+        if settings.cassette_mode in ("record", "record-missing"):
+            remove_worker_cassettes(_cassette_path(settings))
+        
+        # Parse swagger.json once and write its precompiled cache before any
+        # worker starts, so workers load the cache instead of re-resolving the spec
+        get_schema_validator(project_root / "schemas" / "swagger.json")
+    
     # Create logs directory if not exists
     logs_dir = project_root / "logs"
     logs_dir.mkdir(exist_ok=True)
@@ -95,14 +211,140 @@ def pytest_configure(config):
 
 def pytest_unconfigure(config):
     """Cleanup after test session."""
+    global _log_listener, _local_server
+    
     logger = logging.getLogger(__name__)
     logger.info("=" * 60)
     logger.info(f"TEST SESSION ENDED: {datetime.now().isoformat()}")
     logger.info("=" * 60)
+    
+    if _local_server is not None:
+        _local_server.stop()
+        _local_server = None
+    
+    _report_schema_validation()
+    _dump_latency_metrics(config)
+    
+    # Flush queued records before the interpreter shuts down
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    
+    if not is_xdist_worker() and _xdist_enabled(config):
+        settings = get_current_settings()
+        if settings.cassette_mode in ("record", "record-missing"):
+            merge_worker_cassettes(_cassette_path(settings), settings.cassette_mode)
+        _merge_worker_logs(_run_id)
+
+
+def _cassette_path(settings: Settings) -> Path:
+    """Cassette file of the run (relative paths are under the project root)."""
+    path = Path(settings.cassette_path)
+    return path if path.is_absolute() else project_root / path
+
+
+def _read_log_records(path: Path) -> Generator[str, None, None]:
+    """Yield complete log records (including continuation lines) from a log file."""
+    record = ""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if _LOG_RECORD_START.match(line) and record:
+                yield record
+                record = ""
+            record += line
+    if record:
+        yield record
 
 
-def _setup_logging(log_level: str) -> None:
+def _merge_worker_logs(run_id: str) -> None:
+    """
+    Merge the controller and worker logs of a run into logs/test_<run_id>.log.
+    
+    Every part is already in time order, so records are interleaved by
+    timestamp and the per-process parts are removed.
+    """
+    logs_dir = project_root / "logs"
+    parts = sorted(logs_dir.glob(f"test_{run_id}_*.log"))
+    if not parts:
+        return
+    
+    # Release the controller's own part before reading and removing it
+    if _log_file_handler is not None:
+        logging.getLogger().removeHandler(_log_file_handler)
+        _log_file_handler.close()
+    
+    records = heapq.merge(*(_read_log_records(part) for part in parts), key=lambda record: record[:19])
+    with open(logs_dir / f"test_{run_id}.log", "w", encoding="utf-8") as merged:
+        merged.writelines(records)
+    
+    for part in parts:
+        part.unlink()
+
+
+def _report_schema_validation() -> None:
+    """
+    Wait for async response validations and write schema violations to
+    reports/schema_violations*.json (one file per xdist worker).
+    """
+    report = get_validation_report().drain(timeout=60)
+    logger = logging.getLogger(__name__)
+    logger.info(
+        f"Schema validation: {report['validated']} validated, {report['skipped']} skipped, "
+        f"{report['errors']} errors, {len(report['violations'])} violations"
+    )
+    if report["violations"]:
+        worker_id = get_worker_id()
+        name = "schema_violations.json" if worker_id == "main" else f"schema_violations_{worker_id}.json"
+        violations_file = project_root / "reports" / name
+        violations_file.write_text(json.dumps(report["violations"], indent=2), encoding="utf-8")
+        logger.warning(f"Schema violations written to {violations_file}")
+
+
+def _dump_latency_metrics(config) -> None:
+    """
+    Write this process's latency histograms to reports/latency/<worker>.json.
+    
+    xdist workers finish before the controller, so the controller (or a
+    plain single-process run) merges all dumps into reports/latency.json.
+    """
+    reports_dir = project_root / "reports"
+    worker_id = getattr(config, "workerinput", {}).get("workerid")
+    
+    metrics = get_latency_metrics()
+    if len(metrics):
+        metrics.dump(reports_dir / "latency" / f"{worker_id or 'main'}.json")
+    
+    if worker_id is None:
+        dumps = sorted((reports_dir / "latency").glob("*.json"))
+        if dumps:
+            merged = LatencyMetrics.merge_files(dumps)
+            merged.dump(reports_dir / "latency.json")
+            logging.getLogger(__name__).info(
+                f"Latency histograms for {len(merged)} operations written to reports/latency.json"
+            )
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+    
+    The stock handler formats each record in the calling thread, which
+    would pay for lazy log arguments (e.g. response bodies) on the request path.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _setup_logging(
+    log_level: str,
+    log_async: bool = True,
+    log_name: Optional[str] = None,
+    worker_id: Optional[str] = None
+) -> None:
     """Setup logging configuration."""
+    global _log_listener, _log_file_handler
+    
     numeric_level = getattr(logging, log_level.upper(), logging.DEBUG)
     
     # Create logs directory
@@ -110,18 +352,31 @@ def _setup_logging(log_level: str) -> None:
     logs_dir.mkdir(exist_ok=True)
     
     # Create log file with timestamp
-    log_file = logs_dir / f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    log_file = logs_dir / (log_name or f"test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
     
-    # Configure root logger
-    logging.basicConfig(
-        level=numeric_level,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[
-            logging.FileHandler(log_file, encoding="utf-8"),
-            logging.StreamHandler(sys.stdout)
-        ]
+    _log_file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    handlers = [
+        _log_file_handler,
+        logging.StreamHandler(sys.stdout)
+    ]
+    # Tag records with the xdist worker so merged logs stay readable
+    worker_tag = f"[{worker_id}] " if worker_id else ""
+    formatter = logging.Formatter(
+        f"%(asctime)s {worker_tag}[%(levelname)s] %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S"
     )
+    for handler in handlers:
+        handler.setFormatter(formatter)
+    
+    # Hand records to a background thread that formats and writes them
+    if log_async:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _log_listener = logging.handlers.QueueListener(log_queue, *handlers)
+        _log_listener.start()
+        handlers = [_DeferredQueueHandler(log_queue)]
+    
+    # Configure root logger
+    logging.basicConfig(level=numeric_level, handlers=handlers)
     
     # Set level for specific loggers
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -135,6 +390,11 @@ def pytest_html_report_title(report):
     report.title = "Petstore API Test Report"
 
 
+def pytest_report_header(config):
+    """Show the data seed so a failing run can be reproduced with --seed."""
+    return f"petstore data seed: {_data_seed}"
+
+
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Add extra information to test report."""
@@ -203,93 +463,207 @@ def schema_validator() -> SwaggerSchemaValidator:
 @pytest.fixture
 def pet_data() -> dict:
     """Generate test pet data."""
-    return Pet.create().model_dump(by_alias=True, exclude_none=True)
+    return Pet.create().to_payload()
 
 
 @pytest.fixture
 def minimal_pet_data() -> dict:
     """Generate minimal test pet data with only required fields."""
-    return Pet.create_minimal().model_dump(by_alias=True, exclude_none=True)
+    return Pet.create_minimal().to_payload()
 
 
 @pytest.fixture
 def order_data() -> dict:
     """Generate test order data."""
-    return Order.create().model_dump(by_alias=True, exclude_none=True)
+    return Order.create().to_payload()
 
 
 @pytest.fixture
 def user_data() -> dict:
     """Generate test user data."""
-    return User.create().model_dump(by_alias=True, exclude_none=True)
+    return User.create().to_payload()
 
 
 @pytest.fixture
 def users_list_data() -> list[dict]:
     """Generate list of test users."""
-    return [u.model_dump(by_alias=True, exclude_none=True) for u in User.create_list(3)]
+    return [u.to_payload() for u in User.create_list(3)]
 
 
 # ==================== Cleanup Fixtures ====================
 
-@pytest.fixture
-def created_pet(api_client, pet_data) -> Generator[dict, None, None]:
+@pytest.fixture(scope="session")
+def cleanup_manager(api_client, settings) -> Generator[CleanupManager, None, None]:
     """
-    Create a pet and clean up after test.
+    Delete entities registered by tests off the critical path.
     
-    Yields:
-        Created pet data with ID
+    Outstanding deletes are drained at session end and entities that could
+    not be deleted are written to reports/leaked_entities*.json.
     """
-    response = api_client.create_pet(pet_data)
-    assert response.status_code == 200, f"Failed to create pet: {response.text}"
+    manager = CleanupManager.for_client(
+        api_client,
+        background=settings.cleanup_background,
+        max_workers=api_client.pool_maxsize
+    )
     
-    created = response.json()
-    yield created
+    yield manager
     
-    # Cleanup
-    if "id" in created:
-        api_client.delete_pet(created["id"])
+    report = manager.drain()
+    logger = logging.getLogger(__name__)
+    logger.info(
+        f"Cleanup: {report['deleted']} deleted, {report['already_deleted']} already gone, "
+        f"{len(report['leaked'])} leaked"
+    )
+    if report["leaked"]:
+        worker_id = get_worker_id()
+        name = "leaked_entities.json" if worker_id == "main" else f"leaked_entities_{worker_id}.json"
+        leaked_file = project_root / "reports" / name
+        leaked_file.write_text(json.dumps(report["leaked"], indent=2), encoding="utf-8")
+        logger.warning(f"Leaked entities written to {leaked_file}")
 
 
 @pytest.fixture
-def created_order(api_client, order_data) -> Generator[dict, None, None]:
+def cleanup(cleanup_manager) -> Generator[CleanupScope, None, None]:
     """
-    Create an order and clean up after test.
+    Register entities created by the test for deferred deletion.
     
-    Yields:
-        Created order data with ID
+    Usage:
+        def test_create_pet(api_client, pet_data, cleanup):
+            response = api_client.create_pet(pet_data)
+            cleanup.pet(response.json().get("id"))
+    """
+    scope = CleanupScope(cleanup_manager)
+    yield scope
+    scope.flush()
+
+
+# ==================== Pooled Entity Fixtures ====================
+
+def _pool_sizes(request, lease_fixture: str, shared_fixture: str, limit: int) -> tuple[int, int]:
     """
-    response = api_client.place_order(order_data)
-    assert response.status_code == 200, f"Failed to create order: {response.text}"
+    Size a pool from the collected tests that use it.
     
-    created = response.json()
-    yield created
+    Every test requesting the lease fixture needs its own entity. Under xdist
+    the tests are spread over the workers, so each worker provisions its share
+    and lease() creates any extra on demand. A shared entity is provisioned
+    only if some test requests the shared fixture.
     
-    # Cleanup
-    if "id" in created:
-        try:
-            api_client.delete_order(created["id"])
-        except Exception:
-            pass  # Order might already be deleted
+    Returns:
+        Tuple of (entities to lease, shared entities)
+    """
+    items = request.session.items
+    leasing = sum(lease_fixture in item.fixturenames for item in items)
+    shared = int(any(shared_fixture in item.fixturenames for item in items))
+    return min(math.ceil(leasing / get_worker_count()), limit), shared
+
+
+def _pool_fixture(pool: EntityPool) -> Generator[EntityPool, None, None]:
+    pool.provision()
+    yield pool
+    pool.teardown()
+
+
+@pytest.fixture(scope="session")
+def pet_pool(request, api_client, settings, cleanup_manager) -> Generator[EntityPool, None, None]:
+    """Pets bulk-created at session start and bulk-deleted at session end."""
+    size, shared = _pool_sizes(request, "created_pet", "shared_pet", settings.fixture_pool_size)
+    yield from _pool_fixture(EntityPool(
+        "pet",
+        lambda: Pet.create().to_payload(),
+        create_many=api_client.pet.create_many,
+        delete_many=api_client.pet.delete_many,
+        key="id",
+        size=size,
+        shared=shared,
+        cleanup=cleanup_manager
+    ))
+
+
+@pytest.fixture(scope="session")
+def order_pool(request, api_client, settings, cleanup_manager) -> Generator[EntityPool, None, None]:
+    """Orders bulk-placed at session start and bulk-deleted at session end."""
+    # Pool orders live for the whole session, so their IDs come from a part of
+    # the 1-10 range tests never use and must not wrap; the shared order takes
+    # one of them too
+    start, end = worker_id_range(*POOL_ORDER_IDS)
+    size, shared = _pool_sizes(
+        request, "created_order", "shared_order", min(settings.fixture_pool_size, end - start)
+    )
+    yield from _pool_fixture(EntityPool(
+        "order",
+        lambda: Order.create(id=get_id_allocator().next_id(*POOL_ORDER_IDS, wrap=False)).to_payload(),
+        create_many=api_client.store.place_orders,
+        delete_many=api_client.store.delete_orders,
+        key="id",
+        size=size,
+        shared=shared,
+        cleanup=cleanup_manager
+    ))
+
+
+@pytest.fixture(scope="session")
+def user_pool(request, api_client, settings, cleanup_manager) -> Generator[EntityPool, None, None]:
+    """Users bulk-created at session start and bulk-deleted at session end."""
+    size, shared = _pool_sizes(request, "created_user", "shared_user", settings.fixture_pool_size)
+    yield from _pool_fixture(EntityPool(
+        "user",
+        lambda: User.create().to_payload(),
+        create_many=api_client.user.create_many,
+        delete_many=api_client.user.delete_many,
+        key="username",
+        size=size,
+        shared=shared,
+        use_response_body=False,
+        cleanup=cleanup_manager
+    ))
 
 
 @pytest.fixture
-def created_user(api_client, user_data) -> Generator[dict, None, None]:
+def created_pet(pet_pool) -> dict:
     """
-    Create a user and clean up after test.
+    Lease a pre-created pet for exclusive use (may be modified or deleted).
     
-    Yields:
-        Created user data
+    Returns:
+        Created pet data with ID
+    """
+    return pet_pool.lease()
+
+
+@pytest.fixture
+def created_order(order_pool) -> dict:
     """
-    response = api_client.create_user(user_data)
-    assert response.status_code == 200, f"Failed to create user: {response.text}"
+    Lease a pre-placed order for exclusive use (may be modified or deleted).
     
-    yield user_data
+    Returns:
+        Created order data with ID
+    """
+    return order_pool.lease()
+
+
+@pytest.fixture
+def created_user(user_pool) -> dict:
+    """
+    Lease a pre-created user for exclusive use (may be modified or deleted).
     
-    # Cleanup
-    if "username" in user_data:
-        try:
-            api_client.delete_user(user_data["username"])
-        except Exception:
-            pass  # User might already be deleted
+    Returns:
+        Created user data
+    """
+    return user_pool.lease()
 
+
+@pytest.fixture
+def shared_pet(pet_pool) -> dict:
+    """Pre-created pet shared by read-only tests (must not be modified)."""
+    return pet_pool.shared()
+
+
+@pytest.fixture
+def shared_order(order_pool) -> dict:
+    """Pre-placed order shared by read-only tests (must not be modified)."""
+    return order_pool.shared()
+
+
+@pytest.fixture
+def shared_user(user_pool) -> dict:
+    """Pre-created user shared by read-only tests (must not be modified)."""
+    return user_pool.shared()
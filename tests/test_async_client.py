@@ -0,0 +1,73 @@
+"""Tests for AsyncAPIClient against the in-process Petstore server (offline, no external API calls)."""
+import asyncio
+
+import pytest
+
+from src.api_client import AsyncAPIClient
+from src.local_server import LocalPetstoreServer
+from src.models import Order, Pet
+
+
+@pytest.mark.pet
+class TestAsyncAPIClient:
+    """Round trips through the async client and its services."""
+    
+    @pytest.mark.positive
+    def test_pet_round_trip(self):
+        """A pet created through the async client can be read back and deleted."""
+        pet_data = Pet.create().to_payload()
+        
+        async def run(base_url: str) -> tuple:
+            async with AsyncAPIClient(base_url=base_url, validate_schemas=False) as api:
+                created = await api.pet.create(pet_data)
+                fetched = await api.pet.get_by_id(pet_data["id"])
+                deleted = await api.pet.delete(pet_data["id"])
+                missing = await api.pet.get_by_id(pet_data["id"])
+                return created, fetched, deleted, missing
+        
+        with LocalPetstoreServer() as server:
+            created, fetched, deleted, missing = asyncio.run(run(server.base_url))
+        
+        assert created.status_code == 200
+        assert fetched.status_code == 200
+        assert fetched.json()["name"] == pet_data["name"]
+        assert deleted.status_code == 200
+        assert missing.status_code == 404
+    
+    @pytest.mark.positive
+    def test_concurrent_requests(self):
+        """Requests gathered on one client all complete over the shared pool."""
+        pets = [Pet.create().to_payload() for _ in range(20)]
+        
+        async def run(base_url: str) -> list:
+            async with AsyncAPIClient(
+                base_url=base_url, validate_schemas=False, max_connections=5
+            ) as api:
+                await asyncio.gather(*(api.pet.create(pet) for pet in pets))
+                return await asyncio.gather(*(api.pet.get_by_id(pet["id"]) for pet in pets))
+        
+        with LocalPetstoreServer() as server:
+            responses = asyncio.run(run(server.base_url))
+        
+        assert [r.status_code for r in responses] == [200] * len(pets)
+        assert [r.json()["id"] for r in responses] == [pet["id"] for pet in pets]
+    
+    @pytest.mark.positive
+    def test_batch_methods_are_awaitable(self):
+        """Service batch methods return BatchResults in input order with the async client."""
+        pets = [Pet.create().to_payload() for _ in range(5)]
+        
+        async def run(base_url: str) -> tuple:
+            async with AsyncAPIClient(base_url=base_url, validate_schemas=False) as api:
+                created = await api.pet.create_many(pets)
+                order = await api.store.place_order(Order.create(pet_id=pets[0]["id"]).to_payload())
+                inventory = await api.store.get_inventory()
+                return created, order, inventory
+        
+        with LocalPetstoreServer() as server:
+            created, order, inventory = asyncio.run(run(server.base_url))
+        
+        assert [r.item["id"] for r in created] == [pet["id"] for pet in pets]
+        assert all(r.ok for r in created)
+        assert order.status_code == 200
+        assert inventory.json()["available"] >= len(pets)
@@ -0,0 +1,104 @@
+"""Tests for the record/replay cassette transport (uses the in-process server)."""
+import pytest
+
+from src.http import BaseHTTPClient, Cassette, CassetteMiss
+from src.http.cassette import merge_worker_cassettes, worker_cassette_path
+from src.local_server import LocalPetstoreServer
+from src.models import Pet
+
+
+@pytest.mark.pet
+class TestCassette:
+    """Tests for Cassette and CassetteAdapter."""
+    
+    @pytest.mark.positive
+    def test_replay_returns_recorded_responses(self, tmp_path):
+        """Exchanges recorded against the server replay without it."""
+        path = tmp_path / "petstore.jsonl"
+        pet = Pet.create(name="cassette").model_dump(mode="json", exclude_none=True)
+        
+        with LocalPetstoreServer() as server:
+            with BaseHTTPClient(base_url=server.base_url, cassette_mode="record", cassette_path=str(path)) as client:
+                created = client.post("/pet", "/pet", json=pet)
+                fetched = client.get(f"/pet/{pet['id']}", "/pet/{petId}")
+        
+        with BaseHTTPClient(base_url=server.base_url, cassette_mode="replay", cassette_path=str(path)) as client:
+            assert client.post("/pet", "/pet", json=pet).json() == created.json()
+            replayed = client.get(f"/pet/{pet['id']}", "/pet/{petId}")
+        
+        assert replayed.status_code == fetched.status_code
+        assert replayed.json() == fetched.json()
+    
+    @pytest.mark.positive
+    def test_replay_ignores_host_and_port(self, tmp_path):
+        """A recording made against the random-port local server replays against any host."""
+        path = tmp_path / "petstore.jsonl"
+        
+        with LocalPetstoreServer() as server:
+            with BaseHTTPClient(base_url=server.base_url, cassette_mode="record", cassette_path=str(path)) as client:
+                recorded = client.get("/pet/findByStatus", "/pet/findByStatus", params={"status": "sold"})
+        
+        with BaseHTTPClient(base_url="http://127.0.0.1:9/v2", cassette_mode="replay", cassette_path=str(path)) as client:
+            replayed = client.get("/pet/findByStatus", "/pet/findByStatus", params={"status": "sold"})
+        
+        assert replayed.json() == recorded.json()
+        assert Cassette.make_key("GET", "http://a:1/v2/pet?x=1", None) == \
+            Cassette.make_key("GET", "https://b/v2/pet?x=1", None)
+        assert Cassette.make_key("GET", "http://a/v2/pet?x=1", None) != \
+            Cassette.make_key("GET", "http://a/v2/pet?x=2", None)
+    
+    @pytest.mark.positive
+    def test_worker_recordings_are_merged(self, tmp_path):
+        """Workers record to their own files; merging replaces the shared cassette with all of them."""
+        path = tmp_path / "petstore.jsonl"
+        path.write_text('{"key": "%s", "entry": {"stale": true}}\n' % ("0" * 64), encoding="utf-8")
+        keys = {worker: Cassette.make_key("GET", f"http://host/v2/{worker}", None) for worker in ("gw0", "gw1")}
+        
+        for worker, key in keys.items():
+            cassette = Cassette(path, worker_cassette_path(path, worker))
+            cassette.record(key, {"worker": worker}, truncate=True)
+            cassette.close()
+        
+        assert merge_worker_cassettes(path, "record") == 2
+        
+        merged = Cassette(path)
+        assert {worker: merged.lookup(key)["worker"] for worker, key in keys.items()} == {"gw0": "gw0", "gw1": "gw1"}
+        assert merged.lookup("0" * 64) is None
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["petstore.jsonl"]
+        merged.close()
+    
+    @pytest.mark.boundary
+    def test_record_mode_truncates_once_per_process(self, tmp_path):
+        """A second record-mode client on the same file appends instead of wiping the first one's recording."""
+        path = tmp_path / "shared.jsonl"
+        first, second = Cassette(path), Cassette(path)
+        key_a = Cassette.make_key("GET", "http://host/a", None)
+        key_b = Cassette.make_key("GET", "http://host/b", None)
+        
+        first.record(key_a, {"n": 1}, truncate=True)
+        second.record(key_b, {"n": 2}, truncate=True)
+        
+        reader = Cassette(path)
+        assert reader.lookup(key_a) == {"n": 1}
+        assert reader.lookup(key_b) == {"n": 2}
+        reader.close()
+    
+    @pytest.mark.boundary
+    def test_repeated_requests_replay_in_order(self, tmp_path):
+        """Identical requests replay in recorded order, then repeat the last."""
+        cassette = Cassette(tmp_path / "c.jsonl")
+        key = Cassette.make_key("GET", "http://host/pet/1", None)
+        cassette.record(key, {"n": 1})
+        cassette.record(key, {"n": 2})
+        cassette.close()
+        
+        assert [cassette.lookup(key)["n"] for _ in range(3)] == [1, 2, 2]
+    
+    @pytest.mark.negative
+    def test_replay_miss_raises(self, tmp_path):
+        """Unrecorded requests fail in replay mode instead of hitting the network."""
+        path = tmp_path / "empty.jsonl"
+        
+        with BaseHTTPClient(base_url="http://127.0.0.1:9", cassette_mode="replay", cassette_path=str(path)) as client:
+            with pytest.raises(CassetteMiss):
+                client.get("/pet/1", "/pet/{petId}")
@@ -0,0 +1,112 @@
+"""Tests for CleanupManager with fake deleters (offline, no API calls)."""
+import threading
+
+import pytest
+
+from src.cleanup import CleanupManager
+
+
+class _Response:
+    """Minimal response with a status code."""
+    
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class _FlakyDeleter:
+    """Deleter returning queued outcomes (status codes or exceptions), then the last one forever."""
+    
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls: list = []
+        self._lock = threading.Lock()
+    
+    def __call__(self, key):
+        with self._lock:
+            self.calls.append(key)
+            outcome = self.outcomes.pop(0) if len(self.outcomes) > 1 else self.outcomes[0]
+        if isinstance(outcome, Exception):
+            raise outcome
+        return _Response(outcome)
+
+
+class TestCleanupManager:
+    """Tests for retries, 404 handling and the leak report."""
+    
+    @pytest.mark.positive
+    def test_failed_deletes_are_retried(self):
+        """Exceptions and 5xx responses are retried until the delete succeeds."""
+        deleter = _FlakyDeleter(ConnectionError("reset"), 500, 200)
+        manager = CleanupManager({"pet": deleter}, max_attempts=3, backoff_factor=0)
+        
+        manager.schedule("pet", 1)
+        report = manager.drain(timeout=10)
+        
+        assert deleter.calls == [1, 1, 1]
+        assert report == {"scheduled": 1, "deleted": 1, "already_deleted": 0, "leaked": []}
+    
+    @pytest.mark.positive
+    def test_404_counts_as_already_deleted(self):
+        """Entities the test already removed are not retried or reported."""
+        deleter = _FlakyDeleter(404)
+        manager = CleanupManager({"pet": deleter}, backoff_factor=0)
+        
+        manager.schedule("pet", 7)
+        report = manager.drain(timeout=10)
+        
+        assert deleter.calls == [7]
+        assert report["already_deleted"] == 1
+        assert report["leaked"] == []
+    
+    @pytest.mark.negative
+    def test_persistent_failures_are_reported_as_leaked(self):
+        """Entities still failing after max_attempts end up in the leak report."""
+        manager = CleanupManager({"user": _FlakyDeleter(500)}, max_attempts=2, backoff_factor=0)
+        
+        manager.schedule("user", "alice")
+        report = manager.drain(timeout=10)
+        
+        assert report["deleted"] == 0
+        assert report["leaked"] == [{"kind": "user", "key": "alice", "reason": "status 500"}]
+    
+    @pytest.mark.boundary
+    def test_queued_deletes_wait_for_drain(self):
+        """Without background mode nothing is deleted before drain()."""
+        deleter = _FlakyDeleter(200)
+        manager = CleanupManager({"order": deleter}, background=False)
+        
+        for order_id in (1, 2, 3):
+            manager.schedule("order", order_id)
+        manager.schedule("order", None)
+        
+        assert deleter.calls == []
+        assert manager.drain(timeout=10)["deleted"] == 3
+        assert sorted(deleter.calls) == [1, 2, 3]
+    
+    @pytest.mark.negative
+    def test_drain_timeout_cancels_queued_deletes(self):
+        """Deletes not started before the timeout are cancelled and reported; none run afterwards."""
+        release = threading.Event()
+        calls: list[int] = []
+        
+        def blocking_delete(key: int) -> _Response:
+            calls.append(key)
+            release.wait(10)
+            return _Response(200)
+        
+        manager = CleanupManager({"pet": blocking_delete}, max_workers=1)
+        for pet_id in range(5):
+            manager.schedule("pet", pet_id)
+        
+        threading.Timer(0.5, release.set).start()
+        report = manager.drain(timeout=0.1)
+        
+        assert calls == [0]
+        assert report["deleted"] == 1
+        assert sorted(e["key"] for e in report["leaked"]) == [1, 2, 3, 4]
+    
+    @pytest.mark.negative
+    def test_unknown_kind_raises(self):
+        """Scheduling an entity kind without a deleter fails immediately."""
+        with pytest.raises(ValueError):
+            CleanupManager({"pet": _FlakyDeleter(200)}).schedule("order", 1)
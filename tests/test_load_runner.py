@@ -0,0 +1,130 @@
+"""Tests for the load generation driver against the in-process Petstore server (offline)."""
+import random
+
+import pytest
+
+from src.load_runner import (
+    LoadRunner,
+    LoadStats,
+    Scenario,
+    browse_pets,
+    check_inventory,
+    percentile,
+    pet_lifecycle,
+)
+from src.local_server import LocalPetstoreServer
+from src.models import get_id_allocator
+
+
+class _PetService:
+    """Pet service stub recording the statuses searched for."""
+    
+    def __init__(self):
+        self.statuses: list[str] = []
+    
+    def find_by_status(self, status: str) -> None:
+        self.statuses.append(status)
+
+
+class _API:
+    """API client stub exposing only the pet service."""
+    
+    def __init__(self):
+        self.pet = _PetService()
+
+
+class TestLoadStats:
+    """Tests for percentile() and LoadStats.summary()."""
+    
+    @pytest.mark.boundary
+    def test_nearest_rank_percentile(self):
+        """Percentiles pick the nearest-rank value; an empty list yields 0."""
+        values = [float(v) for v in range(1, 11)]
+        
+        assert [percentile(values, pct) for pct in (1, 50, 90, 99, 100)] == [1.0, 5.0, 9.0, 10.0, 10.0]
+        assert percentile([], 50) == 0.0
+    
+    @pytest.mark.positive
+    def test_summary_counts_errors_and_statuses(self):
+        """The summary reports counts, errors, statuses and latencies in ms."""
+        stats = LoadStats()
+        for latency, status in ((0.01, 200), (0.02, 200), (0.03, 503)):
+            stats.record("GET /store/inventory", latency, status, error=status >= 500)
+        stats.record("GET /store/inventory", 0.5, error=True)
+        
+        entry = stats.summary(elapsed=2.0)["GET /store/inventory"]
+        
+        assert entry["count"] == 4
+        assert entry["errors"] == 2
+        assert entry["throughput_rps"] == 2.0
+        assert entry["statuses"] == {"200": 2, "503": 1}
+        assert entry["p50_ms"] == 20.0
+        assert entry["max_ms"] == 500.0
+
+
+@pytest.mark.store
+class TestLoadRunner:
+    """Short load runs against the local server."""
+    
+    @pytest.mark.positive
+    def test_closed_loop_run(self):
+        """Closed-loop users run scenarios back to back and every request is recorded."""
+        scenarios = [Scenario("browse_pets", browse_pets, 3), Scenario("check_inventory", check_inventory, 1)]
+        
+        with LocalPetstoreServer() as server:
+            report = LoadRunner(
+                scenarios, duration=0.5, concurrency=2, open_loop=False, base_url=server.base_url
+            ).run()
+        
+        assert report["mode"] == "closed"
+        assert set(report["scenarios"]) == {"browse_pets", "check_inventory"}
+        assert all(entry["errors"] == 0 for entry in report["scenarios"].values())
+        
+        operations = report["operations"]
+        assert operations["GET /pet/findByStatus"]["count"] == report["scenarios"]["browse_pets"]["count"]
+        assert operations["GET /store/inventory"]["statuses"] == {
+            "200": report["scenarios"]["check_inventory"]["count"]
+        }
+        for entry in operations.values():
+            assert entry["p50_ms"] <= entry["p99_ms"] <= entry["max_ms"]
+    
+    @pytest.mark.positive
+    def test_open_loop_run(self):
+        """Open-loop arrivals start scenarios at roughly the target rate."""
+        with LocalPetstoreServer() as server:
+            report = LoadRunner(
+                [Scenario("pet_lifecycle", pet_lifecycle)],
+                duration=1.0, rps=40, concurrency=4, base_url=server.base_url
+            ).run()
+        
+        lifecycle = report["scenarios"]["pet_lifecycle"]
+        operations = report["operations"]
+        
+        assert report["mode"] == "open"
+        assert 10 <= lifecycle["count"] <= 100
+        assert lifecycle["errors"] == 0
+        for name in ("POST /pet", "GET /pet/findByStatus", "POST /store/order", "DELETE /pet/{petId}"):
+            assert operations[name]["count"] == lifecycle["count"]
+            assert operations[name]["errors"] == 0
+    
+    @pytest.mark.negative
+    def test_invalid_configuration(self):
+        """A runner needs scenarios, and open-loop mode needs a target rate."""
+        with pytest.raises(ValueError):
+            LoadRunner([], rps=10)
+        with pytest.raises(ValueError):
+            LoadRunner([Scenario("browse_pets", browse_pets)], rps=None)
+    
+    @pytest.mark.positive
+    def test_browse_pets_uses_factory_random(self, monkeypatch):
+        """Scenario choices come from the seeded factory generator, so seeded runs repeat."""
+        runs = []
+        for _ in range(2):
+            monkeypatch.setattr(get_id_allocator(), "random", random.Random(7))
+            api = _API()
+            for _ in range(20):
+                browse_pets(api)
+            runs.append(api.pet.statuses)
+        
+        assert runs[0] == runs[1]
+        assert set(runs[0]) == {"available", "pending", "sold"}
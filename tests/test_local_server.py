@@ -0,0 +1,34 @@
+"""Tests for the in-process Petstore server (offline, no external API calls)."""
+import http.client
+import statistics
+import time
+from urllib.parse import urlsplit
+
+import pytest
+
+from src.local_server import LocalPetstoreServer
+
+
+@pytest.mark.store
+class TestLocalServerLatency:
+    """Tests for request latency of the local server."""
+    
+    @pytest.mark.positive
+    def test_keep_alive_round_trip_is_fast(self):
+        """Requests on a kept-alive connection are not delayed by Nagle/delayed-ACK stalls (~40 ms)."""
+        with LocalPetstoreServer() as server:
+            url = urlsplit(server.base_url)
+            connection = http.client.HTTPConnection(url.hostname, url.port, timeout=5)
+            timings = []
+            try:
+                for _ in range(20):
+                    start = time.perf_counter()
+                    connection.request("GET", f"{url.path}/store/inventory")
+                    response = connection.getresponse()
+                    response.read()
+                    timings.append(time.perf_counter() - start)
+                    assert response.status == 200
+            finally:
+                connection.close()
+        
+        assert statistics.median(timings[1:]) < 0.02
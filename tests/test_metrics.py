@@ -0,0 +1,114 @@
+"""Tests for latency histograms (offline, no API calls)."""
+import asyncio
+import random
+
+import pytest
+
+from src.http import AsyncBaseHTTPClient, BaseHTTPClient, LatencyHistogram, LatencyMetrics, get_latency_metrics
+from src.local_server import LocalPetstoreServer
+
+
+def _recorded_keys(metrics: LatencyMetrics) -> list[tuple]:
+    """Get the (method, path_template, status) keys of all recorded operations."""
+    return [(op["method"], op["path_template"], op["status"]) for op in metrics.summary()]
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram and LatencyMetrics."""
+    
+    @pytest.mark.positive
+    def test_percentiles_within_one_percent(self):
+        """Percentiles match exact values within the bucket precision."""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(-4, 1) for _ in range(20000)]
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+        
+        exact = sorted(values)
+        for pct in (50, 95, 99):
+            expected_ms = exact[int(pct / 100 * len(exact)) - 1] * 1000
+            assert histogram.percentile(pct) == pytest.approx(expected_ms, rel=0.01, abs=0.002)
+    
+    @pytest.mark.positive
+    def test_merged_dumps_equal_single_recording(self, tmp_path):
+        """Per-worker dumps merge into the same histogram as one process."""
+        values = [i / 10000 for i in range(1, 1001)]
+        single, worker_a, worker_b = LatencyMetrics(), LatencyMetrics(), LatencyMetrics()
+        for i, value in enumerate(values):
+            single.record("GET", "/pet/{petId}", 200, {"total": value})
+            (worker_a if i % 2 else worker_b).record("GET", "/pet/{petId}", 200, {"total": value})
+        worker_a.dump(tmp_path / "gw0.json")
+        worker_b.dump(tmp_path / "gw1.json")
+        
+        merged = LatencyMetrics.merge_files([tmp_path / "gw0.json", tmp_path / "gw1.json"])
+        
+        assert merged.summary() == single.summary()
+    
+    @pytest.mark.boundary
+    def test_empty_histogram(self):
+        """An empty histogram reports zeros instead of failing."""
+        assert LatencyHistogram().summary()["p99_ms"] == 0.0
+
+
+class TestClientLatencyMetrics:
+    """Tests for latency metrics injected into the HTTP clients (local server)."""
+    
+    @pytest.mark.positive
+    def test_client_uses_injected_empty_metrics(self):
+        """A fresh (empty, hence falsy) LatencyMetrics is used instead of the process-wide one."""
+        metrics = LatencyMetrics()
+        
+        with LocalPetstoreServer() as server:
+            with BaseHTTPClient(base_url=server.base_url, validate_schemas=False, latency_metrics=metrics) as client:
+                assert client.latency_metrics is metrics
+                client.request("GET", "/store/inventory", path_template="/store/inventory")
+        
+        assert len(metrics) == 1
+        assert metrics is not get_latency_metrics()
+    
+    @pytest.mark.positive
+    def test_async_client_uses_injected_empty_metrics(self):
+        """The async client keeps an injected empty LatencyMetrics as well."""
+        metrics = LatencyMetrics()
+        
+        async def run(base_url: str) -> None:
+            async with AsyncBaseHTTPClient(
+                base_url=base_url, validate_schemas=False, latency_metrics=metrics
+            ) as client:
+                assert client.latency_metrics is metrics
+                await client.request("GET", "/store/inventory", path_template="/store/inventory")
+        
+        with LocalPetstoreServer() as server:
+            asyncio.run(run(server.base_url))
+        
+        assert len(metrics) == 1
+    
+    @pytest.mark.positive
+    def test_client_keys_metrics_by_path_template(self):
+        """Requests to different pet IDs share the /pet/{petId} histogram."""
+        metrics = LatencyMetrics()
+        
+        with LocalPetstoreServer() as server:
+            with BaseHTTPClient(base_url=server.base_url, validate_schemas=False, latency_metrics=metrics) as client:
+                for pet_id in (101, 102):
+                    client.request("GET", f"/pet/{pet_id}", path_template="/pet/{petId}")
+        
+        assert _recorded_keys(metrics) == [("GET", "/pet/{petId}", "404")]
+    
+    @pytest.mark.positive
+    def test_async_client_keys_metrics_by_path_template(self):
+        """The async client records templated paths under the template, not the concrete URL."""
+        metrics = LatencyMetrics()
+        
+        async def run(base_url: str) -> None:
+            async with AsyncBaseHTTPClient(
+                base_url=base_url, validate_schemas=False, latency_metrics=metrics
+            ) as client:
+                for pet_id in (101, 102):
+                    await client.request("GET", f"/pet/{pet_id}", path_template="/pet/{petId}")
+        
+        with LocalPetstoreServer() as server:
+            asyncio.run(run(server.base_url))
+        
+        assert _recorded_keys(metrics) == [("GET", "/pet/{petId}", "404")]
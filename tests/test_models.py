@@ -0,0 +1,171 @@
+"""Tests for bulk test-data factories (offline, no API calls)."""
+import threading
+import warnings
+
+import pytest
+from pydantic import ValidationError
+
+from src.models import (
+    Category,
+    IdAllocator,
+    Order,
+    OrderStatus,
+    Pet,
+    Tag,
+    User,
+    set_factory_validation,
+)
+from src.models.base import factory_validation_enabled
+from src.models.store import POOL_ORDER_IDS, TEST_ORDER_IDS
+from src.parallel import worker_id_range
+
+
+class TestFactoryModels:
+    """Tests for trusted (unvalidated) factory construction."""
+    
+    @pytest.mark.positive
+    @pytest.mark.parametrize("model", [Pet, Order, User])
+    def test_trusted_payload_matches_validated_model(self, model):
+        """Payloads of trusted models equal those of fully validated models."""
+        payload = model.create().to_payload()
+        
+        assert model.model_validate(payload).model_dump(mode="json", by_alias=True, exclude_none=True) == payload
+    
+    @pytest.mark.negative
+    def test_caller_arguments_are_validated(self):
+        """Invalid factory arguments raise even with factory validation disabled."""
+        enabled = factory_validation_enabled()
+        try:
+            for flag in (False, True):
+                set_factory_validation(flag)
+                with pytest.raises(ValidationError):
+                    Pet.create(name=123)
+        finally:
+            set_factory_validation(enabled)
+    
+    @pytest.mark.positive
+    def test_caller_arguments_are_coerced(self):
+        """Enum strings and nested dicts become models, so to_payload() does not warn."""
+        order = Order.create(status="placed")
+        pet = Pet.create(category={"id": 1, "name": "dogs"}, tags=[{"id": 2, "name": "tag"}], status="sold")
+        
+        assert order.status is OrderStatus.PLACED
+        assert isinstance(pet.category, Category)
+        assert isinstance(pet.tags[0], Tag)
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert order.to_payload()["status"] == "placed"
+            payload = pet.to_payload()
+        assert payload["category"] == {"id": 1, "name": "dogs"}
+        assert payload["tags"] == [{"id": 2, "name": "tag"}]
+        assert payload["status"] == "sold"
+
+
+class TestCreateBatch:
+    """Tests for Pet/Order/User.create_batch."""
+    
+    @pytest.mark.positive
+    @pytest.mark.parametrize("model", [Pet, Order, User])
+    def test_rows_are_valid_models(self, model):
+        """Every generated row validates against the model and round-trips unchanged."""
+        for row in model.create_batch(50, seed=1):
+            assert model.model_validate(row).model_dump(mode="json", exclude_none=True) == row
+    
+    @pytest.mark.positive
+    @pytest.mark.parametrize("model, kwargs", [
+        (Pet, {}),
+        (Order, {"ship_date": "2024-01-01T00:00:00+00:00"}),
+        (User, {}),
+    ])
+    def test_same_seed_same_batch(self, model, kwargs):
+        """Batches are reproducible from their seed (IDs come from the allocator)."""
+        def fields(seed):
+            return [{k: v for k, v in row.items() if k != "id"} for row in model.create_batch(100, seed=seed, **kwargs)]
+        
+        assert fields(42) == fields(42)
+        assert fields(42) != fields(43)
+    
+    @pytest.mark.boundary
+    def test_unique_keys_within_batch(self):
+        """Pet IDs and usernames do not repeat within a batch."""
+        pets = Pet.create_batch(1000, seed=3)
+        users = User.create_batch(5000, seed=3)
+        
+        assert len({pet["id"] for pet in pets}) == len(pets)
+        assert len({user["username"] for user in users}) == len(users)
+    
+    @pytest.mark.boundary
+    def test_batch_ids_do_not_repeat_across_batches(self):
+        """Consecutive batches draw fresh IDs from the shared allocator."""
+        first = {pet["id"] for pet in Pet.create_batch(100, seed=1)}
+        second = {pet["id"] for pet in Pet.create_batch(100, seed=1)}
+        
+        assert not first & second
+
+
+class TestIdAllocator:
+    """Tests for seeded, collision-free ID allocation."""
+    
+    @pytest.mark.positive
+    def test_same_seed_same_ids(self):
+        """Allocators with the same seed hand out the same sequence."""
+        first, second = IdAllocator(seed=7), IdAllocator(seed=7)
+        
+        assert first.next_ids(1000, 9999, 50) == second.next_ids(1000, 9999, 50)
+        assert first.random.random() == second.random.random()
+    
+    @pytest.mark.positive
+    def test_ids_stay_in_range_and_wrap(self):
+        """IDs stay within this worker's part of the range and only repeat once it is exhausted."""
+        start, end = worker_id_range(1, 100)
+        size = end - start + 1
+        ids = IdAllocator(seed=3).next_ids(1, 100, 2 * size)
+        
+        assert sorted(ids[:size]) == list(range(start, end + 1))
+        assert ids[size:] == ids[:size]
+    
+    @pytest.mark.negative
+    def test_exhausted_range_raises_without_wrap(self):
+        """wrap=False refuses to hand out an ID twice."""
+        start, end = worker_id_range(1, 100)
+        allocator = IdAllocator(seed=3)
+        allocator.next_ids(1, 100, end - start + 1, wrap=False)
+        
+        with pytest.raises(RuntimeError):
+            allocator.next_id(1, 100, wrap=False)
+    
+    @pytest.mark.boundary
+    def test_range_smaller_than_worker_count_raises(self, monkeypatch):
+        """A range that cannot give every worker an ID fails instead of being shared."""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "5")
+        
+        with pytest.raises(ValueError):
+            IdAllocator(seed=3).next_id(*TEST_ORDER_IDS)
+    
+    @pytest.mark.positive
+    def test_pool_and_test_order_ids_are_disjoint(self):
+        """Orders reserved by the session pool never share an ID with orders placed by tests."""
+        pool = set(range(POOL_ORDER_IDS[0], POOL_ORDER_IDS[1] + 1))
+        tests = set(range(TEST_ORDER_IDS[0], TEST_ORDER_IDS[1] + 1))
+        
+        assert not pool & tests
+        assert {Order.create().id for _ in range(20)} <= tests
+    
+    @pytest.mark.boundary
+    def test_no_collisions_across_threads(self):
+        """Concurrent threads never receive the same ID."""
+        allocator = IdAllocator(seed=11)
+        results: list[list[int]] = [[] for _ in range(16)]
+        
+        def allocate(out: list[int]) -> None:
+            for _ in range(500):
+                out.append(allocator.next_id(10000, 99999))
+        
+        threads = [threading.Thread(target=allocate, args=(out,)) for out in results]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        ids = [i for out in results for i in out]
+        assert len(set(ids)) == len(ids)
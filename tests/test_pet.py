@@ -12,11 +12,12 @@ class TestCreatePet:
     """Tests for POST /pet endpoint."""
     
     @pytest.mark.positive
-    def test_create_pet_with_all_fields(self, api_client, pet_data, schema_validator):
+    def test_create_pet_with_all_fields(self, api_client, pet_data, schema_validator, cleanup):
         """Create a new pet with all fields and validate response schema."""
         logger.info(f"Creating pet with data: {pet_data['name']}")
         
         response = api_client.create_pet(pet_data)
+        cleanup.pet(pet_data["id"])
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         
@@ -30,13 +31,9 @@ class TestCreatePet:
         # Validate response content
         assert response_data["name"] == pet_data["name"]
         assert "id" in response_data
-        
-        # Cleanup
-        if "id" in response_data:
-            api_client.delete_pet(response_data["id"])
     
     @pytest.mark.positive
-    def test_create_pet_with_minimal_fields(self, api_client, minimal_pet_data, schema_validator):
+    def test_create_pet_with_minimal_fields(self, api_client, minimal_pet_data, schema_validator, cleanup):
         """Create a new pet with only required fields (name, photoUrls)."""
         logger.info(f"Creating pet with minimal data: {minimal_pet_data['name']}")
         
@@ -46,13 +43,12 @@ class TestCreatePet:
         
         response_data = response.json()
         
+        # The server assigns the ID of a pet created without one
+        cleanup.pet(response_data.get("id"))
+        
         # Validate required fields are present
         assert "name" in response_data
         assert "photoUrls" in response_data
-        
-        # Cleanup
-        if "id" in response_data:
-            api_client.delete_pet(response_data["id"])
     
     @pytest.mark.negative
     def test_create_pet_missing_required_name(self, api_client, schema_validator):
@@ -111,9 +107,9 @@ class TestGetPet:
     """Tests for GET /pet/{petId} endpoint."""
     
     @pytest.mark.positive
-    def test_get_existing_pet(self, api_client, created_pet, schema_validator):
+    def test_get_existing_pet(self, api_client, shared_pet, schema_validator):
         """Get an existing pet by ID and validate response schema."""
-        pet_id = created_pet["id"]
+        pet_id = shared_pet["id"]
         logger.info(f"Getting pet with ID: {pet_id}")
         
         response = api_client.get_pet_by_id(pet_id)
@@ -129,7 +125,7 @@ class TestGetPet:
         
         # Validate content matches
         assert response_data["id"] == pet_id
-        assert response_data["name"] == created_pet["name"]
+        assert response_data["name"] == shared_pet["name"]
     
     @pytest.mark.negative
     def test_get_non_existing_pet(self, api_client):
@@ -273,13 +269,17 @@ class TestUpdatePet:
         assert response_data["status"] == "sold"
     
     @pytest.mark.negative
-    def test_update_non_existing_pet(self, api_client):
+    def test_update_non_existing_pet(self, api_client, cleanup):
         """Attempt to update a pet that doesn't exist."""
-        pet_data = Pet.create(id=999999999).model_dump(by_alias=True, exclude_none=True)
+        # A fresh allocator ID; a fixed one would be left behind by the upsert
+        # and make test_delete_non_existing_pet find it on the local server
+        pet_data = Pet.create().model_dump(by_alias=True, exclude_none=True)
         
-        logger.info(f"Attempting to update non-existing pet")
+        logger.info(f"Attempting to update non-existing pet ID: {pet_data['id']}")
         
         response = api_client.update_pet(pet_data)
+        # The API upserts on PUT /pet, so the pet may exist now
+        cleanup.pet(pet_data["id"])
         
         # API might return 404 or create a new pet
         logger.info(f"Response status: {response.status_code}")
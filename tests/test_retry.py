@@ -0,0 +1,169 @@
+"""Tests for the retry policy, retry budget and Retry-After parsing (offline, no API calls)."""
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from src.http.retry import RetryBudget, RetryPolicy, parse_retry_after
+
+
+class _Response:
+    """Minimal response with a status code and headers."""
+    
+    def __init__(self, status_code: int, headers: dict = None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+def _refused() -> requests.exceptions.ConnectionError:
+    """Build the error requests raises when the server refuses the connection."""
+    reason = NewConnectionError(None, "Failed to establish a new connection: [Errno 111] Connection refused")
+    return requests.exceptions.ConnectionError(MaxRetryError(None, "/pet", reason))
+
+
+def _reset() -> requests.exceptions.ConnectionError:
+    """Build the error requests raises when the connection breaks after sending."""
+    return requests.exceptions.ConnectionError(ProtocolError("Connection aborted.", ConnectionResetError()))
+
+
+class TestShouldRetry:
+    """Tests for RetryPolicy.should_retry."""
+    
+    @pytest.mark.positive
+    @pytest.mark.parametrize("status", [429, 502, 503, 504])
+    def test_idempotent_methods_retry_transient_statuses(self, status):
+        """GET is retried on transient statuses."""
+        assert RetryPolicy().should_retry("GET", 1, response=_Response(status))
+    
+    @pytest.mark.negative
+    @pytest.mark.parametrize("status", [200, 400, 404, 500])
+    def test_other_statuses_are_not_retried(self, status):
+        """Successes, client errors and 500 are final."""
+        assert not RetryPolicy().should_retry("GET", 1, response=_Response(status))
+    
+    @pytest.mark.negative
+    def test_post_is_not_retried_after_a_response(self):
+        """A POST that got a response may have had side effects."""
+        assert not RetryPolicy().should_retry("POST", 1, response=_Response(503))
+    
+    @pytest.mark.positive
+    @pytest.mark.parametrize("error", [requests.exceptions.ConnectTimeout(), _refused()])
+    def test_post_is_retried_when_never_sent(self, error):
+        """Connect timeouts and refused connections are retried for every method."""
+        assert RetryPolicy().should_retry("POST", 1, error=error)
+    
+    @pytest.mark.negative
+    @pytest.mark.parametrize("error", [requests.exceptions.ReadTimeout(), _reset()])
+    def test_post_is_not_retried_after_sending(self, error):
+        """Read timeouts and broken connections are only retried for idempotent methods."""
+        policy = RetryPolicy()
+        
+        assert not policy.should_retry("POST", 1, error=error)
+        assert policy.should_retry("PUT", 1, error=error)
+    
+    @pytest.mark.negative
+    def test_unrelated_errors_are_not_retried(self):
+        """Errors other than connection problems are raised immediately."""
+        assert not RetryPolicy().should_retry("GET", 1, error=ValueError("bad"))
+    
+    @pytest.mark.boundary
+    def test_attempt_limit(self):
+        """No retry once max_attempts attempts were made."""
+        policy = RetryPolicy(max_attempts=3)
+        
+        assert policy.should_retry("GET", 2, response=_Response(503))
+        assert not policy.should_retry("GET", 3, response=_Response(503))
+        assert not RetryPolicy(max_attempts=1).should_retry("GET", 1, error=_refused())
+    
+    @pytest.mark.positive
+    def test_retry_non_idempotent(self):
+        """retry_non_idempotent treats POST like an idempotent method."""
+        assert RetryPolicy(retry_non_idempotent=True).should_retry("post", 1, response=_Response(503))
+
+
+class TestGetDelay:
+    """Tests for RetryPolicy.get_delay."""
+    
+    @pytest.mark.positive
+    def test_exponential_backoff(self):
+        """Without jitter the delay doubles each attempt up to max_backoff."""
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+        
+        assert [policy.get_delay(attempt) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 3, 3]
+    
+    @pytest.mark.boundary
+    def test_jitter_stays_within_backoff(self):
+        """Jittered delays lie between 0 and the computed backoff."""
+        policy = RetryPolicy(backoff_factor=1, max_backoff=30)
+        
+        assert all(0 <= policy.get_delay(3) <= 4 for _ in range(100))
+    
+    @pytest.mark.positive
+    def test_retry_after_is_honoured_and_capped(self):
+        """Retry-After replaces the backoff but never exceeds max_backoff."""
+        policy = RetryPolicy(backoff_factor=0.5, max_backoff=10, jitter=False)
+        
+        assert policy.get_delay(1, _Response(503, {"Retry-After": "7"})) == 7
+        assert policy.get_delay(1, _Response(503, {"Retry-After": "120"})) == 10
+        assert RetryPolicy(jitter=False, respect_retry_after=False).get_delay(
+            1, _Response(503, {"Retry-After": "7"})
+        ) == 0.5
+
+
+class TestRetryBudget:
+    """Tests for RetryBudget."""
+    
+    @pytest.mark.boundary
+    def test_initial_tokens_then_exhausted(self):
+        """min_tokens retries are allowed before any traffic, then none."""
+        budget = RetryBudget(ratio=0.5, min_tokens=2)
+        
+        assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+    
+    @pytest.mark.positive
+    def test_requests_deposit_tokens(self):
+        """Each request adds `ratio` tokens, so two requests earn one retry."""
+        budget = RetryBudget(ratio=0.5, min_tokens=0)
+        
+        budget.record_request()
+        assert not budget.try_acquire()
+        budget.record_request()
+        assert budget.try_acquire()
+    
+    @pytest.mark.boundary
+    def test_balance_is_capped(self):
+        """Tokens never exceed max_tokens."""
+        budget = RetryBudget(ratio=1, min_tokens=0, max_tokens=2)
+        for _ in range(10):
+            budget.record_request()
+        
+        assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after."""
+    
+    @pytest.mark.positive
+    def test_delta_seconds(self):
+        """Integer values are seconds."""
+        assert parse_retry_after(" 30 ") == 30.0
+    
+    @pytest.mark.positive
+    def test_http_date(self):
+        """HTTP dates are converted to the remaining delay."""
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+        
+        assert 55 <= parse_retry_after(format_datetime(retry_at, usegmt=True)) <= 60
+    
+    @pytest.mark.boundary
+    def test_past_date_is_zero(self):
+        """Dates in the past mean no delay."""
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    
+    @pytest.mark.negative
+    @pytest.mark.parametrize("value", [None, "", "soon", "-5", "1.5"])
+    def test_missing_or_invalid(self, value):
+        """Absent and unparseable values yield None."""
+        assert parse_retry_after(value) is None
@@ -0,0 +1,397 @@
+"""Tests for SwaggerSchemaValidator (offline, no API calls)."""
+import json
+import logging
+import pickle
+from pathlib import Path
+
+import pytest
+
+from src.api_client import APIClient
+from src.http import RequestBodyValidator, RequestValidationError, ResponseValidator, ValidationReport
+from src.models import Order, Pet, User
+from src.schema_codegen import CompiledValidator, generate_source
+from src.schema_validator import SPEC_CACHE_VERSION, SwaggerSchemaValidator
+
+logger = logging.getLogger(__name__)
+
+
+class _Response:
+    """Minimal response carrying a parsed body, for offline validation tests."""
+    
+    def __init__(self, data, status_code: int = 200):
+        self._data = data
+        self.content = json.dumps(data).encode("utf-8")
+        self.status_code = status_code
+    
+    def json(self):
+        return self._data
+
+
+@pytest.mark.schema
+class TestValidatorCache:
+    """Tests for the compiled-validator cache."""
+    
+    @pytest.mark.positive
+    def test_validator_is_compiled_once_per_operation(self, schema_validator):
+        """Repeated lookups of the same operation hit the cache."""
+        schema_validator.invalidate_cache()
+        before = schema_validator.cache_stats
+        
+        first = schema_validator.get_response_validator("/pet/{petId}", "GET", 200)
+        second = schema_validator.get_response_validator("/pet/{petId}", "get", "200")
+        
+        stats = schema_validator.cache_stats
+        assert first is second
+        assert stats["misses"] == before["misses"] + 1
+        assert stats["hits"] == before["hits"] + 1
+    
+    @pytest.mark.positive
+    def test_cached_validator_validates_response(self, schema_validator):
+        """Cached validators give the same result as validate()."""
+        pet_data = Pet.create().model_dump(by_alias=True, exclude_none=True)
+        
+        is_valid, error = schema_validator.validate_response(pet_data, "/pet/{petId}", "get", 200)
+        assert is_valid, f"Schema validation failed: {error}"
+        
+        is_valid, error = schema_validator.validate_response(
+            Pet.create_invalid_missing_name(), "/pet/{petId}", "get", 200
+        )
+        assert not is_valid
+        assert "name" in error
+    
+    @pytest.mark.positive
+    def test_invalidate_cache_by_path(self, schema_validator):
+        """Invalidation removes only matching entries."""
+        schema_validator.invalidate_cache()
+        schema_validator.get_response_validator("/pet/{petId}", "get", 200)
+        schema_validator.get_response_validator("/store/inventory", "get", 200)
+        
+        removed = schema_validator.invalidate_cache(path="/pet/{petId}")
+        
+        assert removed == 1
+        assert schema_validator.cache_stats["size"] == 1
+    
+    @pytest.mark.boundary
+    def test_operation_without_schema_is_cached_as_none(self, schema_validator):
+        """Operations without a response schema are cached too."""
+        schema_validator.invalidate_cache()
+        
+        assert schema_validator.get_response_validator("/pet/{petId}", "delete", 400) is None
+        assert schema_validator.get_response_validator("/pet/{petId}", "delete", 400) is None
+        assert schema_validator.cache_stats["size"] == 1
+
+
+@pytest.mark.schema
+class TestSchemaIndex:
+    """Tests for the resolved-schema index built at spec load."""
+    
+    @pytest.mark.positive
+    def test_index_matches_on_demand_resolution(self, schema_validator):
+        """Indexed schemas equal the ones resolved without the index."""
+        from src.schema_validator import SwaggerSchemaValidator
+        
+        unindexed = SwaggerSchemaValidator(schema_validator.swagger_path, build_index=False)
+        
+        for name in schema_validator.definitions:
+            assert schema_validator.get_definition_schema(name) == unindexed.get_definition_schema(name)
+        assert schema_validator.get_response_schema("/pet/findByStatus", "get", 200) == \
+            unindexed.get_response_schema("/pet/findByStatus", "get", 200)
+        assert schema_validator.get_request_schema("/store/order", "post") == \
+            unindexed.get_request_schema("/store/order", "post")
+    
+    @pytest.mark.positive
+    def test_indexed_schemas_are_shared(self, schema_validator):
+        """Getters return the same object instead of a fresh copy."""
+        assert schema_validator.get_definition_schema("Pet") is schema_validator.get_definition_schema("Pet")
+    
+    @pytest.mark.negative
+    def test_indexed_schemas_are_read_only(self, schema_validator):
+        """Shared schemas cannot be modified in place."""
+        schema = schema_validator.get_definition_schema("Pet")
+        
+        with pytest.raises(TypeError):
+            schema["required"] = []
+        with pytest.raises(TypeError):
+            schema["required"].append("id")
+
+
+@pytest.mark.schema
+class TestRequestBodyValidation:
+    """Tests for validating request bodies before they are sent."""
+    
+    @pytest.mark.positive
+    def test_request_validator_is_cached(self, schema_validator):
+        """Request body validators are compiled once per operation."""
+        first = schema_validator.get_request_validator("/pet", "POST")
+        
+        assert first is not None
+        assert schema_validator.get_request_validator("/pet", "post") is first
+        assert schema_validator.get_request_validator("/pet/{petId}", "get") is None
+    
+    @pytest.mark.negative
+    def test_invalid_body_raises(self, schema_validator):
+        """An invalid body raises with the operation and schema error."""
+        checker = RequestBodyValidator(schema_validator)
+        
+        checker.check(Pet.create().to_payload(), "/pet", "post")
+        with pytest.raises(RequestValidationError, match="POST /pet: .*name"):
+            checker.check(Pet.create_invalid_missing_name(), "/pet", "post")
+    
+    @pytest.mark.boundary
+    def test_sampled_mode_checks_one_in_n(self, schema_validator):
+        """With sample_rate N only every Nth body is validated."""
+        checker = RequestBodyValidator(schema_validator, sample_rate=4)
+        failures = 0
+        
+        for _ in range(12):
+            try:
+                checker.check(Pet.create_invalid_missing_name(), "/pet", "post")
+            except RequestValidationError:
+                failures += 1
+        
+        assert failures == 3
+    
+    @pytest.mark.negative
+    def test_client_rejects_invalid_body_before_sending(self, settings):
+        """The client raises locally instead of sending a malformed body."""
+        with APIClient(base_url=settings.base_url, validate_requests=True, request_sample_rate=1) as client:
+            with pytest.raises(RequestValidationError):
+                client.pet.create(Pet.create_invalid_missing_photo_urls())
+            
+            assert client.retry_stats["requests"] == 0
+
+
+@pytest.mark.schema
+class TestResponseValidationModes:
+    """Tests for full, sampled, first-n and async response validation."""
+    
+    @pytest.mark.positive
+    def test_full_mode_records_violations(self, schema_validator):
+        """Every response is validated and violations are recorded."""
+        report = ValidationReport()
+        validator = ResponseValidator(schema_validator, mode="full", report=report)
+        
+        validator.validate(_Response(Pet.create().to_payload()), "/pet/{petId}", "get")
+        validator.validate(_Response(Pet.create_invalid_missing_name()), "/pet/{petId}", "get")
+        
+        summary = report.to_dict()
+        assert summary["validated"] == 2
+        assert len(summary["violations"]) == 1
+        assert summary["violations"][0]["path"] == "/pet/{petId}"
+        assert "name" in summary["violations"][0]["error"]
+    
+    @pytest.mark.boundary
+    def test_sampled_mode_validates_one_in_n(self, schema_validator):
+        """Sampled mode validates 1 in sample_rate responses."""
+        report = ValidationReport()
+        validator = ResponseValidator(schema_validator, mode="sampled", sample_rate=5, report=report)
+        
+        for _ in range(20):
+            validator.validate(_Response(Pet.create().to_payload()), "/pet/{petId}", "get")
+        
+        assert report.to_dict()["validated"] == 4
+        assert report.to_dict()["skipped"] == 16
+    
+    @pytest.mark.boundary
+    def test_first_n_mode_validates_leading_items_only(self, schema_validator):
+        """Items beyond max_items are not validated."""
+        report = ValidationReport()
+        validator = ResponseValidator(schema_validator, mode="first-n", max_items=3, report=report)
+        pets = [Pet.create().to_payload() for _ in range(3)] + [Pet.create_invalid_missing_name()]
+        
+        validator.validate(_Response(pets), "/pet/findByStatus", "get")
+        validator.validate(_Response(pets[::-1]), "/pet/findByStatus", "get")
+        
+        assert len(report.to_dict()["violations"]) == 1
+    
+    @pytest.mark.positive
+    def test_async_mode_reports_after_drain(self, schema_validator):
+        """Async validations complete on the worker pool and are reported by drain()."""
+        report = ValidationReport()
+        validator = ResponseValidator(schema_validator, mode="async", report=report)
+        
+        for _ in range(10):
+            validator.validate(_Response(Pet.create_invalid_missing_name()), "/pet/{petId}", "get")
+        
+        summary = report.drain(timeout=30)
+        assert summary["validated"] == 10
+        assert len(summary["violations"]) == 10
+    
+    @pytest.mark.negative
+    def test_async_mode_counts_validation_errors(self):
+        """Validations that raise on the worker pool are counted as errors, not lost."""
+        class _BrokenValidator:
+            def check_response(self, *args, **kwargs):
+                raise RuntimeError("validator crashed")
+        
+        report = ValidationReport()
+        validator = ResponseValidator(_BrokenValidator(), mode="async", report=report)
+        
+        for _ in range(5):
+            validator.validate(_Response(Pet.create().to_payload()), "/pet/{petId}", "get")
+        
+        summary = report.drain(timeout=30)
+        assert summary["errors"] == 5
+        assert summary["validated"] == 0
+    
+    @pytest.mark.positive
+    def test_async_mode_does_not_touch_callers_body(self, schema_validator):
+        """Async validation decodes response.content instead of sharing the memoized json() object."""
+        class _GuardedResponse(_Response):
+            def json(self):
+                raise AssertionError("async validation must not call json()")
+        
+        report = ValidationReport()
+        validator = ResponseValidator(schema_validator, mode="async", report=report)
+        
+        validator.validate(_GuardedResponse(Pet.create_invalid_missing_name()), "/pet/{petId}", "get")
+        
+        summary = report.drain(timeout=30)
+        assert summary["validated"] == 1
+        assert summary["errors"] == 0
+        assert len(summary["violations"]) == 1
+    
+    @pytest.mark.negative
+    def test_unknown_mode_raises(self, schema_validator):
+        """Unknown modes are rejected."""
+        with pytest.raises(ValueError):
+            ResponseValidator(schema_validator, mode="partial")
+
+
+@pytest.mark.schema
+class TestGeneratedValidators:
+    """Tests for validators generated from the swagger definitions."""
+    
+    INVALID_PAYLOADS = [
+        ("Pet", {"photoUrls": "x", "tags": [{"id": "1"}, {"id": True, "name": 2}], "status": "gone"}),
+        ("Pet", {"name": None, "category": [], "photoUrls": [1, "a", None]}),
+        ("Pet", []),
+        ("Order", {"id": 1.5, "quantity": "2", "status": "lost", "complete": 1}),
+        ("User", {"username": 5, "userStatus": False}),
+        ("ApiResponse", "error"),
+    ]
+    
+    @pytest.mark.positive
+    @pytest.mark.parametrize("name", ["Pet", "Order", "User", "Category", "Tag", "ApiResponse"])
+    def test_definitions_use_generated_validators(self, schema_validator, name):
+        """Every definition in swagger.json gets a generated validator."""
+        assert isinstance(schema_validator.get_definition_validator(name), CompiledValidator)
+    
+    @pytest.mark.positive
+    @pytest.mark.parametrize("name, data", INVALID_PAYLOADS)
+    def test_errors_match_jsonschema(self, schema_validator, name, data):
+        """Generated validators report the same errors, in the same order, as Draft4Validator."""
+        from jsonschema import Draft4Validator
+        
+        schema = schema_validator.get_definition_schema(name)
+        generated = schema_validator._validate_with(schema_validator.get_definition_validator(name), data)
+        interpreted = schema_validator._validate_with(Draft4Validator(schema), data)
+        
+        assert generated == interpreted
+        assert not generated[0]
+    
+    @pytest.mark.positive
+    @pytest.mark.parametrize("model", [Pet, Order, User])
+    def test_valid_payloads_pass(self, schema_validator, model):
+        """Factory payloads are valid for the generated validators."""
+        assert schema_validator.validate_definition(model.create().to_payload(), model.__name__) == (True, None)
+    
+    @pytest.mark.positive
+    def test_inventory_map_values_are_checked(self, schema_validator):
+        """additionalProperties schemas are validated per value."""
+        is_valid, error = schema_validator.validate_response(
+            {"available": 3, "sold": "many"}, "/store/inventory", "get", 200
+        )
+        
+        assert not is_valid
+        assert error == "sold: 'many' is not of type 'integer'"
+    
+    @pytest.mark.boundary
+    def test_unsupported_keywords_are_left_to_jsonschema(self):
+        """Schemas with keywords the generator does not know get no generated function."""
+        source = generate_source([{"type": "string", "pattern": "^a"}, {"type": "string"}], "hash")
+        namespace: dict = {}
+        exec(compile(source, "<test>", "exec"), namespace)
+        
+        assert len(namespace["VALIDATORS"]) == 1
+
+
+@pytest.mark.schema
+class TestFailFastValidation:
+    """Tests for fail-fast validation, the is_valid fast path and lazy error details."""
+    
+    INVALID_PET = {"photoUrls": "x", "status": "gone"}
+    
+    @pytest.mark.negative
+    def test_fail_fast_reports_first_error_only(self, schema_validator):
+        """fail_fast keeps only the first of several violations."""
+        full = schema_validator.validate_definition(self.INVALID_PET, "Pet")
+        first = schema_validator.validate_definition(self.INVALID_PET, "Pet", fail_fast=True)
+        
+        assert first == (False, "'name' is a required property")
+        assert full[1].startswith(f"{first[1]}; ")
+    
+    @pytest.mark.positive
+    @pytest.mark.parametrize("model", [Pet, Order, User])
+    def test_is_valid_matches_validate(self, schema_validator, model):
+        """The boolean fast path agrees with validate_definition."""
+        payload = model.create().to_payload()
+        
+        assert schema_validator.is_valid_definition(payload, model.__name__)
+        assert not schema_validator.is_valid_definition([payload], model.__name__)
+        assert schema_validator.is_valid_response(payload, "/pet/{petId}", "get") == \
+            schema_validator.validate_response(payload, "/pet/{petId}", "get")[0]
+    
+    @pytest.mark.boundary
+    def test_operation_without_schema_is_valid(self, schema_validator):
+        """Operations without a schema pass the fast paths."""
+        assert schema_validator.is_valid_response("anything", "/pet/{petId}", "delete", 400)
+        assert schema_validator.check_request("anything", "/pet/findByStatus", "get") is None
+    
+    @pytest.mark.positive
+    def test_error_details_are_formatted_lazily(self, schema_validator):
+        """Errors after the first are only produced when the details are read."""
+        produced = []
+        
+        def validate(data):
+            for n in range(3):
+                produced.append(n)
+                yield (n,), f"error {n}"
+        
+        errors = schema_validator._check_with(CompiledValidator({}, validate), None, fail_fast=False)
+        
+        assert produced == [0]
+        assert errors.first.message == "error 0"
+        assert str(errors) == "0: error 0; 1: error 1; 2: error 2"
+        assert produced == [0, 1, 2]
+        assert str(errors) == "0: error 0; 1: error 1; 2: error 2"
+    
+    @pytest.mark.negative
+    def test_response_validator_fail_fast(self, schema_validator):
+        """ResponseValidator records only the first violation in fail-fast mode."""
+        report = ValidationReport()
+        validator = ResponseValidator(schema_validator, mode="full", report=report, fail_fast=True)
+        
+        validator.validate(_Response(self.INVALID_PET), "/pet/{petId}", "get")
+        
+        assert report.to_dict()["violations"][0]["error"] == "'name' is a required property"
+
+
+@pytest.mark.schema
+class TestSpecCache:
+    """Tests for the on-disk spec cache."""
+    
+    SWAGGER_PATH = Path(__file__).parent.parent / "schemas" / "swagger.json"
+    
+    @pytest.mark.negative
+    @pytest.mark.parametrize("content", [["not", "a", "dict"], {"version": SPEC_CACHE_VERSION}, b"garbage"])
+    def test_foreign_cache_is_rebuilt(self, tmp_path, content):
+        """A cache that is not a current cache entry is thrown away and rewritten."""
+        cache_path = tmp_path / "swagger.json.cache"
+        cache_path.write_bytes(content if isinstance(content, bytes) else pickle.dumps(content))
+        
+        validator = SwaggerSchemaValidator(self.SWAGGER_PATH, cache_path=cache_path, use_codegen=False)
+        
+        assert validator.validate_definition(Pet.create().to_payload(), "Pet") == (True, None)
+        with open(cache_path, "rb") as f:
+            assert pickle.load(f)["version"] == SPEC_CACHE_VERSION
@@ -0,0 +1,115 @@
+"""Tests for batch operations of the service classes (offline, no API calls)."""
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+from src.services import BaseService, BatchResult
+
+
+class _Response:
+    """Minimal response with a status code."""
+    
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+
+
+class _SyncClient:
+    """Client stub recording thread-safety switches."""
+    
+    pool_maxsize = 8
+    
+    def __init__(self):
+        self.thread_safe = False
+    
+    def request(self, *args, **kwargs):
+        raise NotImplementedError
+    
+    def enable_thread_safety(self) -> None:
+        self.thread_safe = True
+
+
+class _AsyncClient:
+    """Async client stub."""
+    
+    pool_maxsize = 8
+    
+    async def request(self, *args, **kwargs):
+        raise NotImplementedError
+
+
+class TestRunBatch:
+    """Tests for BaseService._run_batch ordering and error capture."""
+    
+    @pytest.mark.positive
+    def test_results_keep_input_order(self):
+        """Results come back in input order even when items finish out of order."""
+        rng = random.Random(5)
+        delays = {i: rng.random() / 100 for i in range(40)}
+        
+        def call(item: int) -> _Response:
+            time.sleep(delays[item])
+            return _Response(200)
+        
+        results = BaseService(_SyncClient())._run_batch(call, range(40))
+        
+        assert [r.item for r in results] == list(range(40))
+        assert all(r.ok for r in results)
+    
+    @pytest.mark.negative
+    def test_errors_are_captured_per_item(self):
+        """An exception fails only its own item; non-2xx responses are not ok."""
+        def call(item: int) -> _Response:
+            if item % 3 == 0:
+                raise ConnectionError(f"item {item}")
+            return _Response(404 if item % 3 == 1 else 200)
+        
+        results = BaseService(_SyncClient())._run_batch(call, range(9))
+        
+        for result in results:
+            if result.item % 3 == 0:
+                assert isinstance(result.error, ConnectionError)
+                assert result.response is None
+            else:
+                assert result.error is None
+                assert result.response.status_code == (404 if result.item % 3 == 1 else 200)
+            assert result.ok == (result.item % 3 == 2)
+    
+    @pytest.mark.positive
+    def test_sync_batch_switches_client_to_per_thread_sessions(self):
+        """The client is made thread-safe before requests fan out over the pool."""
+        client = _SyncClient()
+        seen: list[bool] = []
+        lock = threading.Lock()
+        
+        def call(item: int) -> _Response:
+            with lock:
+                seen.append(client.thread_safe)
+            return _Response(200)
+        
+        BaseService(client)._run_batch(call, range(10), max_workers=4)
+        
+        assert seen == [True] * 10
+    
+    @pytest.mark.boundary
+    def test_empty_batch(self):
+        """An empty batch returns no results."""
+        assert BaseService(_SyncClient())._run_batch(lambda item: _Response(200), []) == []
+    
+    @pytest.mark.positive
+    def test_async_batch_order_and_errors(self):
+        """Async batches keep input order and capture exceptions per item."""
+        async def call(item: int) -> _Response:
+            await asyncio.sleep((10 - item) / 1000)
+            if item == 3:
+                raise ValueError("bad item")
+            return _Response(201)
+        
+        results = asyncio.run(BaseService(_AsyncClient())._run_batch(call, range(10), max_workers=3))
+        
+        assert [r.item for r in results] == list(range(10))
+        assert isinstance(results[3].error, ValueError)
+        assert [r.ok for r in results] == [i != 3 for i in range(10)]
+        assert all(isinstance(r, BatchResult) for r in results)
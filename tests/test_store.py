@@ -139,9 +139,9 @@ class TestGetOrder:
     """Tests for GET /store/order/{orderId} endpoint."""
     
     @pytest.mark.positive
-    def test_get_existing_order(self, api_client, created_order, schema_validator):
+    def test_get_existing_order(self, api_client, shared_order, schema_validator):
         """Get an existing order by ID and validate response schema."""
-        order_id = created_order["id"]
+        order_id = shared_order["id"]
         logger.info(f"Getting order with ID: {order_id}")
         
         response = api_client.get_order_by_id(order_id)
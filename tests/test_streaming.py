@@ -0,0 +1,41 @@
+"""Tests for incremental JSON array parsing (offline, no API calls)."""
+import json
+import pytest
+
+from src.http import iter_json_array
+from src.models import Pet
+
+
+def _chunks(raw: bytes, size: int) -> list[bytes]:
+    return [raw[i:i + size] for i in range(0, len(raw), size)]
+
+
+@pytest.mark.pet
+class TestIterJsonArray:
+    """Tests for iter_json_array used by PetService.iter_by_status."""
+    
+    @pytest.mark.positive
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_yields_all_items_for_any_chunking(self, chunk_size):
+        """Items are decoded correctly regardless of chunk boundaries."""
+        pets = [Pet.create(name=f"pet_é_{i}").model_dump(mode="json", exclude_none=True) for i in range(50)]
+        raw = json.dumps(pets).encode("utf-8")
+        
+        assert list(iter_json_array(_chunks(raw, chunk_size))) == pets
+    
+    @pytest.mark.boundary
+    def test_empty_array(self):
+        """An empty array yields nothing."""
+        assert list(iter_json_array([b" [ ", b"] "])) == []
+    
+    @pytest.mark.boundary
+    def test_number_split_across_chunks(self):
+        """Scalars ending at a chunk edge are not cut short."""
+        assert list(iter_json_array([b"[12", b"345, 6]"])) == [12345, 6]
+    
+    @pytest.mark.negative
+    @pytest.mark.parametrize("raw", [b'{"id": 1}', b"[1, 2", b'[{"id": }]'])
+    def test_malformed_body_raises(self, raw):
+        """Non-array or truncated bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            list(iter_json_array([raw]))
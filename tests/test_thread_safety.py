@@ -0,0 +1,85 @@
+"""Stress tests for sharing one client and validator between threads."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.api_client import APIClient
+from src.models import Pet
+
+THREADS = 64
+
+
+@pytest.mark.schema
+class TestValidatorThreadSafety:
+    """Tests for concurrent use of the shared SwaggerSchemaValidator (offline)."""
+    
+    @pytest.mark.positive
+    def test_concurrent_validation_with_invalidation(self, schema_validator):
+        """Validations stay correct while other threads recompile and drop cached validators."""
+        valid = Pet.create().to_payload()
+        invalid = Pet.create_invalid_missing_name()
+        barrier = threading.Barrier(THREADS)
+        
+        def hammer(i: int) -> list[bool]:
+            barrier.wait()
+            results = []
+            for n in range(200):
+                if i % 8 == 0 and n % 20 == 0:
+                    schema_validator.invalidate_cache()
+                results.append(schema_validator.validate_response(valid, "/pet/{petId}", "get", 200)[0])
+                results.append(not schema_validator.validate_response(invalid, "/pet/{petId}", "get", 200)[0])
+                results.append(schema_validator.validate_definition(valid, "Pet")[0])
+            return results
+        
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            results = [r for rs in executor.map(hammer, range(THREADS)) for r in rs]
+        
+        assert all(results)
+        assert schema_validator.get_response_validator("/pet/{petId}", "get", 200) is \
+            schema_validator.get_response_validator("/pet/{petId}", "get", 200)
+
+
+@pytest.mark.store
+class TestAPIClientThreadSafety:
+    """Tests for one thread-safe APIClient shared by many threads."""
+    
+    @pytest.mark.positive
+    def test_shared_client_across_threads(self, settings):
+        """64 threads share one client; every request succeeds on its own thread's session."""
+        requests_per_thread = 5
+        barrier = threading.Barrier(THREADS)
+        
+        with APIClient(
+            base_url=settings.base_url,
+            api_key=settings.api_key,
+            timeout=settings.timeout,
+            thread_safe=True,
+            pool_maxsize=THREADS
+        ) as client:
+            def hammer(_: int) -> list[int]:
+                barrier.wait()
+                statuses = []
+                for n in range(requests_per_thread):
+                    if n % 2:
+                        statuses.append(client.store.get_inventory().status_code)
+                    else:
+                        statuses.append(client.pet.find_by_status("available").status_code)
+                return statuses
+            
+            with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                statuses = [s for ss in executor.map(hammer, range(THREADS)) for s in ss]
+            
+            assert statuses == [200] * THREADS * requests_per_thread
+            assert len(client._sessions) == THREADS
+            assert client.retry_stats["requests"] == THREADS * requests_per_thread
+    
+    @pytest.mark.positive
+    def test_batch_operations_use_per_thread_sessions(self, settings):
+        """Batch calls on a default (not thread-safe) client never share its session between threads."""
+        with APIClient(base_url=settings.base_url, api_key=settings.api_key, thread_safe=False) as client:
+            results = client.pet.get_many([1, 2, 3, 4], max_workers=4)
+            
+            assert client.thread_safe
+            assert all(r.error is None for r in results)
+            assert len(client._sessions) > 1
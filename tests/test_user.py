@@ -12,11 +12,12 @@ class TestCreateUser:
     """Tests for POST /user endpoint."""
     
     @pytest.mark.positive
-    def test_create_user_with_all_fields(self, api_client, user_data, schema_validator):
+    def test_create_user_with_all_fields(self, api_client, user_data, schema_validator, cleanup):
         """Create a new user with all fields."""
         logger.info(f"Creating user: {user_data['username']}")
         
         response = api_client.create_user(user_data)
+        cleanup.user(user_data["username"])
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         
@@ -34,12 +35,9 @@ class TestCreateUser:
         # Validate content matches
         assert response_data["username"] == user_data["username"]
         assert response_data["email"] == user_data["email"]
-        
-        # Cleanup
-        api_client.delete_user(user_data["username"])
     
     @pytest.mark.positive
-    def test_create_user_with_minimal_fields(self, api_client):
+    def test_create_user_with_minimal_fields(self, api_client, cleanup):
         """Create a new user with minimal fields."""
         user = User.create_minimal()
         user_data = user.model_dump(by_alias=True, exclude_none=True)
@@ -47,11 +45,9 @@ class TestCreateUser:
         logger.info(f"Creating user with minimal data: {user_data['username']}")
         
         response = api_client.create_user(user_data)
+        cleanup.user(user_data["username"])
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
-        
-        # Cleanup
-        api_client.delete_user(user_data["username"])
 
 
 @pytest.mark.user
@@ -59,11 +55,13 @@ class TestCreateUsersWithArray:
     """Tests for POST /user/createWithArray endpoint."""
     
     @pytest.mark.positive
-    def test_create_users_with_array(self, api_client, users_list_data):
+    def test_create_users_with_array(self, api_client, users_list_data, cleanup):
         """Create multiple users with array input."""
         logger.info(f"Creating {len(users_list_data)} users with array")
         
         response = api_client.create_users_with_array(users_list_data)
+        for user_data in users_list_data:
+            cleanup.user(user_data["username"])
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         
@@ -72,9 +70,6 @@ class TestCreateUsersWithArray:
             get_response = api_client.get_user_by_username(user_data["username"])
             assert get_response.status_code == 200, \
                 f"User {user_data['username']} should exist after batch creation"
-            
-            # Cleanup
-            api_client.delete_user(user_data["username"])
     
     @pytest.mark.boundary
     def test_create_users_empty_array(self, api_client):
@@ -92,11 +87,13 @@ class TestCreateUsersWithList:
     """Tests for POST /user/createWithList endpoint."""
     
     @pytest.mark.positive
-    def test_create_users_with_list(self, api_client, users_list_data):
+    def test_create_users_with_list(self, api_client, users_list_data, cleanup):
         """Create multiple users with list input."""
         logger.info(f"Creating {len(users_list_data)} users with list")
         
         response = api_client.create_users_with_list(users_list_data)
+        for user_data in users_list_data:
+            cleanup.user(user_data["username"])
         
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
         
@@ -105,9 +102,6 @@ class TestCreateUsersWithList:
             get_response = api_client.get_user_by_username(user_data["username"])
             assert get_response.status_code == 200, \
                 f"User {user_data['username']} should exist after batch creation"
-            
-            # Cleanup
-            api_client.delete_user(user_data["username"])
 
 
 @pytest.mark.user
@@ -115,9 +109,9 @@ class TestGetUser:
     """Tests for GET /user/{username} endpoint."""
     
     @pytest.mark.positive
-    def test_get_existing_user(self, api_client, created_user, schema_validator):
+    def test_get_existing_user(self, api_client, shared_user, schema_validator):
         """Get an existing user by username and validate response schema."""
-        username = created_user["username"]
+        username = shared_user["username"]
         logger.info(f"Getting user: {username}")
         
         response = api_client.get_user_by_username(username)
@@ -257,10 +251,10 @@ class TestUserLogin:
     """Tests for GET /user/login endpoint."""
     
     @pytest.mark.positive
-    def test_login_user(self, api_client, created_user):
+    def test_login_user(self, api_client, shared_user):
         """Login with valid credentials."""
-        username = created_user["username"]
-        password = created_user["password"]
+        username = shared_user["username"]
+        password = shared_user["password"]
         
         logger.info(f"Logging in user: {username}")
         